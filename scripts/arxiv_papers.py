@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Searchable papers catalog from the arXiv links in research/papers.md and
+data/agents_list.csv.
+
+- Extracts every arXiv ID (abs/, pdf/ and html/ links, with or without a
+  version or .pdf suffix; new-style 2308.08155 and old-style cs.AI/0601001)
+  from research/papers.md -- with the section and link text it appears under --
+  and from the `paper_blog` column of data/agents_list.csv
+- Fetches titles, authors, dates, categories and abstracts from the arXiv API
+  in batched id_list queries (BATCH_SIZE IDs per request, DELAY seconds
+  apart as arXiv asks), parsing the Atom feed; a batch the API rejects is
+  split in half until the bad ID is isolated
+- Metadata is cached in data/arxiv_metadata.json (committed, like
+  star_history.json): later runs only query IDs that are new, were fetched
+  more than REFRESH_DAYS ago, or were not found more than MISSING_RETRY_DAYS
+  ago, so a weekly run is usually one request or none
+- Builds compare/papers.json offline from the cache: one entry per paper with
+  its metadata, where it is cited, and the frameworks it is linked to (the
+  framework's own repo lists the paper in agents_list.csv, or the framework
+  is named in the paper's title, abstract or papers.md line), plus the
+  reverse framework -> papers map
+- generate_catalog_json.py writes papers.json with the catalog and adds the
+  papers to compare/search_index.json (document type "paper"), so the UI and
+  `search_index.py --type paper` search them without network calls
+
+ARXIV_API_URL overrides the API endpoint (e.g. scripts/stub_api_server.py).
+
+Usage:
+  python scripts/arxiv_papers.py                       # fetch what the cache lacks, write compare/papers.json
+  python scripts/arxiv_papers.py --offline             # rebuild papers.json from the cache only
+  python scripts/arxiv_papers.py --refresh --delay 0   # refetch everything
+  python scripts/arxiv_papers.py --search "multi agent survey"
+"""
+import argparse
+import json
+import os
+import re
+import time
+from datetime import date, datetime
+
+ARXIV_API = os.environ.get("ARXIV_API_URL", "http://export.arxiv.org/api/query")
+PAPERS_MD = os.path.join("research", "papers.md")
+CACHE_PATH = os.path.join("data", "arxiv_metadata.json")
+PAPERS_OUT = os.path.join("compare", "papers.json")
+
+BATCH_SIZE = 100
+DELAY = 3.0
+REFRESH_DAYS = 30
+MISSING_RETRY_DAYS = 7
+
+ARXIV_RE = re.compile(r"arxiv\.org/(?:abs|pdf|html)/(\d{4}\.\d{4,5}|[a-z\-]+(?:\.[a-z]{2})?/\d{7})(v\d+)?",
+                      re.IGNORECASE)
+ENTRY_ID_RE = re.compile(r"arxiv\.org/abs/(.+?)(v\d+)?$")
+MD_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
+BOLD_RE = re.compile(r"\*\*([^*]+)\*\*")
+# Link texts that say nothing about the paper
+GENERIC_LABELS = {"arxiv", "paper", "pdf", "link", "abs", "html"}
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+ARXIV_NS = "{http://arxiv.org/schemas/atom}"
+
+
+def arxiv_id(url: str):
+    """Versionless arXiv ID of a link, or None"""
+    m = ARXIV_RE.search(url or "")
+    return m.group(1) if m else None
+
+
+def _label(line: str, url_start: int):
+    """Best human label for the link at url_start: its link text, else the line's bold text"""
+    for m in MD_LINK_RE.finditer(line):
+        if m.start(2) <= url_start < m.end(2):
+            text = m.group(1).strip()
+            if text.lower() not in GENERIC_LABELS:
+                return text
+    bold = BOLD_RE.search(line)
+    return bold.group(1).strip() if bold else ""
+
+
+def markdown_mentions(path: str = PAPERS_MD) -> list:
+    """[{id, ref, section, label, text}] for every arXiv link in a Markdown file"""
+    from search_index import LINK_URL_RE, markdown_sections
+
+    if not os.path.exists(path):
+        return []
+    rel = path.replace(os.sep, "/")
+    out = []
+    for heading, anchor, body in markdown_sections(path):
+        for line in body.splitlines():
+            for m in ARXIV_RE.finditer(line):
+                out.append({"id": m.group(1), "ref": f"{rel}#{anchor}", "section": heading,
+                            "label": _label(line, m.start()), "text": LINK_URL_RE.sub(" ", line)})
+    return out
+
+
+def agent_mentions(data_dir: str = "data") -> list:
+    """[{id, agent, github}] for agents_list.csv rows whose paper_blog is an arXiv link"""
+    from data_loader import load_agents
+
+    out = []
+    for row in load_agents(data_dir):
+        pid = arxiv_id(row.paper_blog)
+        if pid:
+            out.append({"id": pid, "agent": row.name, "github": row.github})
+    return out
+
+
+def parse_feed(data: bytes) -> dict:
+    """{versionless id: metadata} for the entries of an arXiv Atom feed (error entries are skipped)"""
+    import xml.etree.ElementTree as ET
+
+    def text(node, tag):
+        child = node.find(tag)
+        return " ".join((child.text or "").split()) if child is not None else ""
+
+    papers = {}
+    for entry in ET.fromstring(data).iter(f"{ATOM}entry"):
+        m = ENTRY_ID_RE.search(text(entry, f"{ATOM}id"))
+        if not m:
+            continue
+        primary = entry.find(f"{ARXIV_NS}primary_category")
+        papers[m.group(1)] = {
+            "title": text(entry, f"{ATOM}title"),
+            "authors": [text(a, f"{ATOM}name") for a in entry.findall(f"{ATOM}author")],
+            "published": text(entry, f"{ATOM}published")[:10],
+            "updated": text(entry, f"{ATOM}updated")[:10],
+            "version": (m.group(2) or "v1")[1:],
+            "primary_category": primary.get("term", "") if primary is not None else "",
+            "categories": [c.get("term", "") for c in entry.findall(f"{ATOM}category")],
+            "abstract": text(entry, f"{ATOM}summary"),
+        }
+    return papers
+
+
+class MetadataCache:
+    """data/arxiv_metadata.json: fetched metadata plus the IDs arXiv did not know, with fetch dates"""
+
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+        self.papers, self.missing = {}, {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.papers = data.get("papers", {})
+            self.missing = data.get("missing", {})
+        self.requests_made = 0
+        self.errors = {}  # id -> why its batch failed, for this run
+
+    def stale(self, ids, refresh_days=REFRESH_DAYS, missing_days=MISSING_RETRY_DAYS, today=None) -> list:
+        """IDs to (re)query: unknown, fetched over refresh_days ago, or missing for over missing_days"""
+        today = today or date.today()
+
+        def age(day):
+            return (today - date.fromisoformat(day)).days
+
+        out = []
+        for pid in ids:
+            if pid in self.papers:
+                if refresh_days is not None and age(self.papers[pid]["fetched"]) > refresh_days:
+                    out.append(pid)
+            elif pid not in self.missing or age(self.missing[pid]) > missing_days:
+                out.append(pid)
+        return out
+
+    def _query(self, ids, http, timeout):
+        import requests
+
+        self.requests_made += 1
+        response = http.get(ARXIV_API, params={"id_list": ",".join(ids), "max_results": len(ids)}, timeout=timeout)
+        if response.status_code == 400:
+            return None
+        if response.status_code != 200:
+            # A 503 rate-limit reply must not read as "every ID missing"
+            raise requests.exceptions.HTTPError(f"HTTP {response.status_code} from {ARXIV_API}", response=response)
+        return parse_feed(response.content)
+
+    def fetch(self, ids, http=None, batch_size=BATCH_SIZE, delay=DELAY, timeout=30) -> dict:
+        """Query ids in batches and record the results; returns counts"""
+        import xml.etree.ElementTree as ET
+
+        import requests
+
+        http = http or requests
+        today = date.today().isoformat()
+        counts = {"fetched": 0, "missing": 0, "failed": 0}
+        queue = [list(ids[i:i + batch_size]) for i in range(0, len(ids), batch_size)]
+        first = True
+        while queue:
+            batch = queue.pop(0)
+            if not first and delay:
+                time.sleep(delay)
+            first = False
+            try:
+                found = self._query(batch, http, timeout)
+            except (requests.exceptions.RequestException, ET.ParseError) as e:
+                print(f"WARN: arXiv query for {len(batch)} IDs failed: {e}")
+                counts["failed"] += len(batch)
+                self.errors.update(dict.fromkeys(batch, str(e)))
+                continue
+            if found is None:
+                # Rejected batch (a malformed ID): split until the bad one is alone
+                if len(batch) > 1:
+                    queue[:0] = [batch[:len(batch) // 2], batch[len(batch) // 2:]]
+                    continue
+                found = {}
+            for pid in batch:
+                if pid in found:
+                    self.papers[pid] = {**found[pid], "fetched": today}
+                    self.missing.pop(pid, None)
+                    counts["fetched"] += 1
+                else:
+                    self.missing[pid] = today
+                    counts["missing"] += 1
+        return counts
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"format": 1, "papers": self.papers, "missing": self.missing}, f, indent=2, sort_keys=True,
+                      ensure_ascii=False)
+            f.write("\n")
+
+
+def build_papers(frameworks, cache: MetadataCache = None, papers_md: str = PAPERS_MD, data_dir: str = "data") -> dict:
+    """papers.json dict from the cited IDs and cached metadata (no network)"""
+    from repo_registry import normalize_repo
+    from search_index import _mentions, _name_matcher, tokenize
+
+    cache = cache or MetadataCache(os.path.join(data_dir, os.path.basename(CACHE_PATH)))
+    by_id = {}
+    for m in markdown_mentions(papers_md):
+        by_id.setdefault(m["id"], {"md": [], "agents": []})["md"].append(m)
+    for m in agent_mentions(data_dir):
+        by_id.setdefault(m["id"], {"md": [], "agents": []})["agents"].append(m)
+
+    by_first = _name_matcher(frameworks)
+    by_repo = {}
+    for i, fw in enumerate(frameworks):
+        by_repo.setdefault(normalize_repo(fw.get("github", "")), i)
+    by_repo.pop(None, None)
+
+    papers = []
+    for pid, cited in by_id.items():
+        meta = cache.papers.get(pid)
+        labels = [m["label"] for m in cited["md"] if m["label"]]
+        paper = {"id": pid, "url": f"https://arxiv.org/abs/{pid}", "resolved": meta is not None}
+        if meta:
+            paper.update({k: v for k, v in meta.items() if k != "fetched"})
+        else:
+            paper["title"] = labels[0] if labels else pid
+        # Frameworks: the repo that cites the paper, or a framework named in the paper or next to its link
+        linked = {by_repo[k] for k in (normalize_repo(a["github"]) for a in cited["agents"]) if k in by_repo}
+        text = " ".join([paper["title"], paper.get("abstract", "")] + [m["text"] for m in cited["md"]])
+        linked |= _mentions(tokenize(text), by_first)
+        seen = set()
+        paper["sources"] = [{"ref": m["ref"], "section": m["section"], "label": m["label"]} for m in cited["md"]
+                            if (m["ref"], m["label"]) not in seen and not seen.add((m["ref"], m["label"]))]
+        paper["agents"] = sorted({a["agent"] for a in cited["agents"]})
+        paper["frameworks"] = [frameworks[i].get("name", "") for i in sorted(linked)]
+        papers.append(paper)
+
+    papers.sort(key=lambda p: (p.get("published", ""), p["id"]), reverse=True)
+    by_framework = {}
+    for paper in papers:
+        for name in paper["frameworks"]:
+            by_framework.setdefault(name, []).append(paper["id"])
+    return {
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "count": len(papers),
+        "unresolved": sum(not p["resolved"] for p in papers),
+        "papers": papers,
+        "frameworks": by_framework,
+    }
+
+
+def write_papers(papers: dict, path: str = PAPERS_OUT):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(papers, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Fetch arXiv metadata for cited papers and write compare/papers.json")
+    ap.add_argument("--papers-md", default=PAPERS_MD)
+    ap.add_argument("--data-dir", default="data")
+    ap.add_argument("--out", default=PAPERS_OUT)
+    ap.add_argument("--offline", action="store_true", help="Use the metadata cache only")
+    ap.add_argument("--refresh", action="store_true", help="Refetch every cited paper")
+    ap.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="IDs per arXiv API request")
+    ap.add_argument("--delay", type=float, default=DELAY, help="Seconds between API requests")
+    ap.add_argument("--search", nargs="+", metavar="QUERY", help="Search compare/papers.json instead")
+    ap.add_argument("--limit", type=int, default=10)
+    args = ap.parse_args()
+
+    if args.search:
+        from search_index import SearchIndex, build_index
+        with open(args.out, encoding="utf-8") as f:
+            papers = json.load(f)["papers"]
+        index = SearchIndex(build_index({}, markdown_paths=[], papers=papers))
+        for score, doc in index.search(" ".join(args.search), args.limit):
+            extra = f"  [{', '.join(doc['frameworks'][:5])}]" if doc.get("frameworks") else ""
+            print(f"{score:7.2f}  {doc['title']}  ({doc['ref']}){extra}")
+        return
+
+    cache = MetadataCache(os.path.join(args.data_dir, os.path.basename(CACHE_PATH)))
+    if not args.offline:
+        ids = sorted({m["id"] for m in markdown_mentions(args.papers_md) + agent_mentions(args.data_dir)})
+        todo = ids if args.refresh else cache.stale(ids)
+        counts = cache.fetch(todo, batch_size=args.batch_size, delay=args.delay)
+        cache.save()
+        print(f"{len(ids)} cited arXiv IDs: queried {len(todo)} in {cache.requests_made} requests "
+              f"({counts['fetched']} fetched, {counts['missing']} not found, {counts['failed']} failed)")
+
+    from generate_catalog_json import load_frameworks
+    papers = build_papers(load_frameworks(args.data_dir), cache, args.papers_md, args.data_dir)
+    write_papers(papers, args.out)
+    print(f"Wrote {args.out} with {papers['count']} papers ({papers['unresolved']} without metadata), "
+          f"linked to {len(papers['frameworks'])} frameworks")
+
+
+if __name__ == "__main__":
+    main()
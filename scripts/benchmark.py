@@ -0,0 +1,727 @@
+#!/usr/bin/env python3
+"""
+Offline benchmarks for the maintenance scripts.
+
+- network: runs refresh_stars.py, refresh_csv.py, curate_whats_new.py,
+  qa_audit.py, qa_runner.py and arxiv_papers.py against the local GitHub/arXiv stub (scripts/stub_api_server.py)
+  on synthetic catalogs of several sizes, recording wall time, request counts
+  and retries (repeat requests for an already-requested URL) per run.
+- startup: measures scripts/recommend.py start-up (cold runs without a
+  snapshot vs snapshot-warm runs, both timed plain, plus a separate
+  -X importtime breakdown of a warm run) against streaming profiles through
+  --batch, on a temporary copy of compare/catalog.json (its snapshot is left
+  alone), optionally grown to --frameworks rows.
+- links: checks a mix of plain, HEAD-rejecting, PDF and dead links on the
+  stub with HEAD only, a full GET, and link_probe.py (HEAD, then a one-byte
+  ranged GET), reporting requests, body bytes served and wrong verdicts.
+- scoring: times FrameworkRecommendationEngine.recommend() with the compiled
+  data/scoring_rules.json against an equivalent hand-written scorer (the
+  scorer as it stood when the rules file replaced it, recency and trend terms
+  included), on synthetic catalogs, and checks both return identical results.
+- parallel: scores a batch of profiles with the serial engine and with
+  shared_scoring.py's process pool (1..N workers, catalog in shared memory,
+  frameworks or queries partitioned), reporting pool set-up, cold (workers
+  decode their rows) and warm batch times, and checks the merged top-k equals
+  the serial results.
+- ingest: parses synthetic awesome-list Markdown files (tables and bullet
+  lists with overlapping repos) with ingest_markdown.py in-process and with
+  the process pool, checking both stage the same rows.
+
+Usage:
+  python scripts/benchmark.py network --sizes 10 100 500 --latency 0.02
+  python scripts/benchmark.py network --scripts refresh_csv --error-rate 0.05 --json bench.json
+  python scripts/benchmark.py startup --runs 20 --profiles 1000
+  python scripts/benchmark.py startup --frameworks 5000
+  python scripts/benchmark.py links --sizes 100 1000
+  python scripts/benchmark.py scoring --sizes 1000 10000 --profiles 500
+  python scripts/benchmark.py ingest --sizes 100 2000 --entries 200
+  python scripts/benchmark.py parallel --sizes 100000 1000000 --workers 1 2 4 8
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+sys.path.insert(0, SCRIPTS_DIR)
+
+from stub_api_server import StubAPIServer, StubConfig  # noqa: E402
+
+NETWORK_SCRIPTS = {
+    "refresh_stars": ["refresh_stars.py"],
+    "refresh_csv": ["refresh_csv.py"],
+    "curate_whats_new": ["curate_whats_new.py"],
+    "qa_audit": ["qa_audit.py"],
+    "qa_runner": ["qa_runner.py"],
+    "arxiv_papers": ["arxiv_papers.py", "--delay", "0"],
+}
+
+FRAMEWORK_FIELDS = ["name", "github", "stars", "last_commit", "maturity", "language", "models",
+                    "category", "deployment", "license", "description", "tags"]
+AGENT_FIELDS = ["name", "github", "stars", "description", "paper_blog", "tags"]
+COMPUTER_USE_FIELDS = ["name", "github", "stars", "website", "modality", "scope", "sandboxing",
+                       "last_update", "notes"]
+
+MATURITIES = ["Production", "Beta", "Experimental"]
+CATEGORIES = ["Autonomous", "Multi-Agent", "Coding", "Tool-Using/RAG", "Computer Use", "Enterprise"]
+LANGUAGES = ["Python", "TypeScript", "Python/TypeScript", "C#", "Java"]
+DEPLOYMENTS = ["Local", "Cloud", "Cloud/Local", "Hybrid"]
+TAGS = ["Framework", "Multi-Agent", "Coding Agent", "RAG", "MCP", "Enterprise", "GUI", "Research",
+        "Production", "Lightweight", "Tool-Using Agent", "Collaboration"]
+
+
+def _write_csv(path, fieldnames, rows):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def synthetic_frameworks(size):
+    rows = []
+    for i in range(size):
+        rows.append({
+            "name": f"Bench Framework {i}",
+            "github": f"https://github.com/bench-org/repo-{i}",
+            "stars": str((i * 7919) % 150000),
+            "last_commit": f"2026-{1 + i % 12:02d}-{1 + i % 28:02d}",
+            "maturity": MATURITIES[i % len(MATURITIES)],
+            "language": LANGUAGES[i % len(LANGUAGES)],
+            "models": "GPT-4, Claude, Local LLMs",
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "deployment": DEPLOYMENTS[i % len(DEPLOYMENTS)],
+            "license": "MIT" if i % 3 else "Apache-2.0",
+            "description": f"Synthetic agent framework number {i} for {CATEGORIES[i % len(CATEGORIES)].lower()} workloads",
+            "tags": ", ".join(TAGS[(i + k) % len(TAGS)] for k in range(3)),
+        })
+    return rows
+
+
+def write_dataset(root, size, link_base):
+    """Write a synthetic data/ + research/ tree with `size` frameworks under root.
+
+    Returns the redirect map (old -> canonical owner/repo) the stub should serve.
+    """
+    frameworks = synthetic_frameworks(size)
+    _write_csv(os.path.join(root, "data", "frameworks.csv"), FRAMEWORK_FIELDS, frameworks)
+
+    # agents_list.csv overlaps frameworks.csv; every 7th row uses a renamed spelling
+    redirects = {}
+    agents = []
+    for i in range(0, size, 2):
+        repo = f"repo-{i}"
+        if i % 7 == 0:
+            repo = f"Repo-{i}-old"
+            redirects[f"bench-org/{repo}"] = f"bench-org/repo-{i}"
+        agents.append({
+            "name": f"Bench Framework {i}",
+            "github": f"https://github.com/bench-org/{repo}",
+            "stars": frameworks[i]["stars"],
+            "description": frameworks[i]["description"],
+            "paper_blog": f"https://arxiv.org/abs/2401.{i:05d}" if i % 4 == 0 else f"{link_base}/blog/{i}",
+            "tags": frameworks[i]["tags"],
+        })
+    _write_csv(os.path.join(root, "data", "agents_list.csv"), AGENT_FIELDS, agents)
+
+    computer_use = []
+    for i in range(0, size, 5):
+        computer_use.append({
+            "name": f"Bench Framework {i}",
+            "github": f"https://github.com/bench-org/repo-{i}",
+            "stars": frameworks[i]["stars"],
+            "website": f"{link_base}/site/{i}",
+            "modality": "Vision+DOM",
+            "scope": "Web",
+            "sandboxing": "Browser profile isolation",
+            "last_update": frameworks[i]["last_commit"],
+            "notes": "Synthetic computer-use entry",
+        })
+    _write_csv(os.path.join(root, "data", "computer_use.csv"), COMPUTER_USE_FIELDS, computer_use)
+
+    os.makedirs(os.path.join(root, "research"), exist_ok=True)
+    lines = ["# Research Papers", ""]
+    for i in range(max(size // 10, 1)):
+        lines.append(f"- **Bench Paper {i}** — [arXiv](https://arxiv.org/abs/2402.{i:05d})")
+    lines.append("")
+    for i in range(20):
+        lines.append(f"- [Resource {i}]({link_base}/page/{i})")
+    with open(os.path.join(root, "research", "papers.md"), "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return redirects
+
+
+def run_network(args):
+    config = StubConfig(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                        rate_limit=args.rate_limit, seed=args.seed)
+    server = StubAPIServer(config=config).start()
+    results = []
+    try:
+        for size in args.sizes:
+            for name in args.scripts:
+                with tempfile.TemporaryDirectory(prefix="bench-") as root:
+                    config.redirects = {k.lower(): v for k, v in write_dataset(root, size, server.url).items()}
+                    server.stats.reset()
+                    env = dict(os.environ,
+                               GITHUB_API_URL=server.url,
+                               ARXIV_API_URL=f"{server.url}/api/query",
+                               GITHUB_TOKEN="")
+                    cmd = [sys.executable, os.path.join(SCRIPTS_DIR, NETWORK_SCRIPTS[name][0])] + NETWORK_SCRIPTS[name][1:]
+                    start = time.perf_counter()
+                    proc = subprocess.run(cmd, cwd=root, env=env, capture_output=True, text=True,
+                                          timeout=args.timeout)
+                    wall = time.perf_counter() - start
+                    stats = server.stats.snapshot()
+                result = {"script": name, "size": size, "wall_s": round(wall, 3),
+                          "exit_code": proc.returncode, **stats}
+                if proc.returncode != 0 and args.verbose:
+                    print(proc.stderr[-2000:], file=sys.stderr)
+                results.append(result)
+                print(f"{name:18} size={size:<6} wall={wall:8.2f}s requests={stats['total']:<6} "
+                      f"retries={stats['retries']:<4} errors={stats['errors']:<4} "
+                      f"rate_limited={stats['rate_limited']:<4} exit={proc.returncode}")
+    finally:
+        server.stop()
+    return results
+
+
+def parse_importtime(stderr):
+    """Return {top-level module: cumulative microseconds} from -X importtime output"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name[1:2] != " ":  # nested imports are indented
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def _timed_run(cmd, stdin=None):
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=ROOT_DIR, input=stdin, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(cmd)} failed: {proc.stderr[-2000:]}")
+    return elapsed, proc
+
+
+def run_startup(args):
+    with tempfile.TemporaryDirectory(prefix="bench-startup-") as tmp:
+        # A private catalog copy: the cold run must not delete the real compare/catalog.json.snapshot
+        catalog = os.path.join(tmp, "catalog.json")
+        source = os.path.join(ROOT_DIR, "compare", "catalog.json")
+        if args.frameworks and os.path.exists(source):
+            with open(source, encoding="utf-8") as f:
+                doc = json.load(f)
+            rows = doc.get("frameworks") or [{}]
+            doc["frameworks"] = [{**rows[i % len(rows)], "name": f"{rows[i % len(rows)].get('name', 'fw')} {i}"}
+                                 for i in range(args.frameworks)]
+            with open(catalog, "w", encoding="utf-8") as f:
+                json.dump(doc, f)
+        elif os.path.exists(source):
+            shutil.copyfile(source, catalog)
+        return _run_startup(args, catalog)
+
+
+def _run_startup(args, catalog):
+    script = [os.path.join(SCRIPTS_DIR, "recommend.py"), "--catalog", catalog]
+    snapshot = catalog + ".snapshot"
+    baseline = parse_importtime(_timed_run([sys.executable, "-X", "importtime", "-c", "pass"])[1].stderr)
+
+    # Cold and warm runs are timed the same way (no -X importtime, whose overhead would skew the comparison)
+    cold = []
+    for _ in range(args.runs):
+        if os.path.exists(snapshot):
+            os.remove(snapshot)
+        cold.append(_timed_run([sys.executable] + script)[0])
+    cold_avg = sum(cold) / len(cold)
+    warm = [_timed_run([sys.executable] + script)[0] for _ in range(args.runs)]
+    warm_avg = sum(warm) / len(warm)
+
+    _, proc = _timed_run([sys.executable, "-X", "importtime"] + script)
+    imports = {name: us for name, us in parse_importtime(proc.stderr).items() if name not in baseline}
+
+    combos = itertools.cycle(itertools.product(
+        ["research", "coding", "multi_agent", "enterprise", "prototype"],
+        ["beginner", "intermediate", "advanced"],
+        ["local", "cloud", "hybrid"],
+        ["hours", "days", "weeks"]))
+    profiles = "".join(json.dumps({"use_case": u, "experience": e, "deployment": d, "timeline": t}) + "\n"
+                       for u, e, d, t in itertools.islice(combos, args.profiles))
+    batch, proc = _timed_run([sys.executable] + script + ["--batch"], stdin=profiles)
+    answered = len(proc.stdout.splitlines())
+
+    print(f"cold start (no snapshot, avg of {args.runs}): {cold_avg * 1000:8.1f} ms")
+    print(f"warm start (snapshot, avg of {args.runs}):    {warm_avg * 1000:8.1f} ms")
+    print(f"warm-run script imports (-X importtime): {sum(imports.values()) / 1000:.1f} ms")
+    for name, us in sorted(imports.items(), key=lambda x: x[1], reverse=True)[:8]:
+        print(f"    {name:28} {us / 1000:7.2f} ms")
+    print(f"--batch {answered} profiles:      {batch * 1000:8.1f} ms "
+          f"({batch / max(answered, 1) * 1000:.3f} ms/profile vs ~{warm_avg * 1000:.1f} ms/process)")
+    return [{
+        "cold_ms": round(cold_avg * 1000, 2),
+        "warm_ms": round(warm_avg * 1000, 2),
+        "imports_ms": {k: round(v / 1000, 3) for k, v in imports.items()},
+        "batch_profiles": answered,
+        "batch_ms": round(batch * 1000, 2),
+    }]
+
+
+# The hand-written scorer as it stood when data/scoring_rules.json replaced it
+# (recency-bucketed maintenance and the star-growth trend bonus included, so it
+# is not the original repository scorer), kept as the baseline for `scoring`:
+# it must rank and score exactly like the kernel
+LEGACY_MAINTENANCE_BUCKETS = ((30, 1.0), (90, 0.85), (180, 0.7), (365, 0.5))
+LEGACY_TREND_BONUS = ((0.05, 0.1), (0.02, 0.05))
+
+
+class LegacyScorer:
+    def __init__(self, frameworks, reference_day):
+        self.frameworks = frameworks
+        self.reference_day = reference_day
+        self.weights = {"use_case_match": 0.25, "experience_fit": 0.20, "deployment_match": 0.15,
+                        "maturity": 0.15, "community": 0.10, "requirements": 0.10, "maintenance": 0.05}
+
+    def score_framework(self, framework, requirements):
+        scores = {
+            "use_case_match": self._score_use_case(framework, requirements.use_case),
+            "experience_fit": self._score_experience(framework, requirements.experience),
+            "deployment_match": self._score_deployment(framework, requirements.deployment),
+            "maturity": self._score_maturity(framework, requirements.timeline),
+            "community": self._score_community(framework),
+            "requirements": self._score_requirements(framework, requirements),
+            "maintenance": self._score_maintenance(framework),
+        }
+        return sum(scores[key] * self.weights[key] for key in scores), scores
+
+    def _score_use_case(self, framework, use_case):
+        category = framework.get("category", "").lower()
+        tags = framework.get("tags", "").lower()
+        use_case_mapping = {
+            "research": ["research", "survey", "analysis"],
+            "coding": ["coding", "software", "programming"],
+            "multi_agent": ["multi-agent", "collaboration", "team"],
+            "enterprise": ["enterprise", "production", "business"],
+            "prototype": ["experimental", "prototype", "lightweight"]
+        }
+        keywords = use_case_mapping.get(use_case, [])
+        matches = sum(1 for kw in keywords if kw in category or kw in tags)
+        return min(matches / len(keywords), 1.0) if keywords else 0.5
+
+    def _score_experience(self, framework, experience):
+        maturity = framework.get("maturity", "").lower()
+        stars = self._parse_stars(framework.get("stars", "0"))
+        if experience == "beginner":
+            if maturity == "production" and stars > 20000:
+                return 0.9
+            elif maturity in ["production", "beta"] and stars > 10000:
+                return 0.7
+            else:
+                return 0.3
+        elif experience == "intermediate":
+            if maturity in ["production", "beta"] and stars > 5000:
+                return 0.8
+            else:
+                return 0.5
+        else:
+            return 0.8 if maturity != "broken" else 0.2
+
+    def _score_deployment(self, framework, deployment):
+        fw_deployment = framework.get("deployment", "").lower()
+        if deployment == "local":
+            return 1.0 if "local" in fw_deployment else 0.3
+        elif deployment == "cloud":
+            return 1.0 if "cloud" in fw_deployment else 0.4
+        else:
+            return 1.0 if "hybrid" in fw_deployment or "/" in fw_deployment else 0.6
+
+    def _score_maturity(self, framework, timeline):
+        maturity = framework.get("maturity", "").lower()
+        maturity_scores = {
+            "production": {"hours": 0.9, "days": 1.0, "weeks": 1.0},
+            "beta": {"hours": 0.6, "days": 0.8, "weeks": 0.9},
+            "experimental": {"hours": 0.2, "days": 0.5, "weeks": 0.7}
+        }
+        return maturity_scores.get(maturity, {}).get(timeline, 0.5)
+
+    def _score_community(self, framework):
+        stars = self._parse_stars(framework.get("stars", "0"))
+        if stars >= 50000:
+            score = 1.0
+        elif stars >= 20000:
+            score = 0.8
+        elif stars >= 5000:
+            score = 0.6
+        elif stars >= 1000:
+            score = 0.4
+        else:
+            score = 0.2
+        return min(max(score + self._trend_adjustment(framework), 0.0), 1.0)
+
+    def _trend_adjustment(self, framework):
+        growth = (framework.get("trend") or {}).get("growth_30d")
+        if growth is None:
+            return 0.0
+        if growth < 0:
+            return -0.05
+        for min_growth, bonus in LEGACY_TREND_BONUS:
+            if growth >= min_growth:
+                return bonus
+        return 0.0
+
+    def _score_requirements(self, framework, requirements):
+        score = 1.0
+        tags = framework.get("tags", "").lower()
+        if requirements.requires_mcp:
+            if "mcp" not in tags:
+                score -= 0.4
+        if requirements.requires_computer_use:
+            if "computer" not in tags and "gui" not in tags:
+                score -= 0.4
+        if requirements.enterprise_features:
+            if "enterprise" not in tags and "production" not in framework.get("maturity", "").lower():
+                score -= 0.3
+        if requirements.programming_language != "any":
+            lang = framework.get("language", "").lower()
+            if requirements.programming_language.lower() not in lang:
+                score -= 0.2
+        return max(score, 0.0)
+
+    def _score_maintenance(self, framework):
+        day = framework.get("last_commit_days")
+        if day is None:
+            return 0.5
+        age = self.reference_day - day
+        for max_age, score in LEGACY_MAINTENANCE_BUCKETS:
+            if age <= max_age:
+                return score
+        return 0.3
+
+    def _parse_stars(self, stars_str):
+        try:
+            stars_str = str(stars_str).lower().replace(",", "")
+            if "k" in stars_str:
+                return int(float(stars_str.replace("k", "")) * 1000)
+            else:
+                return int(stars_str)
+        except:  # noqa: E722
+            return 0
+
+    def recommend(self, requirements, top_k=5, reason=None):
+        scored = []
+        for framework in self.frameworks:
+            total_score, detailed_scores = self.score_framework(framework, requirements)
+            scored.append({
+                "framework": framework,
+                "total_score": total_score,
+                "detailed_scores": detailed_scores,
+                "recommendation_reason": reason(framework, requirements, detailed_scores) if reason else ""
+            })
+        scored.sort(key=lambda x: x["total_score"], reverse=True)
+        return scored[:top_k]
+
+
+def scoring_catalog(size):
+    """Synthetic catalog frameworks (with epoch days and some trends) for the scoring benchmark"""
+    from generate_catalog_json import epoch_days
+    frameworks = synthetic_frameworks(size)
+    for i, fw in enumerate(frameworks):
+        fw["last_commit_days"] = epoch_days(fw["last_commit"])
+        if i % 3:
+            fw["trend"] = {"growth_30d": ((i % 9) - 3) / 50}
+    return frameworks
+
+
+def scoring_profiles(count):
+    from recommend import UserRequirements
+    combos = itertools.cycle(itertools.product(
+        ["research", "coding", "multi_agent", "enterprise", "prototype"],
+        ["beginner", "intermediate", "advanced"],
+        ["local", "cloud", "hybrid"],
+        ["hours", "days", "weeks"],
+        ["python", "typescript", "any"],
+        [False, True], [False, True], [False, True]))
+    return [UserRequirements(use_case=u, experience=e, deployment=d, budget="medium", timeline=t, team_size=1,
+                             programming_language=lang, requires_mcp=mcp, requires_computer_use=cu,
+                             enterprise_features=ent)
+            for u, e, d, t, lang, mcp, cu, ent in itertools.islice(combos, count)]
+
+
+def run_scoring(args):
+    from recommend import FrameworkRecommendationEngine
+
+    profiles = scoring_profiles(args.profiles)
+    results = []
+    for size in args.sizes:
+        catalog = {"frameworks": scoring_catalog(size), "stats": {"reference_day": 20600}}
+        start = time.perf_counter()
+        engine = FrameworkRecommendationEngine(catalog=catalog, rules=args.rules)
+        load = time.perf_counter() - start
+        legacy = LegacyScorer(engine.frameworks, engine.reference_day)
+
+        start = time.perf_counter()
+        compiled = [engine.recommend(p, args.top_k) for p in profiles]
+        compiled_s = time.perf_counter() - start
+        start = time.perf_counter()
+        baseline = [legacy.recommend(p, args.top_k, engine._generate_reason) for p in profiles]
+        legacy_s = time.perf_counter() - start
+
+        identical = None
+        if not args.rules:
+            # Same frameworks, same float totals and breakdowns, same order
+            identical = all([(id(r["framework"]), r["total_score"], r["detailed_scores"], r["recommendation_reason"])
+                             for r in a] == [(id(r["framework"]), r["total_score"], r["detailed_scores"],
+                                              r["recommendation_reason"]) for r in b]
+                            for a, b in zip(compiled, baseline))
+        per_profile = {"legacy_ms": legacy_s / len(profiles) * 1000, "compiled_ms": compiled_s / len(profiles) * 1000}
+        print(f"size={size:<7} profiles={len(profiles):<5} load={load * 1000:8.1f} ms  "
+              f"legacy={per_profile['legacy_ms']:8.3f} ms/profile  compiled={per_profile['compiled_ms']:8.3f} "
+              f"ms/profile  speedup={legacy_s / compiled_s:6.1f}x  "
+              f"identical={'n/a (custom rules)' if identical is None else identical}")
+        if identical is False:
+            raise SystemExit("compiled rules disagree with the hand-written scorer")
+        results.append({"size": size, "profiles": len(profiles), "load_ms": round(load * 1000, 2),
+                        **{k: round(v, 4) for k, v in per_profile.items()},
+                        "speedup": round(legacy_s / compiled_s, 2), "identical": identical})
+    return results
+
+
+def run_parallel(args):
+    from recommend import FrameworkRecommendationEngine
+    from shared_scoring import SharedScoringPool
+
+    profiles = scoring_profiles(args.profiles)
+    queries = [(p, args.top_k, None) for p in profiles]
+    workers = args.workers or sorted({1, 2, os.cpu_count() or 1})
+
+    def summary(batch):
+        return [[(id(r["framework"]), r["total_score"], r["detailed_scores"]) for r in recs] for recs in batch]
+
+    results = []
+    for size in args.sizes:
+        catalog = {"frameworks": scoring_catalog(size), "stats": {"reference_day": 20600}}
+        engine = FrameworkRecommendationEngine(catalog=catalog)
+        start = time.perf_counter()
+        serial = [engine.recommend(p, args.top_k) for p in profiles]
+        serial_s = time.perf_counter() - start
+        expected = summary(serial)
+        print(f"size={size:<8} profiles={len(profiles):<5} serial={serial_s:8.2f}s  (cpus={os.cpu_count()})")
+        for partition in args.partitions:
+            for n in workers:
+                # A fresh engine: the serial run above has every column cached
+                engine = FrameworkRecommendationEngine(catalog=catalog)
+                start = time.perf_counter()
+                pool = SharedScoringPool(engine, n, partition)
+                setup_s = time.perf_counter() - start
+                try:
+                    start = time.perf_counter()
+                    cold = pool.recommend_batch(queries)
+                    cold_s = time.perf_counter() - start
+                    start = time.perf_counter()
+                    warm = pool.recommend_batch(queries)
+                    warm_s = time.perf_counter() - start
+                    shm_mb = pool.shm.size / 1e6
+                finally:
+                    pool.close()
+                identical = summary(cold) == expected and summary(warm) == expected
+                result = {"size": size, "profiles": len(profiles), "partition": partition, "workers": n,
+                          "shm_mb": round(shm_mb, 2), "serial_s": round(serial_s, 3), "setup_s": round(setup_s, 3),
+                          "cold_s": round(cold_s, 3), "warm_s": round(warm_s, 3),
+                          "speedup": round(serial_s / cold_s, 2), "identical": identical}
+                results.append(result)
+                print(f"  {partition:10} workers={n:<3} shm={shm_mb:7.1f} MB  setup={setup_s:6.2f}s  "
+                      f"cold={cold_s:7.2f}s  warm={warm_s:7.2f}s  speedup={result['speedup']:5.2f}x  "
+                      f"identical={identical}")
+                if not identical:
+                    raise SystemExit("shared-memory pool results differ from serial recommend()")
+    return results
+
+
+# Link-check strategies compared by `links`: each returns True when the link looks broken
+def _head_only(url):
+    import requests
+    try:
+        return requests.head(url, timeout=10, allow_redirects=True).status_code != 200
+    except requests.exceptions.RequestException:
+        return True
+
+
+def _full_get(url):
+    import requests
+    try:
+        return requests.get(url, timeout=10, allow_redirects=True).status_code != 200
+    except requests.exceptions.RequestException:
+        return True
+
+
+def _probe(url):
+    from link_probe import HARD_FAIL, probe
+    return probe(url)["outcome"] == HARD_FAIL
+
+
+LINK_STRATEGIES = {"head": _head_only, "get": _full_get, "probe": _probe}
+
+
+def link_targets(base, size):
+    """(url, is_broken) pairs: plain pages, HEAD-rejecting pages, PDFs (some HEAD-rejecting) and dead links"""
+    kinds = ["page", "page", "page", "page", "nohead", "nohead", "pdf", "pdf", "nohead/pdf", "missing"]
+    return [(f"{base}/{kinds[i % len(kinds)]}/link-{i}", kinds[i % len(kinds)] == "missing") for i in range(size)]
+
+
+def run_links(args):
+    from concurrent.futures import ThreadPoolExecutor
+
+    server = StubAPIServer(config=StubConfig(latency=args.latency, seed=args.seed)).start()
+    results = []
+    try:
+        for size in args.sizes:
+            targets = link_targets(server.url, size)
+            for name in args.strategies:
+                server.stats.reset()
+                start = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=args.workers) as pool:
+                    flagged = list(pool.map(LINK_STRATEGIES[name], [url for url, _ in targets]))
+                wall = time.perf_counter() - start
+                stats = server.stats.snapshot()
+                false_broken = sum(1 for (_, broken), f in zip(targets, flagged) if f and not broken)
+                missed = sum(1 for (_, broken), f in zip(targets, flagged) if broken and not f)
+                result = {"strategy": name, "size": size, "wall_s": round(wall, 3), "requests": stats["total"],
+                          "bytes": stats["bytes_sent"], "bytes_per_link": round(stats["bytes_sent"] / size, 1),
+                          "false_broken": false_broken, "missed_broken": missed}
+                results.append(result)
+                print(f"{name:6} size={size:<6} wall={wall:7.2f}s requests={stats['total']:<6} "
+                      f"bytes/link={result['bytes_per_link']:<10} false_broken={false_broken:<5} missed={missed}")
+    finally:
+        server.stop()
+    return results
+
+
+def awesome_list(index, entries):
+    """Synthetic awesome-list page: a table and bullet lists; repos recur across pages, some are already catalogued"""
+    def repo(j):
+        n = (index * 37 + j * 11) % (entries * 20)
+        return n, "Significant-Gravitas/Auto-GPT" if n % 97 == 0 else f"org{n % 400}/agent-{n}"
+
+    lines = [f"# Awesome Agents {index}", "", "| Name | Repo | Stars | Description |", "|---|---|---|---|"]
+    for j in range(1, entries, 2):
+        n, owner = repo(j)
+        lines.append(f"| **Agent {n}** | [{owner}](https://github.com/{owner}) | {n % 90}.{n % 10}K | "
+                     f"Agent number {n} with tools |")
+    for j in range(0, entries, 2):
+        n, owner = repo(j)
+        if j % 10 == 0:
+            lines += ["", f"## Section {j}", "", "```bash", f"git clone https://github.com/{owner}", "```", ""]
+        lines.append(f"- [Agent {n}](https://github.com/{owner}) - Agent number {n}, see "
+                     f"[issues](https://github.com/{owner}/issues)")
+    return "\n".join(lines) + "\n"
+
+
+def run_ingest(args):
+    from ingest_markdown import expand_inputs, ingest
+
+    results = []
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as root:
+            for i in range(size):
+                with open(os.path.join(root, f"list-{i}.md"), "w", encoding="utf-8") as f:
+                    f.write(awesome_list(i, args.entries))
+            paths = expand_inputs([root])
+            runs = {}
+            for label, workers in (("serial", 1), ("pool", args.workers)):
+                start = time.perf_counter()
+                rows, stats = ingest(paths, data_dir=os.path.join(ROOT_DIR, "data"), workers=workers)
+                runs[label] = (time.perf_counter() - start, [row.to_csv() for row in rows])
+            identical = runs["serial"][1] == runs["pool"][1]
+            result = {"files": size, "entries": args.entries, "mb": round(stats["bytes"] / 1e6, 2),
+                      "mentions": stats["candidates"], "new": stats["new"], "known": stats["known"],
+                      "serial_s": round(runs["serial"][0], 3), "pool_s": round(runs["pool"][0], 3),
+                      "speedup": round(runs["serial"][0] / runs["pool"][0], 2), "identical": identical}
+            results.append(result)
+            print(f"files={size:<6} {result['mb']:7.1f} MB  mentions={stats['candidates']:<8} new={stats['new']:<6} "
+                  f"known={stats['known']:<4} serial={result['serial_s']:7.2f}s  pool={result['pool_s']:7.2f}s  "
+                  f"({size / runs['pool'][0]:,.0f} files/s)  speedup={result['speedup']:5.2f}x  identical={identical}")
+            if not identical:
+                raise SystemExit("process-pool ingestion staged different rows")
+    return results
+
+
+def main():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--json", help="Write results to this JSON file")
+
+    ap = argparse.ArgumentParser(description="Offline benchmarks for repository scripts")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    net = sub.add_parser("network", parents=[common],
+                         help="Benchmark network-bound scripts against the local API stub")
+    net.add_argument("--scripts", nargs="+", choices=sorted(NETWORK_SCRIPTS), default=list(NETWORK_SCRIPTS))
+    net.add_argument("--sizes", nargs="+", type=int, default=[10, 100, 500])
+    net.add_argument("--latency", type=float, default=0.02, help="Stub latency per request (seconds)")
+    net.add_argument("--jitter", type=float, default=0.0)
+    net.add_argument("--error-rate", type=float, default=0.0)
+    net.add_argument("--rate-limit", type=int, default=5000)
+    net.add_argument("--seed", type=int, default=0)
+    net.add_argument("--timeout", type=int, default=3600, help="Per-run timeout (seconds)")
+    net.add_argument("--verbose", action="store_true", help="Print stderr of failing runs")
+    net.set_defaults(func=run_network)
+
+    start = sub.add_parser("startup", parents=[common], help="Measure recommend.py start-up and --batch throughput")
+    start.add_argument("--runs", type=int, default=10, help="Warm start-up runs to average")
+    start.add_argument("--profiles", type=int, default=500, help="Profiles to stream through --batch")
+    start.add_argument("--frameworks", type=int, default=0,
+                       help="Grow the catalog copy to this many frameworks (default: the real catalog)")
+    start.set_defaults(func=run_startup)
+
+    links = sub.add_parser("links", parents=[common],
+                           help="Compare link-check strategies (HEAD only, full GET, HEAD + ranged GET probe)")
+    links.add_argument("--strategies", nargs="+", choices=sorted(LINK_STRATEGIES), default=list(LINK_STRATEGIES))
+    links.add_argument("--sizes", nargs="+", type=int, default=[100, 1000])
+    links.add_argument("--latency", type=float, default=0.0, help="Stub latency per request (seconds)")
+    links.add_argument("--workers", type=int, default=8)
+    links.add_argument("--seed", type=int, default=0)
+    links.set_defaults(func=run_links)
+
+    score = sub.add_parser("scoring", parents=[common],
+                           help="Compare compiled scoring rules against the hand-written scorer")
+    score.add_argument("--sizes", nargs="+", type=int, default=[100, 1000, 10000])
+    score.add_argument("--profiles", type=int, default=200, help="Requirement profiles scored per size")
+    score.add_argument("--top-k", type=int, default=5)
+    score.add_argument("--rules", help="Custom rule set (JSON) to time; skips the equality check")
+    score.set_defaults(func=run_scoring)
+
+    par = sub.add_parser("parallel", parents=[common],
+                         help="Scale shared-memory multi-process scoring from 1 to N workers against serial")
+    par.add_argument("--sizes", nargs="+", type=int, default=[10000, 100000])
+    par.add_argument("--profiles", type=int, default=500, help="Requirement profiles per batch")
+    par.add_argument("--top-k", type=int, default=5)
+    par.add_argument("--workers", nargs="+", type=int, default=None,
+                     help="Worker counts to run (default: 1, 2 and the CPU count)")
+    par.add_argument("--partitions", nargs="+", choices=["frameworks", "queries"], default=["frameworks", "queries"])
+    par.set_defaults(func=run_parallel)
+
+    ing = sub.add_parser("ingest", parents=[common],
+                         help="Time Markdown list ingestion in-process vs. across the process pool")
+    ing.add_argument("--sizes", nargs="+", type=int, default=[100, 1000], help="Markdown files per run")
+    ing.add_argument("--entries", type=int, default=100, help="Table rows and bullets per file")
+    ing.add_argument("--workers", type=int, default=None, help="Pool processes (default: CPU count)")
+    ing.set_defaults(func=run_ingest)
+
+    args = ap.parse_args()
+
+    results = args.func(args)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"command": args.command, "results": results}, f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Versioned catalog.json snapshots and delta feed for downstream consumers.
+
+- Every catalog build whose content changed (generated_at and the build day
+  in stats.reference_day alone do not count) becomes a new version in
+  compare/feed/index.json, with the SHA-256 of its canonical JSON (sorted
+  keys, no whitespace)
+- Between consecutive versions a delta file holds JSON Patch (RFC 6902)
+  operations: add / remove / replace, and move for rows that changed rank;
+  lists of rows (frameworks, computer_use) are matched by GitHub URL or name,
+  so a star refresh that re-sorts the catalog costs one move per displaced row
+  plus the changed fields, not a rewrite of every position
+- The latest version is always available as a full snapshot, and versions
+  1, 1 + SNAPSHOT_EVERY, ... keep theirs; only the newest KEEP_SNAPSHOTS
+  periodic snapshots are retained, and versions and deltas older than the
+  oldest retained snapshot are compacted away (a consumer that far behind
+  re-bootstraps from a snapshot)
+- Deltas, snapshots and the index get .gz (and .br) siblings like the UI shards
+- scripts/catalog_sync.py is the consumer side: it applies the deltas to a
+  local copy, or downloads the latest snapshot when that is smaller
+
+generate_catalog_json.py updates the feed after writing catalog.json.
+
+Usage:
+  python scripts/catalog_feed.py                       # add compare/catalog.json to the feed
+  python scripts/catalog_feed.py --diff old.json new.json
+"""
+import argparse
+import hashlib
+import json
+import os
+
+from catalog_shards import _brotli, write_compressed
+
+FEED_DIR = os.path.join("compare", "feed")
+INDEX = "index.json"
+SNAPSHOT_EVERY = 10
+KEEP_SNAPSHOTS = 5
+# Key paths that change with the build time or date without the content changing
+VOLATILE = (("generated_at",), ("stats", "reference_day"))
+
+
+def canonical(doc) -> bytes:
+    return json.dumps(doc, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def digest(doc) -> str:
+    return hashlib.sha256(canonical(doc)).hexdigest()
+
+
+def _without(doc, path):
+    """Copy of doc minus the key at path (copying only the dicts along it)"""
+    if not isinstance(doc, dict) or path[0] not in doc:
+        return doc
+    out = dict(doc)
+    if len(path) == 1:
+        del out[path[0]]
+    else:
+        out[path[0]] = _without(doc[path[0]], path[1:])
+    return out
+
+
+def content_digest(doc) -> str:
+    for path in VOLATILE:
+        doc = _without(doc, path)
+    return digest(doc)
+
+
+def _pointer(path, token) -> str:
+    return f"{path}/{str(token).replace('~', '~0').replace('/', '~1')}"
+
+
+def _row_key(item):
+    return (item.get("github") or item.get("name")) if isinstance(item, dict) else None
+
+
+def _stable_positions(seq) -> set:
+    """Indices into seq of one longest increasing subsequence"""
+    import bisect
+    tails, tail_at, prev = [], [], [None] * len(seq)
+    for i, value in enumerate(seq):
+        k = bisect.bisect_left(tails, value)
+        if k == len(tails):
+            tails.append(value)
+            tail_at.append(i)
+        else:
+            tails[k] = value
+            tail_at[k] = i
+        prev[i] = tail_at[k - 1] if k else None
+    out, i = set(), tail_at[-1] if tail_at else None
+    while i is not None:
+        out.add(i)
+        i = prev[i]
+    return out
+
+
+def _diff_rows(old, new, path, ops, old_keys, new_keys):
+    """Keyed list diff: remove dropped rows, then move/add the rows outside the longest in-order run"""
+    old_by_key = dict(zip(old_keys, old))
+    wanted = set(new_keys)
+    current = list(old_keys)
+    for i in reversed(range(len(current))):
+        if current[i] not in wanted:
+            ops.append({"op": "remove", "path": _pointer(path, i)})
+            del current[i]
+    rank = {key: i for i, key in enumerate(current)}
+    kept = [i for i, key in enumerate(new_keys) if key in rank]
+    stable = {new_keys[kept[j]] for j in _stable_positions([rank[new_keys[i]] for i in kept])}
+    # In target order, each row that is not stable goes right after its final predecessor
+    for t, key in enumerate(new_keys):
+        if key in stable:
+            continue
+        if key in rank:
+            j = current.index(key)
+            current.pop(j)
+        at = current.index(new_keys[t - 1]) + 1 if t else 0
+        if key not in rank:
+            ops.append({"op": "add", "path": _pointer(path, at), "value": new[t]})
+        elif j != at:
+            ops.append({"op": "move", "from": _pointer(path, j), "path": _pointer(path, at)})
+        current.insert(at, key)
+    for i, key in enumerate(new_keys):
+        if key in old_by_key:
+            diff(old_by_key[key], new[i], _pointer(path, i), ops)
+
+
+def _diff_list(old, new, path, ops):
+    old_keys, new_keys = [_row_key(x) for x in old], [_row_key(x) for x in new]
+    if (None not in old_keys and None not in new_keys and len(set(old_keys)) == len(old_keys)
+            and len(set(new_keys)) == len(new_keys)):
+        return _diff_rows(old, new, path, ops, old_keys, new_keys)
+    if not any(isinstance(x, (dict, list)) for x in old + new):
+        # Short scalar lists (similar names, facet positions): one replace
+        ops.append({"op": "replace", "path": path, "value": new})
+        return
+    for i in range(min(len(old), len(new))):
+        diff(old[i], new[i], _pointer(path, i), ops)
+    for i in range(len(old) - 1, len(new) - 1, -1):
+        ops.append({"op": "remove", "path": _pointer(path, i)})
+    for value in new[len(old):]:
+        ops.append({"op": "add", "path": _pointer(path, "-"), "value": value})
+
+
+def diff(old, new, path="", ops=None) -> list:
+    """JSON Patch operations turning old into new"""
+    ops = [] if ops is None else ops
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": _pointer(path, key)})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "add", "path": _pointer(path, key), "value": value})
+            else:
+                diff(old[key], value, _pointer(path, key), ops)
+    elif isinstance(old, list) and isinstance(new, list):
+        if old != new:
+            _diff_list(old, new, path, ops)
+    elif old != new or type(old) is not type(new):
+        ops.append({"op": "replace", "path": path, "value": new})
+    return ops
+
+
+def _parent(doc, path):
+    tokens = [t.replace("~1", "/").replace("~0", "~") for t in path.split("/")[1:]]
+    for token in tokens[:-1]:
+        doc = doc[int(token)] if isinstance(doc, list) else doc[token]
+    return doc, tokens[-1]
+
+
+def apply_patch(doc, ops):
+    """Apply JSON Patch operations (add/remove/replace/move) to doc in place; returns the patched document"""
+    for op in ops:
+        kind = op["op"]
+        if kind == "move":
+            parent, token = _parent(doc, op["from"])
+            value = parent.pop(int(token)) if isinstance(parent, list) else parent.pop(token)
+            op = {"op": "add", "path": op["path"], "value": value}
+            kind = "add"
+        if op["path"] == "":
+            if kind == "remove":
+                raise ValueError("cannot remove the document root")
+            doc = op["value"]
+            continue
+        parent, token = _parent(doc, op["path"])
+        if isinstance(parent, list):
+            if kind == "add":
+                parent.insert(len(parent) if token == "-" else int(token), op["value"])
+            elif kind == "remove":
+                del parent[int(token)]
+            elif kind == "replace":
+                parent[int(token)] = op["value"]
+            else:
+                raise ValueError(f"unsupported patch op: {kind}")
+        elif kind in ("add", "replace"):
+            parent[token] = op["value"]
+        elif kind == "remove":
+            del parent[token]
+        else:
+            raise ValueError(f"unsupported patch op: {kind}")
+    return doc
+
+
+def load_index(feed_dir=FEED_DIR) -> dict:
+    path = os.path.join(feed_dir, INDEX)
+    if not os.path.exists(path):
+        return {"format": 1, "latest": 0, "versions": []}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _remove(feed_dir, name):
+    for suffix in ("", ".gz", ".br"):
+        try:
+            os.remove(os.path.join(feed_dir, name + suffix))
+        except FileNotFoundError:
+            pass
+
+
+def write_feed(catalog, feed_dir=FEED_DIR, snapshot_every=SNAPSHOT_EVERY, keep_snapshots=KEEP_SNAPSHOTS):
+    """Record catalog as the next feed version if its content changed; returns (index, new version entry or None)"""
+    os.makedirs(os.path.join(feed_dir, "snapshots"), exist_ok=True)
+    os.makedirs(os.path.join(feed_dir, "deltas"), exist_ok=True)
+    brotli = _brotli()
+    index = load_index(feed_dir)
+    data = canonical(catalog)
+    new = json.loads(data)
+    versions = index["versions"]
+    previous = versions[-1] if versions else None
+    if previous and previous["content_sha256"] == content_digest(new):
+        return index, None
+
+    version = index["latest"] + 1
+    entry = {"version": version, "generated_at": new.get("generated_at"), "sha256": hashlib.sha256(data).hexdigest(),
+             "content_sha256": content_digest(new), "snapshot": f"snapshots/{version}.json", "snapshot_bytes": len(data)}
+    if previous and previous.get("snapshot"):
+        with open(os.path.join(feed_dir, previous["snapshot"]), encoding="utf-8") as f:
+            base = json.load(f)
+        delta = canonical({"from": previous["version"], "to": version, "base_sha256": previous["sha256"],
+                           "sha256": entry["sha256"], "ops": diff(base, new)})
+        entry["delta"] = f"deltas/{version}.json"
+        entry["delta_bytes"] = len(delta)
+        write_compressed(os.path.join(feed_dir, entry["delta"]), delta, brotli)
+        # The previous latest keeps its snapshot only on the periodic schedule
+        if (previous["version"] - 1) % snapshot_every:
+            _remove(feed_dir, previous["snapshot"])
+            previous["snapshot"] = None
+            previous.pop("snapshot_bytes", None)
+    write_compressed(os.path.join(feed_dir, entry["snapshot"]), data, brotli)
+    versions.append(entry)
+
+    # Compaction: keep the newest periodic snapshots; nothing older than the oldest of them is reachable
+    periodic = [v for v in versions[:-1] if v.get("snapshot")]
+    for v in periodic[:-keep_snapshots] if len(periodic) > keep_snapshots else []:
+        _remove(feed_dir, v["snapshot"])
+        v["snapshot"] = None
+    oldest = next(v["version"] for v in versions if v.get("snapshot"))
+    for v in versions:
+        if v["version"] <= oldest and v.get("delta"):
+            _remove(feed_dir, v["delta"])
+            v.pop("delta")
+            v.pop("delta_bytes", None)
+    index["versions"] = [v for v in versions if v["version"] >= oldest]
+    index["latest"] = version
+    index["snapshot_every"] = snapshot_every
+    write_compressed(os.path.join(feed_dir, INDEX), json.dumps(index, indent=2).encode("utf-8"), brotli)
+    return index, entry
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Add a catalog build to the versioned delta feed")
+    ap.add_argument("--catalog", default=os.path.join("compare", "catalog.json"))
+    ap.add_argument("--feed-dir", default=FEED_DIR)
+    ap.add_argument("--snapshot-every", type=int, default=SNAPSHOT_EVERY)
+    ap.add_argument("--keep-snapshots", type=int, default=KEEP_SNAPSHOTS)
+    ap.add_argument("--diff", nargs=2, metavar=("OLD", "NEW"), help="Print the patch between two catalog files")
+    args = ap.parse_args()
+
+    if args.diff:
+        docs = []
+        for path in args.diff:
+            with open(path, encoding="utf-8") as f:
+                docs.append(json.load(f))
+        print(json.dumps(diff(*docs), indent=2))
+        return
+
+    with open(args.catalog, encoding="utf-8") as f:
+        catalog = json.load(f)
+    index, entry = write_feed(catalog, args.feed_dir, args.snapshot_every, args.keep_snapshots)
+    if entry is None:
+        print(f"Catalog unchanged; feed stays at version {index['latest']}")
+    else:
+        delta = f", delta {entry['delta_bytes']:,} bytes" if entry.get("delta") else ""
+        print(f"Wrote feed version {entry['version']} to {args.feed_dir} "
+              f"(snapshot {entry['snapshot_bytes']:,} bytes{delta})")
+
+
+if __name__ == "__main__":
+    main()
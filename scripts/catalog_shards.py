@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Split catalog.json into small, cacheable shards for the comparison UI.
+
+- compare/manifest.json is the only fixed-name file the UI fetches: counts,
+  column lists, stats and the file names of every shard
+- Frameworks (already star-sorted) are cut into pages of PAGE_SIZE rows, so
+  the UI paints the most popular frameworks from the first page and fetches
+  later pages as they scroll into view or when a filter/search needs them;
+  the facet bitmaps and the computer-use section are separate shards
+- Shards are minified and carry only the columns the UI displays, as row
+  arrays in manifest column order
+- Each shard is named by a hash of its content (frameworks-0.3f2a9c1b7d0e.json),
+  so it can be served with a long-lived immutable cache header; unchanged
+  shards keep their names across builds, and shards no longer referenced by
+  the manifest are removed
+- Every shard and the manifest get precompressed .gz siblings (mtime 0, so
+  rebuilds are byte-identical) and .br siblings when the brotli module is
+  installed, for servers that serve precompressed files (nginx gzip_static /
+  brotli_static)
+
+generate_catalog_json.py writes the shards after catalog.json.
+
+Usage:
+  python scripts/catalog_shards.py                   # shard compare/catalog.json
+  python scripts/catalog_shards.py --page-size 100
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+
+OUT_DIR = "compare"
+SHARD_DIR = "shards"
+MANIFEST = "manifest.json"
+PAGE_SIZE = 50
+
+FRAMEWORK_COLUMNS = ["name", "github", "website", "stars", "maturity", "language", "deployment", "tags",
+                     "description"]
+COMPUTER_USE_COLUMNS = ["name", "github", "website", "stars", "modality", "scope", "sandboxing", "last_update",
+                        "notes"]
+
+SHARD_RE = re.compile(r"^[\w-]+\.[0-9a-f]{12}\.json(\.gz|\.br)?$")
+
+
+def minify(obj):
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def rows_of(items, columns):
+    return [[item.get(c, "") for c in columns] for item in items]
+
+
+def write_compressed(path, data, brotli=None):
+    """Write data plus .gz (and .br when brotli is available) siblings; returns the written paths"""
+    written = [path]
+    with open(path, "wb") as f:
+        f.write(data)
+    with open(path + ".gz", "wb") as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    written.append(path + ".gz")
+    if brotli is not None:
+        with open(path + ".br", "wb") as f:
+            f.write(brotli.compress(data, quality=11))
+        written.append(path + ".br")
+    return written
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def _write_plain(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+    return [path]
+
+
+def write_shards(catalog, out_dir=OUT_DIR, page_size=PAGE_SIZE, compress=True):
+    """Write the manifest and content-hashed shards for catalog; returns the manifest dict.
+
+    compress=False skips the .gz/.br siblings (local previews, where the
+    compression would dominate the build time).
+    """
+    shard_dir = os.path.join(out_dir, SHARD_DIR)
+    os.makedirs(shard_dir, exist_ok=True)
+    brotli = _brotli() if compress else None
+    write = (lambda path, data: write_compressed(path, data, brotli)) if compress else _write_plain
+    keep = set()
+
+    def shard(stem, obj):
+        data = minify(obj)
+        name = f"{stem}.{hashlib.sha256(data).hexdigest()[:12]}.json"
+        path = os.path.join(shard_dir, name)
+        files = [path] + ([path + ".gz"] if compress else []) + ([path + ".br"] if brotli else [])
+        # Content-addressed: an existing shard with this name already holds these bytes
+        if not all(os.path.exists(p) for p in files):
+            files = write(path, data)
+        keep.update(os.path.basename(p) for p in files)
+        return f"{SHARD_DIR}/{name}"
+
+    frameworks = catalog.get("frameworks", [])
+    computer_use = catalog.get("computer_use", [])
+    pages = [shard(f"frameworks-{i // page_size}", {"rows": rows_of(frameworks[i:i + page_size], FRAMEWORK_COLUMNS)})
+             for i in range(0, len(frameworks), page_size)]
+    manifest = {
+        "generated_at": catalog.get("generated_at"),
+        "stats": catalog.get("stats", {}),
+        "frameworks": {"count": len(frameworks), "page_size": page_size, "columns": FRAMEWORK_COLUMNS,
+                       "pages": pages},
+        "facets": shard("facets", catalog.get("facets", {})),
+        "computer_use": {"count": len(computer_use), "columns": COMPUTER_USE_COLUMNS,
+                         "file": shard("computer-use", {"rows": rows_of(computer_use, COMPUTER_USE_COLUMNS)})},
+        "encodings": (["gzip"] if compress else []) + (["br"] if brotli else []),
+    }
+    write(os.path.join(out_dir, MANIFEST), minify(manifest))
+    # Stale siblings (from a build with compression or brotli) would point servers at shards removed below
+    for suffix in ([] if compress else [".gz"]) + ([] if brotli else [".br"]):
+        if os.path.exists(os.path.join(out_dir, MANIFEST + suffix)):
+            os.remove(os.path.join(out_dir, MANIFEST + suffix))
+
+    # Drop shards from earlier builds (only files that look like ours)
+    for name in os.listdir(shard_dir):
+        if SHARD_RE.match(name) and name not in keep:
+            os.remove(os.path.join(shard_dir, name))
+    return manifest
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Write the comparison UI manifest and catalog shards")
+    ap.add_argument("--catalog", default=os.path.join(OUT_DIR, "catalog.json"))
+    ap.add_argument("--out-dir", default=OUT_DIR)
+    ap.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    args = ap.parse_args()
+
+    with open(args.catalog, encoding="utf-8") as f:
+        catalog = json.load(f)
+    manifest = write_shards(catalog, args.out_dir, args.page_size)
+    shards = len(manifest["frameworks"]["pages"]) + 2
+    print(f"Wrote {os.path.join(args.out_dir, MANIFEST)} and {shards} shards "
+          f"({', '.join(manifest['encodings'])} siblings)")
+
+
+if __name__ == "__main__":
+    main()
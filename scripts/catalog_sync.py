@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Keep a local copy of compare/catalog.json in sync through the delta feed.
+
+- Reads the feed index (a URL such as
+  https://raw.githubusercontent.com/<owner>/<repo>/main/compare/feed, or a
+  local compare/feed directory)
+- With a local copy at version v, fetches the deltas v+1..latest and applies
+  them (scripts/catalog_feed.py apply_patch); the SHA-256 of the canonical
+  JSON is checked after every delta, and any mismatch falls back to the full
+  snapshot
+- With no local copy, a local copy that was edited, a version older than the
+  feed retains, or deltas that add up to more than the snapshot, downloads
+  the latest full snapshot instead
+- The local version and hash live next to the copy in <out>.feed.json
+
+Usage:
+  python scripts/catalog_sync.py --feed compare/feed --out ~/.cache/catalog.json
+  python scripts/catalog_sync.py --feed https://raw.githubusercontent.com/<owner>/<repo>/main/compare/feed --out catalog.json
+"""
+import argparse
+import json
+import os
+
+import requests
+
+from catalog_feed import INDEX, apply_patch, digest
+
+
+class FeedClient:
+    def __init__(self, feed: str, out: str, http=requests, timeout: float = 30):
+        self.feed = feed.rstrip("/")
+        self.out = out
+        self.state_path = out + ".feed.json"
+        self.http = http
+        self.timeout = timeout
+        self.bytes_fetched = 0
+
+    def fetch(self, name: str):
+        if self.feed.startswith(("http://", "https://")):
+            response = self.http.get(f"{self.feed}/{name}", timeout=self.timeout)
+            response.raise_for_status()
+            data = response.content
+        else:
+            with open(os.path.join(self.feed, name), "rb") as f:
+                data = f.read()
+        self.bytes_fetched += len(data)
+        return json.loads(data)
+
+    def local(self):
+        """(document, version) of the local copy, or (None, 0) when missing or edited since the last sync"""
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+            with open(self.out, encoding="utf-8") as f:
+                doc = json.load(f)
+        except (OSError, ValueError):
+            return None, 0
+        if digest(doc) != state.get("sha256"):
+            return None, 0
+        return doc, state.get("version", 0)
+
+    def save(self, doc, version: int, sha256: str):
+        os.makedirs(os.path.dirname(os.path.abspath(self.out)), exist_ok=True)
+        for path, payload in ((self.out, doc), (self.state_path, {"version": version, "sha256": sha256})):
+            tmp = path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2)
+            os.replace(tmp, path)
+
+    def sync(self) -> dict:
+        """Bring the local copy to the latest feed version; returns what was done"""
+        index = self.fetch(INDEX)
+        latest = index["versions"][-1]
+        doc, version = self.local()
+        result = {"from": version, "to": latest["version"], "method": "none", "deltas": 0}
+        if doc is not None and version == latest["version"]:
+            return {**result, "bytes": self.bytes_fetched}
+
+        chain = [v for v in index["versions"] if v["version"] > version]
+        usable = (doc is not None and chain and chain[0]["version"] == version + 1
+                  and all(v.get("delta") for v in chain))
+        if usable and sum(v["delta_bytes"] for v in chain) < latest["snapshot_bytes"]:
+            try:
+                for v in chain:
+                    delta = self.fetch(v["delta"])
+                    doc = apply_patch(doc, delta["ops"])
+                    if digest(doc) != v["sha256"]:
+                        raise ValueError(f"hash mismatch after delta {v['version']}")
+                    result["deltas"] += 1
+                self.save(doc, latest["version"], latest["sha256"])
+                return {**result, "method": "delta", "bytes": self.bytes_fetched}
+            except (KeyError, IndexError, TypeError, ValueError, OSError, requests.exceptions.RequestException) as e:
+                result["fallback"] = str(e)
+
+        doc = self.fetch(latest["snapshot"])
+        if digest(doc) != latest["sha256"]:
+            raise ValueError(f"snapshot {latest['snapshot']} does not match the index hash")
+        self.save(doc, latest["version"], latest["sha256"])
+        return {**result, "method": "snapshot", "bytes": self.bytes_fetched}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Sync a local catalog.json from the versioned delta feed")
+    ap.add_argument("--feed", default=os.path.join("compare", "feed"), help="Feed URL or directory")
+    ap.add_argument("--out", required=True, help="Local catalog copy to create or update")
+    ap.add_argument("--timeout", type=float, default=30)
+    args = ap.parse_args()
+
+    result = FeedClient(args.feed, args.out, timeout=args.timeout).sync()
+    if result["method"] == "none":
+        print(f"{args.out} is up to date at version {result['to']}")
+        return
+    how = f"{result['deltas']} deltas" if result["method"] == "delta" else "full snapshot"
+    note = f" (delta sync failed: {result['fallback']})" if result.get("fallback") else ""
+    print(f"Synced {args.out} from version {result['from']} to {result['to']} via {how}, "
+          f"{result['bytes']:,} bytes fetched{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Watch mode for the catalog build: rebuild on data/ edits and live-reload the UI.
+
+- Polls the files in data/ (mtime and size, every --interval seconds; no
+  extra dependency) and waits until a burst of edits has been quiet for
+  --debounce seconds before rebuilding, so an editor's save-rename-touch or a
+  refresh script rewriting several CSVs triggers one build
+- Rebuilds incrementally, in-process: only the sections whose sources
+  changed (frameworks.csv / maturity_overrides.json / star_history.json ->
+  frameworks, computer_use.csv -> computer_use) are reloaded, through the
+  parsed-table cache of scripts/data_loader.py; the other section is reused
+- Two phases per build:
+    1. what the UI renders -- sorted rows, facet bitmaps, manifest and the
+       changed page shards (no .gz/.br siblings) -- then a reload event goes out
+    2. the rest -- `similar` (reused while the similarity inputs and row order
+       are unchanged), `trend`, catalog.json, papers.json, search_index.json
+       and recommendations.json -- then an `artifacts` event makes open pages
+       re-fetch search and recommendations without reloading
+  so edit-to-preview latency is bounded by phase 1 (well under a second for
+  10k frameworks); the feed (compare/feed/) is left to real builds
+- Builds go to a scratch directory (.cache/watch/compare/ by default), never
+  to compare/ itself, so a watch session leaves the committed artifacts and
+  their .gz/.br siblings untouched
+- Serves the repository root over HTTP (the UI's section links point outside
+  compare/), with files under /compare/ taken from the scratch directory when
+  it has them (the built artifacts) and from compare/ otherwise (index.html),
+  `Cache-Control: no-store`, a server-sent events stream at /__events, and a
+  small script injected into HTML pages that listens to it
+- A build that fails (a half-written CSV, invalid JSON) is reported and the
+  last good build keeps being served; until a first build succeeds, every
+  change rebuilds all sections
+
+Usage:
+  python scripts/generate_catalog_json.py --watch            # http://127.0.0.1:8000/compare/
+  python scripts/catalog_watch.py --port 8080 --debounce 0.3 --no-recommendations
+"""
+import argparse
+import os
+import threading
+import time
+from datetime import datetime
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import generate_catalog_json as gen
+from data_loader import EPOCH_ORDINAL, ROOT_DIR
+
+EVENTS_PATH = "/__events"
+WATCH_DIR = os.path.join(ROOT_DIR, ".cache", "watch", gen.OUT_DIR)
+INTERVAL = 0.1
+DEBOUNCE = 0.2
+HEARTBEAT = 15
+# Fields the similarity index reads, plus the name it reports
+SIMILARITY_FIELDS = ("name", "description", "tags", "category", "models")
+
+LIVE_RELOAD = f"""<script>
+(() => {{
+  const events = new EventSource('{EVENTS_PATH}');
+  events.addEventListener('reload', () => location.reload());
+  events.addEventListener('artifacts', () => {{
+    if (typeof loadSearch === 'function') loadSearch();
+    if (typeof loadRecs === 'function') loadRecs();
+  }});
+  events.addEventListener('build-error', e => console.warn('catalog build failed:', e.data));
+}})();
+</script>
+""".encode("utf-8")
+
+
+def snapshot(data_dir):
+    """{path: (mtime_ns, size)} of the regular files in data_dir"""
+    out = {}
+    try:
+        entries = list(os.scandir(data_dir))
+    except FileNotFoundError:
+        return out
+    for entry in entries:
+        try:
+            if entry.is_file():
+                st = entry.stat()
+                out[entry.path] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            pass  # removed between scandir and stat
+    return out
+
+
+class Broadcaster:
+    """Latest event plus a condition the SSE handlers wait on"""
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.seq = 0
+        self.event = None
+
+    def publish(self, name, data=""):
+        with self.cond:
+            self.seq += 1
+            self.event = (name, str(data).replace("\n", " "))
+            self.cond.notify_all()
+
+    def wait(self, seq, timeout):
+        with self.cond:
+            self.cond.wait_for(lambda: self.seq != seq, timeout)
+            return self.seq, self.event
+
+
+class Handler(SimpleHTTPRequestHandler):
+    broadcaster = None
+    overlay = None  # scratch directory whose files shadow compare/
+
+    def translate_path(self, path):
+        fs_path = super().translate_path(path)
+        if self.overlay:
+            rel = os.path.relpath(fs_path, os.path.join(self.directory, gen.OUT_DIR))
+            built = os.path.join(self.overlay, rel)
+            if not rel.startswith(os.pardir) and os.path.isfile(built):
+                return built
+        return fs_path
+
+    def end_headers(self):
+        self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == EVENTS_PATH:
+            return self.stream_events()
+        if path == "/":
+            self.send_response(302)
+            self.send_header("Location", "/compare/")
+            self.end_headers()
+            return
+        fs_path = self.translate_path(self.path)
+        if path.endswith("/") and os.path.isdir(fs_path):
+            fs_path = os.path.join(fs_path, "index.html")
+        if fs_path.endswith(".html") and os.path.isfile(fs_path):
+            with open(fs_path, "rb") as f:
+                page = f.read()
+            at = page.rfind(b"</body>")
+            page = page[:at] + LIVE_RELOAD + page[at:] if at >= 0 else page + LIVE_RELOAD
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(page)))
+            self.end_headers()
+            self.wfile.write(page)
+            return
+        super().do_GET()
+
+    def stream_events(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "keep-alive")
+        self.end_headers()
+        seq = self.broadcaster.seq
+        try:
+            self.wfile.write(b"retry: 1000\n\n")
+            self.wfile.flush()
+            while True:
+                new_seq, event = self.broadcaster.wait(seq, HEARTBEAT)
+                if new_seq == seq:
+                    self.wfile.write(b": ping\n\n")  # detects closed tabs
+                else:
+                    seq = new_seq
+                    self.wfile.write(f"event: {event[0]}\ndata: {event[1]}\n\n".encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+class IncrementalBuilder:
+    """Keeps the last good sections and rebuilds only the ones whose sources changed"""
+
+    def __init__(self, data_dir=gen.DATA_DIR, out_dir=WATCH_DIR, page_size=50, recommendations=True,
+                 top_k=5, workers=None):
+        self.data_dir = data_dir
+        self.out_dir = out_dir
+        self.page_size = page_size
+        self.recommendations = recommendations
+        self.top_k = top_k
+        self.workers = workers
+        self.sections = {}
+        self.history_day = None
+        self._similar_key = None
+        self._similar = None
+
+    def sections_for(self, paths):
+        """Sections whose source files are among paths (None: every section), plus any not built yet"""
+        if paths is None:
+            return list(gen.SECTIONS)
+        changed = {os.path.normpath(p) for p in paths}
+        # After a failed first build nothing is reusable, so every section is rebuilt
+        return [s for s in gen.SECTIONS if s not in self.sections
+                or changed & {os.path.normpath(p) for p in gen.source_paths(self.data_dir, (s,))}]
+
+    def catalog(self):
+        now = datetime.utcnow()
+        catalog = {"generated_at": now.isoformat() + "Z"}
+        stats = {"reference_day": now.date().toordinal() - EPOCH_ORDINAL}
+        if self.history_day is not None and "frameworks" in self.sections:
+            stats["star_history_day"] = self.history_day
+        for section in gen.SECTIONS:
+            keys, section_stats = self.sections[section]
+            catalog.update(keys)
+            stats.update(section_stats)
+        catalog["stats"] = stats
+        return catalog
+
+    def build_ui(self, sections):
+        """Phase 1: rebuild sections and write the manifest and shards; returns the catalog"""
+        from catalog_shards import write_shards
+
+        rebuilt = {section: gen.build_section(section, self.data_dir) for section in sections}
+        self.sections.update(rebuilt)
+        catalog = self.catalog()
+        write_shards(catalog, self.out_dir, self.page_size, compress=False)
+        return catalog
+
+    def attach_similar(self, frameworks):
+        key = [tuple(fw.get(f, "") for f in SIMILARITY_FIELDS) for fw in frameworks]
+        if key != self._similar_key:
+            gen.attach_similar(frameworks)
+            self._similar_key = key
+            self._similar = [fw.get("similar") for fw in frameworks]
+            return
+        for fw, similar in zip(frameworks, self._similar):
+            if similar is not None:
+                fw["similar"] = similar
+
+    def build_rest(self, catalog, sections):
+        """Phase 2: derived fields and the artifacts the UI fetches lazily"""
+        from arxiv_papers import PAPERS_OUT, build_papers, write_papers
+        from search_index import INDEX_OUT, build_index, write_index
+
+        if "frameworks" in sections:
+            frameworks = catalog["frameworks"]
+            self.attach_similar(frameworks)
+            self.history_day = gen.attach_trends(frameworks, self.data_dir)
+            catalog = self.catalog()
+        gen.write_catalog(catalog, os.path.join(self.out_dir, os.path.basename(gen.CATALOG_OUT)))
+        papers = build_papers(catalog["frameworks"], data_dir=self.data_dir)
+        write_papers(papers, os.path.join(self.out_dir, os.path.basename(PAPERS_OUT)))
+        write_index(build_index(catalog, papers=papers["papers"]),
+                    os.path.join(self.out_dir, os.path.basename(INDEX_OUT)))
+        if self.recommendations:
+            matrix = gen.build_recommendation_matrix(catalog, self.top_k, self.workers)
+            gen.write_recommendations(matrix, os.path.join(self.out_dir, os.path.basename(gen.RECOMMENDATIONS_OUT)))
+        return catalog
+
+
+def watch(data_dir=gen.DATA_DIR, out_dir=WATCH_DIR, host="127.0.0.1", port=8000, interval=INTERVAL,
+          debounce=DEBOUNCE, page_size=50, recommendations=True, top_k=5, workers=None):
+    """Build once, serve the repository root, and rebuild on every settled change in data_dir"""
+    builder = IncrementalBuilder(data_dir, out_dir, page_size, recommendations, top_k, workers)
+    broadcaster = Broadcaster()
+    handler = type("LiveReloadHandler", (Handler,), {"broadcaster": broadcaster, "overlay": os.path.abspath(out_dir)})
+    server = ThreadingHTTPServer((host, port), partial(handler, directory=os.getcwd()))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    def rebuild(changed):
+        sections = builder.sections_for(changed)
+        if not sections:
+            return
+        start = time.perf_counter()
+        try:
+            catalog = builder.build_ui(sections)
+            ui_ms = (time.perf_counter() - start) * 1000
+            broadcaster.publish("reload", catalog["generated_at"])
+            builder.build_rest(catalog, sections)
+        except Exception as e:  # keep serving the last good build
+            print(f"ERROR: rebuild failed: {type(e).__name__}: {e}")
+            broadcaster.publish("build-error", f"{type(e).__name__}: {e}")
+            return
+        broadcaster.publish("artifacts", catalog["generated_at"])
+        total_ms = (time.perf_counter() - start) * 1000
+        stats = catalog["stats"]
+        print(f"[{time.strftime('%H:%M:%S')}] rebuilt {', '.join(sections)}: "
+              f"{stats.get('framework_count', 0)} frameworks, {stats.get('computer_use_count', 0)} computer-use "
+              f"(preview {ui_ms:.0f} ms, all artifacts {total_ms:.0f} ms)")
+
+    seen = snapshot(data_dir)
+    rebuild(None)
+    print(f"Serving http://{host}:{server.server_address[1]}/compare/ -- watching {data_dir}/ (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(interval)
+            current = snapshot(data_dir)
+            if current == seen:
+                continue
+            # Debounce: wait for the burst of writes to settle
+            settled_at = time.monotonic()
+            while time.monotonic() - settled_at < debounce:
+                time.sleep(min(interval, debounce))
+                latest = snapshot(data_dir)
+                if latest != current:
+                    current, settled_at = latest, time.monotonic()
+            changed = {p for p in set(seen) | set(current) if seen.get(p) != current.get(p)}
+            seen = current
+            rebuild(changed)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Rebuild the catalog on data/ edits and serve a live-reloading preview")
+    ap.add_argument("--data-dir", default=gen.DATA_DIR)
+    ap.add_argument("--out-dir", default=WATCH_DIR, help="Scratch directory for the builds (served under /compare/)")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8000)
+    ap.add_argument("--interval", type=float, default=INTERVAL, help="Polling interval (seconds)")
+    ap.add_argument("--debounce", type=float, default=DEBOUNCE, help="Quiet time before rebuilding (seconds)")
+    ap.add_argument("--page-size", type=int, default=50)
+    ap.add_argument("--top-k", type=int, default=5)
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--no-recommendations", action="store_true")
+    args = ap.parse_args()
+    watch(args.data_dir, args.out_dir, args.host, args.port, args.interval, args.debounce, args.page_size,
+          not args.no_recommendations, args.top_k, args.workers)
+
+
+if __name__ == "__main__":
+    main()
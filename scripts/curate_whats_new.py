@@ -7,16 +7,17 @@ Curate a weekly "What's New" digest:
 
 This is a heuristic summarizer; feel free to expand sources.
 """
-import csv
 import os
-import re
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 
 import requests
 
+from data_loader import load_frameworks
+from repo_registry import REGISTRY_PATH, RepoRegistry
+
 CSV_PATH = os.path.join("data", "frameworks.csv")
-GITHUB_API = "https://api.github.com"
+GITHUB_API = os.environ.get("GITHUB_API_URL", "https://api.github.com")
 
 WINDOW_DAYS = int(os.environ.get("CURATION_WINDOW_DAYS", "7"))
 SINCE = datetime.utcnow() - timedelta(days=WINDOW_DAYS)
@@ -26,16 +27,6 @@ HEADERS = {"Accept": "application/vnd.github+json"}
 if TOKEN:
     HEADERS["Authorization"] = f"Bearer {TOKEN}"
 
-REPO_RE = re.compile(r"https?://github.com/([^/]+)/([^/]+)")
-
-
-def parse_repo(url: str):
-    m = REPO_RE.match(url.strip())
-    if not m:
-        return None, None
-    return m.group(1), m.group(2)
-
-
 def repo_events(owner: str, repo: str):
     # fetch releases and recent commits
     rel = requests.get(f"{GITHUB_API}/repos/{owner}/{repo}/releases", headers=HEADERS, timeout=20).json()
@@ -66,22 +57,24 @@ def repo_events(owner: str, repo: str):
 
 
 def main():
-    rows = []
-    if os.path.exists(CSV_PATH):
-        with open(CSV_PATH, newline="", encoding="utf-8") as f:
-            rows = list(csv.DictReader(f))
+    rows = load_frameworks(os.path.dirname(CSV_PATH))
 
     digest = [f"# What’s New (last {WINDOW_DAYS} days)", ""]
 
+    # Query each repo once, at its canonical (post-rename) location
+    registry = RepoRegistry(REGISTRY_PATH)
+    seen = set()
+
     total = 0
     for row in rows:
-        url = row.get("github", "")
-        owner, repo = parse_repo(url)
-        if not owner:
+        key = registry.key_for(row.github)
+        if not key or key in seen:
             continue
+        seen.add(key)
+        owner, repo = registry.full_name(key).split("/", 1)
         events = repo_events(owner, repo)
         if events:
-            name = row.get("name", f"{owner}/{repo}")
+            name = row.name or f"{owner}/{repo}"
             digest.append(f"## {name}")
             for e in events:
                 if e["type"] == "release":
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Facet bitmaps for filtering catalog rows without per-row string scans.
+
+- Framework rows in catalog.json are pre-sorted by stars (descending), so any
+  filtered subset is already in display order
+- Each facet (category, maturity, language, deployment, mcp, license) maps a
+  normalized lowercase value to the set of row positions carrying it;
+  multi-valued cells such as "Cloud/Local" or "Python, TypeScript" count
+  under each value
+- Sets are stored in catalog.json as either a base64 little-endian bitmap
+  ({"b": ...}) or a delta-encoded position list ({"p": [...]}), whichever
+  is smaller; in Python they are ints, so filtering is `&` across facets and
+  `|` within one
+
+Usage:
+  python scripts/facets.py --maturity production --language python --mcp yes
+"""
+import argparse
+import base64
+import json
+import os
+import re
+
+FACETS = ("category", "maturity", "language", "deployment", "mcp", "license")
+SPLIT_RE = re.compile(r"[/,]")
+
+
+def facet_values(row, facet):
+    """Normalized values of one facet for a row"""
+    if facet == "mcp":
+        return ["yes" if "mcp" in (row.get("tags") or "").lower() else "no"]
+    values = [v.strip().lower() for v in SPLIT_RE.split(row.get(facet) or "")]
+    return [v for v in values if v] or ["unknown"]
+
+
+def sort_by_stars(rows):
+    """Stable star-descending order shared by the catalog, facets and UI"""
+    return sorted(rows, key=lambda r: r.get("stars_int", 0) or 0, reverse=True)
+
+
+# Set-bit offsets of every byte value, for fast bitmap -> positions decoding
+_BYTE_BITS = [tuple(j for j in range(8) if b >> j & 1) for b in range(256)]
+
+
+def _encode(positions, size):
+    raw = bytearray((size + 7) // 8)
+    deltas, prev = [], 0
+    for pos in positions:
+        raw[pos >> 3] |= 1 << (pos & 7)
+        deltas.append(pos - prev)
+        prev = pos
+    bitmap = base64.b64encode(bytes(raw)).decode("ascii")
+    if len(json.dumps(deltas)) < len(bitmap):
+        return {"p": deltas}
+    return {"b": bitmap}
+
+
+def _decode(entry, size):
+    if "b" in entry:
+        return int.from_bytes(base64.b64decode(entry["b"]), "little")
+    raw, pos = bytearray((size + 7) // 8), 0
+    for delta in entry["p"]:
+        pos += delta
+        raw[pos >> 3] |= 1 << (pos & 7)
+    return int.from_bytes(raw, "little")
+
+
+def _positions(bits):
+    raw = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    out = []
+    for i, byte in enumerate(raw):
+        if byte:
+            base = i << 3
+            out.extend(base + j for j in _BYTE_BITS[byte])
+    return out
+
+
+def build_facets(rows, facets=FACETS):
+    """{"size": n, "facets": {facet: {value: encoded set}}} for rows in their current order"""
+    lists = {facet: {} for facet in facets}
+    for pos, row in enumerate(rows):
+        for facet in facets:
+            bucket = lists[facet]
+            for value in set(facet_values(row, facet)):
+                bucket.setdefault(value, []).append(pos)
+    return {
+        "size": len(rows),
+        "facets": {facet: {value: _encode(positions, len(rows)) for value, positions in sorted(values.items())}
+                   for facet, values in lists.items()},
+    }
+
+
+class FacetIndex:
+    def __init__(self, data):
+        self.size = data["size"]
+        self.all = (1 << self.size) - 1
+        self.facets = {facet: {value: _decode(entry, self.size) for value, entry in values.items()}
+                       for facet, values in data["facets"].items()}
+
+    @classmethod
+    def from_catalog(cls, catalog):
+        return cls(catalog["facets"])
+
+    def values(self, facet):
+        """{value: row count} for a facet"""
+        return {value: bin(bits).count("1") for value, bits in self.facets.get(facet, {}).items()}
+
+    def bitmap(self, facet, values):
+        """Rows having any of values (a string or list) for facet"""
+        if isinstance(values, str):
+            values = [values]
+        bits = 0
+        for value in values:
+            bits |= self.facets.get(facet, {}).get(value.strip().lower(), 0)
+        return bits
+
+    def filter(self, **selected):
+        """Bitmap of rows matching every given facet; empty selections are ignored"""
+        bits = self.all
+        for facet, values in selected.items():
+            if values:
+                bits &= self.bitmap(facet, values)
+                if not bits:
+                    break
+        return bits
+
+    def rows(self, bits):
+        """Row positions set in bits, ascending (i.e. stars-descending order)"""
+        return _positions(bits)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Filter compare/catalog.json frameworks by facet")
+    ap.add_argument("--catalog", default=os.path.join("compare", "catalog.json"))
+    for facet in FACETS:
+        ap.add_argument(f"--{facet}", nargs="+", help=f"Match any of these {facet} values")
+    ap.add_argument("--values", choices=FACETS, help="List the values of a facet and exit")
+    args = ap.parse_args()
+
+    with open(args.catalog, encoding="utf-8") as f:
+        catalog = json.load(f)
+    index = FacetIndex.from_catalog(catalog)
+    if args.values:
+        for value, count in sorted(index.values(args.values).items(), key=lambda x: -x[1]):
+            print(f"{count:6}  {value}")
+        return
+
+    bits = index.filter(**{facet: getattr(args, facet) for facet in FACETS})
+    frameworks = catalog["frameworks"]
+    for pos in index.rows(bits):
+        fw = frameworks[pos]
+        print(f"{fw.get('stars_int', 0):>8}  {fw.get('name', '')}  ({fw.get('maturity', '')}, {fw.get('language', '')})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,67 @@
 #!/usr/bin/env python3
 """
 Generate a consolidated catalog.json from CSV sources to power the interactive comparison UI.
-- Reads data/frameworks.csv and data/computer_use.csv
+- Reads data/frameworks.csv and data/computer_use.csv through the typed,
+  cached loader (scripts/data_loader.py)
 - Applies maturity_overrides.json if present
-- Outputs compare/catalog.json
+- Sorts rows by stars and emits facet bitmaps (category, maturity, language,
+  deployment, MCP, license) so filtering is bitmap intersection (see
+  scripts/facets.py)
+- Parses last_commit/last_update once into integer epoch days
+  (`last_commit_days`) so recommend.py scores recency with integer compares
+- Attaches star growth trends from data/star_history.json to each framework
+  as `trend` (see scripts/star_history.py; needs NumPy, skipped without it)
+- Emits the top-k most similar frameworks for each framework as `similar`
+  (TF-IDF neighbours, see scripts/similarity.py; needs NumPy)
+- Outputs compare/catalog.json, plus compare/manifest.json and minified,
+  content-hashed, precompressed shards under compare/shards/ that the UI
+  loads page by page (see scripts/catalog_shards.py)
+- Adds the build to the versioned delta feed under compare/feed/ when its
+  content changed: full snapshots plus JSON Patch deltas between consecutive
+  versions, which scripts/catalog_sync.py applies to a local copy (see
+  scripts/catalog_feed.py)
+- Precomputes top-k recommendations for every requirement profile the
+  recommend.py CLI accepts into compare/recommendations.json, so the UI can
+  look them up by index without scoring in the browser
+- Writes compare/papers.json: the arXiv papers cited in research/papers.md
+  and agents_list.csv, with metadata from the committed
+  data/arxiv_metadata.json cache and links to frameworks (no network; see
+  scripts/arxiv_papers.py, which refreshes the cache)
+- Builds a BM25 inverted index over catalog entries, the Markdown pages and
+  the papers into compare/search_index.json (see scripts/search_index.py)
+
+`--watch` rebuilds incrementally on data/ edits and serves compare/ with live
+reload (see scripts/catalog_watch.py).
+
+The builder is importable: `build_catalog()` builds any subset of sections
+in-process and `load_or_build()` returns the on-disk catalog, rebuilding it
+lazily when it is missing or older than its source files.
 """
-import csv, json, os
+import argparse, itertools, json, os
+from datetime import datetime
+
+import data_loader
+from data_loader import EPOCH_ORDINAL
+from facets import build_facets, sort_by_stars
 
 DATA_DIR = "data"
 OUT_DIR = "compare"
 FRAMEWORKS = os.path.join(DATA_DIR, "frameworks.csv")
 COMPUTER_USE = os.path.join(DATA_DIR, "computer_use.csv")
 OVERRIDES = os.path.join(DATA_DIR, "maturity_overrides.json")
+STAR_HISTORY = os.path.join(DATA_DIR, "star_history.json")
 CATALOG_OUT = os.path.join(OUT_DIR, "catalog.json")
+RECOMMENDATIONS_OUT = os.path.join(OUT_DIR, "recommendations.json")
 
-os.makedirs(OUT_DIR, exist_ok=True)
+SECTIONS = ("frameworks", "computer_use")
 
-def read_csv(path):
-    if not os.path.exists(path):
-        return []
-    with open(path, newline="", encoding="utf-8") as f:
-        return list(csv.DictReader(f))
+# Languages offered by the UI recommender; --language is free-form in the CLI
+RECOMMEND_LANGUAGES = ("python", "typescript", "any")
 
-def load_overrides():
-    if not os.path.exists(OVERRIDES):
+def load_overrides(path=OVERRIDES):
+    if not os.path.exists(path):
         return {}
-    with open(OVERRIDES, encoding="utf-8") as f:
+    with open(path, encoding="utf-8") as f:
         data = json.load(f)
     # Map by name for quick lookup
     return {item["name"].strip(): item for item in data.get("overrides", [])}
@@ -41,42 +77,229 @@ def apply_overrides(items, overrides):
                 it["notes"] = (it.get("notes", "") + " | " + ov["notes"]).strip(" |")
     return items
 
-def coerce_int(val):
+def source_paths(data_dir=DATA_DIR, sections=SECTIONS):
+    """Files a catalog built from data_dir depends on"""
+    paths = []
+    if "frameworks" in sections:
+        paths += [os.path.join(data_dir, "frameworks.csv"), os.path.join(data_dir, "maturity_overrides.json"),
+                  os.path.join(data_dir, "star_history.json")]
+    if "computer_use" in sections:
+        paths.append(os.path.join(data_dir, "computer_use.csv"))
+    return paths
+
+def load_frameworks(data_dir=DATA_DIR):
+    # Typed rows -> catalog dicts (CSV strings plus stars_int / last_commit_days)
+    frameworks = [row.to_dict() for row in data_loader.load_frameworks(data_dir)]
+
+    # Apply maturity overrides
+    overrides = load_overrides(os.path.join(data_dir, "maturity_overrides.json"))
+    return apply_overrides(frameworks, overrides)
+
+def load_computer_use(data_dir=DATA_DIR):
+    return [row.to_dict() for row in data_loader.load_computer_use(data_dir)]
+
+def attach_trends(frameworks, data_dir=DATA_DIR):
+    """Set `trend` on frameworks with star history; returns the history's last sample day or None"""
+    path = os.path.join(data_dir, "star_history.json")
+    if not os.path.exists(path):
+        return None
     try:
-        return int(str(val).replace(",", "").strip())
-    except:
+        from star_history import StarHistory, compute_trends
+        history = StarHistory(path)
+        trends = compute_trends(history)
+    except ImportError:
+        print(f"WARN: numpy not installed, skipping trends from {path}")
         return None
+    from repo_registry import RepoRegistry
+    registry = RepoRegistry(os.path.join(data_dir, "repo_registry.json"))
+    for fw in frameworks:
+        key = registry.key_for(fw.get("github", ""))
+        if key in trends:
+            fw["trend"] = trends[key]
+    return max((days[-1] for days, _, _ in history.series.values() if days), default=None)
+
+def attach_similar(frameworks, k=5):
+    """Set `similar` (top-k [{"name", "score"}]) on every framework"""
+    try:
+        from similarity import build_similar
+        similar = build_similar(frameworks, k)
+    except ImportError:
+        print("WARN: numpy not installed, skipping similar frameworks")
+        return
+    for fw, hits in zip(frameworks, similar):
+        fw["similar"] = hits
+
+def build_section(section, data_dir=DATA_DIR):
+    """(catalog keys, stats) of one section, star-sorted and faceted but without `similar` / `trend`"""
+    if section == "frameworks":
+        frameworks = sort_by_stars(load_frameworks(data_dir))
+        return ({"frameworks": frameworks, "facets": build_facets(frameworks)},
+                {"framework_count": len(frameworks), "total_stars": sum(x.get("stars_int", 0) for x in frameworks)})
+    computer_use = sort_by_stars(load_computer_use(data_dir))
+    return {"computer_use": computer_use}, {"computer_use_count": len(computer_use)}
+
+def enrich_frameworks(frameworks, data_dir=DATA_DIR):
+    """Attach `similar` and `trend` in place; returns the star history's last sample day or None"""
+    attach_similar(frameworks)
+    return attach_trends(frameworks, data_dir)
+
+def build_catalog(sections=SECTIONS, data_dir=DATA_DIR):
+    """Build the catalog dict in-process, only for the requested sections"""
+    now = datetime.utcnow()
+    catalog = {"generated_at": now.isoformat() + "Z"}
+    # Default "today" for recency scoring, so results are stable for a given build
+    stats = {"reference_day": now.date().toordinal() - EPOCH_ORDINAL}
+    for section in SECTIONS:
+        if section not in sections:
+            continue
+        keys, section_stats = build_section(section, data_dir)
+        if section == "frameworks":
+            history_day = enrich_frameworks(keys["frameworks"], data_dir)
+            if history_day is not None:
+                stats["star_history_day"] = history_day
+        catalog.update(keys)
+        stats.update(section_stats)
+    catalog["stats"] = stats
+    return catalog
+
+def write_catalog(catalog, path=CATALOG_OUT):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(catalog, f, indent=2)
 
-frameworks = read_csv(FRAMEWORKS)
-computer_use = read_csv(COMPUTER_USE)
-
-# Normalize keys
-for row in frameworks:
-    if "Stars" in row:
-        row["stars"] = row.get("stars") or row["Stars"]
-    if "last_commit" not in row:
-        row["last_commit"] = row.get("last_update", "")
-    row["stars_int"] = coerce_int(row.get("stars", "")) or 0
-
-for row in computer_use:
-    row["stars_int"] = coerce_int(row.get("stars", "")) or 0
-
-# Apply maturity overrides
-overrides = load_overrides()
-frameworks = apply_overrides(frameworks, overrides)
-
-catalog = {
-    "generated_at": __import__("datetime").datetime.utcnow().isoformat() + "Z",
-    "frameworks": frameworks,
-    "computer_use": computer_use,
-    "stats": {
-        "framework_count": len(frameworks),
-        "computer_use_count": len(computer_use),
-        "total_stars": sum(x.get("stars_int", 0) for x in frameworks)
+def is_stale(path=CATALOG_OUT, data_dir=DATA_DIR, sections=SECTIONS):
+    """True if path is missing or older than any of its source files"""
+    if not os.path.exists(path):
+        return True
+    built_at = os.path.getmtime(path)
+    return any(os.path.exists(p) and os.path.getmtime(p) > built_at
+               for p in source_paths(data_dir, sections))
+
+def load_or_build(path=CATALOG_OUT, sections=SECTIONS, data_dir=DATA_DIR):
+    """Return the catalog at path, or build the requested sections in-process if it is missing or stale"""
+    if not is_stale(path, data_dir, sections):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return build_catalog(sections, data_dir)
+
+def recommendation_dims():
+    """Ordered (name, values) axes of the precomputed requirements space.
+
+    budget and team_size are left out because the engine does not score them.
+    """
+    import recommend
+    return [
+        ("use_case", list(recommend.USE_CASES)),
+        ("experience", list(recommend.EXPERIENCE_LEVELS)),
+        ("deployment", list(recommend.DEPLOYMENTS)),
+        ("timeline", list(recommend.TIMELINES)),
+        ("language", list(RECOMMEND_LANGUAGES)),
+        ("mcp", [False, True]),
+        ("computer_use", [False, True]),
+        ("enterprise", [False, True]),
+    ]
+
+def recommendation_profiles(dims):
+    """UserRequirements for every profile of dims, in flat-index order"""
+    from recommend import UserRequirements
+    profiles = []
+    for values in itertools.product(*(v for _, v in dims)):
+        use_case, experience, deployment, timeline, language, mcp, computer_use, enterprise = values
+        profiles.append(UserRequirements(
+            use_case=use_case, experience=experience, deployment=deployment, budget="medium",
+            timeline=timeline, team_size=1, programming_language=language, requires_mcp=mcp,
+            requires_computer_use=computer_use, enterprise_features=enterprise
+        ))
+    return profiles
+
+def build_recommendation_matrix(catalog, top_k=5, workers=None):
+    """Top-k recommendations for every profile, laid out for O(1) lookup.
+
+    A profile's flat index is the mixed-radix number of its value positions in
+    `dims` (first axis most significant); its results are
+    ids[index * top_k:(index + 1) * top_k] (-1 = empty slot), with scores
+    stored as integers x1000. Profiles are scored across processes over a
+    shared-memory copy of the catalog (see shared_scoring.py).
+    """
+    from recommend import FrameworkRecommendationEngine
+    from shared_scoring import SharedScoringPool
+
+    dims = recommendation_dims()
+    frameworks = catalog.get("frameworks", [])
+    engine = FrameworkRecommendationEngine(catalog={"frameworks": frameworks, "stats": catalog.get("stats", {})})
+    with SharedScoringPool(engine, workers, partition="queries") as pool:
+        hits = pool.top_positions([(requirements, top_k, None) for requirements in recommendation_profiles(dims)])
+    ids, scores = [], []
+    for profile_hits in hits:
+        for total, position in profile_hits:
+            ids.append(position)
+            scores.append(round(total * 1000))
+        # Pad short result lists so every profile occupies exactly top_k slots
+        for _ in range(top_k - len(profile_hits)):
+            ids.append(-1)
+            scores.append(0)
+    return {
+        "top_k": top_k,
+        "dims": [{"name": name, "values": values} for name, values in dims],
+        "frameworks": [fw.get("name", "") for fw in frameworks],
+        "ids": ids,
+        "scores": scores,
     }
-}
 
-with open(CATALOG_OUT, "w", encoding="utf-8") as f:
-    json.dump(catalog, f, indent=2)
+def write_recommendations(matrix, path=RECOMMENDATIONS_OUT):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(matrix, f, separators=(",", ":"))
+
+def main():
+    ap = argparse.ArgumentParser(description="Generate compare/catalog.json and derived artifacts")
+    ap.add_argument("--top-k", type=int, default=5, help="Recommendations precomputed per profile")
+    ap.add_argument("--workers", type=int, default=None, help="Processes used for precomputing recommendations")
+    ap.add_argument("--page-size", type=int, default=50, help="Framework rows per UI shard")
+    ap.add_argument("--no-recommendations", action="store_true", help="Skip compare/recommendations.json")
+    ap.add_argument("--watch", action="store_true",
+                    help="Rebuild on data/ edits and serve a live-reloading preview (see catalog_watch.py)")
+    ap.add_argument("--port", type=int, default=8000, help="Preview server port for --watch")
+    args = ap.parse_args()
+
+    if args.watch:
+        from catalog_watch import watch
+        watch(port=args.port, page_size=args.page_size, recommendations=not args.no_recommendations,
+              top_k=args.top_k, workers=args.workers)
+        return
+
+    catalog = build_catalog()
+    write_catalog(catalog, CATALOG_OUT)
+    stats = catalog["stats"]
+    print(f"Wrote {CATALOG_OUT} with {stats['framework_count']} frameworks and {stats['computer_use_count']} computer-use entries")
+
+    from catalog_shards import MANIFEST, write_shards
+    manifest = write_shards(catalog, OUT_DIR, args.page_size)
+    print(f"Wrote {os.path.join(OUT_DIR, MANIFEST)} with {len(manifest['frameworks']['pages'])} framework pages "
+          f"({', '.join(manifest['encodings'])} siblings)")
+
+    from catalog_feed import FEED_DIR, write_feed
+    feed, entry = write_feed(catalog, FEED_DIR)
+    if entry is None:
+        print(f"Feed unchanged at version {feed['latest']} ({FEED_DIR})")
+    else:
+        delta = f", delta {entry['delta_bytes']:,} bytes" if entry.get("delta") else ""
+        print(f"Wrote {FEED_DIR} version {entry['version']} (snapshot {entry['snapshot_bytes']:,} bytes{delta})")
+
+    from arxiv_papers import PAPERS_OUT, build_papers, write_papers
+    papers = build_papers(catalog["frameworks"])
+    write_papers(papers, PAPERS_OUT)
+    print(f"Wrote {PAPERS_OUT} with {papers['count']} papers ({papers['unresolved']} without cached metadata)")
+
+    from search_index import INDEX_OUT, build_index, write_index
+    index = build_index(catalog, papers=papers["papers"])
+    write_index(index, INDEX_OUT)
+    print(f"Wrote {INDEX_OUT} with {len(index['docs'])} documents and {len(index['terms'])} terms")
+
+    if not args.no_recommendations:
+        matrix = build_recommendation_matrix(catalog, args.top_k, args.workers)
+        write_recommendations(matrix, RECOMMENDATIONS_OUT)
+        print(f"Wrote {RECOMMENDATIONS_OUT} with {len(matrix['ids']) // args.top_k} precomputed profiles")
 
-print(f"Wrote {CATALOG_OUT} with {len(frameworks)} frameworks and {len(computer_use)} computer-use entries")
+if __name__ == "__main__":
+    main()
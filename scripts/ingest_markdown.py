@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Bulk-ingest Markdown lists (external awesome-lists, catalog/*.md) into
+candidate frameworks.csv rows for review.
+
+- Every input file is parsed in a process pool, one line at a time, so a
+  worker holds at most one line plus the current table header; only the
+  candidate rows travel back to the parent
+- Markdown tables: columns are mapped by header ("Name"/"Framework",
+  "GitHub"/"Repo"/"Link", "Stars", "Maturity", "Language", "Type"/"Category",
+  "License", "Description"/"Highlights"/...); a row becomes a candidate when
+  one of its cells links to a GitHub repository
+- Bullet lists: every GitHub repository link in an item is a candidate, named
+  by its link text (or the item's bold lead when the text is just "GitHub");
+  a single-link item's trailing text becomes the description
+- Only repository roots count (github.com/owner/repo), not issues,
+  discussions, blobs or github.com/topics/... pages
+- Candidates are deduplicated by normalized "owner/repo" key, resolved through
+  data/repo_registry.json so renamed repos match, against every repo already
+  in data/frameworks.csv, agents_list.csv and computer_use.csv, and against
+  each other; the parent keeps one entry per unique key
+- New repos are written to a staging CSV in frameworks.csv column order
+  (stars and maturity normalized by data_loader), plus the normalized key, a
+  new/known status, the number of mentions across the inputs and the first
+  source file:line, so reviewers can sort, prune and copy rows into
+  data/frameworks.csv; the default path is under the ignored .cache/, so a
+  run never leaves an untracked file in data/ for the catalog build to pick up
+
+Usage:
+  python scripts/ingest_markdown.py                              # catalog/*.md -> .cache/frameworks_staging.csv
+  python scripts/ingest_markdown.py ~/awesome-lists/ README.md --out staging.csv
+  python scripts/ingest_markdown.py lists/ --include-known        # also list repos already catalogued
+"""
+import argparse
+import glob
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from data_loader import DATA_DIR, ROOT_DIR, TABLES, Framework, Table, load_table, write_table
+from repo_registry import REGISTRY_PATH, RepoRegistry, parse_repo
+
+DEFAULT_INPUTS = ["catalog/*.md"]
+STAGING_PATH = os.path.join(ROOT_DIR, ".cache", "frameworks_staging.csv")
+STAGING_FIELDS = list(Framework.FIELDS) + ["key", "status", "mentions", "source"]
+
+# Candidate field -> table header titles (lowercased letters and spaces only), best first
+HEADER_FIELDS = {
+    "name": ("name", "framework", "project", "tool", "agent", "library", "platform", "benchmark"),
+    "github": ("github", "repo", "repository", "source", "code", "code guide", "link", "url"),
+    "stars": ("stars", "github stars", "star count"),
+    "maturity": ("maturity", "status", "stage"),
+    "language": ("language", "languages", "lang"),
+    "category": ("category", "type", "kind"),
+    "license": ("license",),
+    "description": ("description", "summary", "about", "highlights", "primary strength", "specialty", "features",
+                    "notes", "best use case", "use case"),
+}
+# Link texts that say nothing about the project's name
+GENERIC_TEXT = {"github", "repo", "repository", "source", "code", "link", "here", "website", "docs", "homepage",
+                "example", "examples", "guide", "view", "project"}
+# github.com/<owner>/... paths that are site pages, not repositories
+RESERVED_OWNERS = {"about", "apps", "collections", "enterprise", "features", "marketplace", "orgs", "settings",
+                   "sponsors", "topics", "trending", "users", "login", "pricing", "site"}
+
+GITHUB_RE = re.compile(r"github\.com/", re.I)
+FENCE_RE = re.compile(r"^\s*(```|~~~)")
+SEPARATOR_RE = re.compile(r"^\s*\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)*\|?\s*$")
+BULLET_RE = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+(.*)$")
+LINK_RE = re.compile(r"\[([^\]]*)\]\((\S+?)(?:\s+\"[^\"]*\")?\)"       # [text](url "title")
+                     r"|<a\s[^>]*?href=\"([^\"]+)\"[^>]*>(.*?)</a>"     # <a href="url">text</a>
+                     r"|(https?://[^\s)<>|\]]+)", re.I)                  # bare URL
+REPO_ROOT_RE = re.compile(r"^https?://(?:www\.)?github\.com/([\w.-]+)/([\w.-]+?)(?:\.git)?/?(?:#[\w-]*)?$", re.I)
+STARS_RE = re.compile(r"\d[\d,.]*\s*[kK]?")
+BOLD_LEAD_RE = re.compile(r"^\s*(?:\*\*|__)(.+?)(?:\*\*|__)")
+MARKUP_RE = re.compile(r"\*\*|__|`|↗|<[^>]+>")
+LEAD_SEPARATORS = " -–—:|,."
+
+
+def plain(text: str) -> str:
+    """Cell or item text without links, HTML tags, emphasis and stray separators"""
+    if "[" in text or "<" in text or "://" in text:
+        text = LINK_RE.sub(lambda m: m.group(1) if m.group(1) is not None else (m.group(4) or ""), text)
+    return " ".join(MARKUP_RE.sub("", text).split())
+
+
+def repo_root(url: str):
+    """Canonical https://github.com/owner/repo for a repository-root URL, else None"""
+    m = REPO_ROOT_RE.match(url.strip())
+    if not m or m.group(1).lower() in RESERVED_OWNERS:
+        return None
+    return f"https://github.com/{m.group(1)}/{m.group(2)}"
+
+
+def github_links(text: str):
+    """[(link text, repo URL, match end)] for every repository-root link in text"""
+    out = []
+    for m in LINK_RE.finditer(text):
+        url = m.group(2) or m.group(3) or m.group(5)
+        root = repo_root(url)
+        if root:
+            label = m.group(1) if m.group(2) else (m.group(4) if m.group(3) else "")
+            out.append((plain(label or ""), root, m.end()))
+    return out
+
+
+def _name_for(label: str, item: str, url: str) -> str:
+    if label and label.lower() not in GENERIC_TEXT and not label.startswith("http"):
+        return label
+    lead = BOLD_LEAD_RE.match(item)
+    if lead and plain(lead.group(1)).lower() not in GENERIC_TEXT:
+        return plain(lead.group(1)).strip(LEAD_SEPARATORS)
+    return parse_repo(url)[1]
+
+
+def split_cells(line: str) -> list:
+    line = line.strip().replace("\\|", "\0")
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|"):
+        line = line[:-1]
+    return [cell.replace("\0", "|").strip() for cell in line.split("|")]
+
+
+def map_header(cells: list) -> dict:
+    """{field: column index} for a table header; each field takes its best-ranked title"""
+    titles = [" ".join(re.sub(r"[^a-z ]", " ", plain(cell).lower()).split()) for cell in cells]
+    columns, taken = {}, set()
+    for field, ranked in HEADER_FIELDS.items():
+        for title in ranked:
+            if title in titles and titles.index(title) not in taken:
+                columns[field] = titles.index(title)
+                taken.add(columns[field])
+                break
+    return columns
+
+
+def table_candidate(cells: list, columns: dict):
+    """Candidate row dict for a table row, or None if no cell links to a repository"""
+    def cell(field):
+        i = columns.get(field)
+        return cells[i] if i is not None and i < len(cells) else ""
+
+    links = github_links(cell("github")) or [link for c in cells for link in github_links(c)]
+    if not links:
+        return None
+    label, url, _ = links[0]
+    row = {field: plain(cell(field)) for field in HEADER_FIELDS if field not in ("name", "github")}
+    stars = STARS_RE.search(row["stars"])
+    row["stars"] = stars.group(0).replace(" ", "") if stars else ""
+    row["name"] = plain(cell("name")).strip(LEAD_SEPARATORS) or _name_for(label, "", url)
+    row["github"] = url
+    return row
+
+
+def bullet_candidates(item: str) -> list:
+    links = github_links(item)
+    rows = []
+    for label, url, end in links:
+        row = {"name": _name_for(label, item, url), "github": url}
+        if len(links) == 1:
+            row["description"] = plain(item[end:]).strip(LEAD_SEPARATORS)
+        rows.append(row)
+    return rows
+
+
+def parse_file(path: str) -> tuple:
+    """(path, bytes read, [candidate dicts with key and source]) for one Markdown file"""
+    candidates, size = [], 0
+    columns = None
+    previous = ""
+    in_fence = False
+    try:
+        f = open(path, encoding="utf-8", errors="replace")
+    except OSError:
+        return path, 0, []
+    with f:
+        for lineno, line in enumerate(f, 1):
+            size += len(line)
+            if FENCE_RE.match(line):
+                in_fence = not in_fence
+                continue
+            if in_fence:
+                continue
+            found = []
+            if line.lstrip().startswith("|"):
+                if columns is None and SEPARATOR_RE.match(line) and previous.lstrip().startswith("|"):
+                    columns = map_header(split_cells(previous))
+                elif columns is not None and GITHUB_RE.search(line):
+                    row = table_candidate(split_cells(line), columns)
+                    found = [row] if row else []
+            else:
+                columns = None
+                m = BULLET_RE.match(line) if GITHUB_RE.search(line) else None
+                if m:
+                    found = bullet_candidates(m.group(1))
+            for row in found:
+                # github is already the canonical https://github.com/owner/repo spelling
+                row["key"] = row["github"][len("https://github.com/"):].lower()
+                row["source"] = f"{path}:{lineno}"
+                candidates.append(row)
+            previous = line
+    return path, size, candidates
+
+
+def expand_inputs(inputs) -> list:
+    """Markdown files for a list of files, directories (searched recursively) and glob patterns"""
+    paths, seen = [], set()
+    for item in inputs:
+        if os.path.isdir(item):
+            found = sorted(glob.glob(os.path.join(item, "**", "*.md"), recursive=True))
+        else:
+            found = sorted(glob.glob(item)) if glob.has_magic(item) else [item]
+        for path in found:
+            if path not in seen and os.path.isfile(path):
+                seen.add(path)
+                paths.append(path)
+    return paths
+
+
+def known_keys(registry: RepoRegistry, data_dir: str = DATA_DIR) -> dict:
+    """{canonical key: name} for every repo already in the CSV sources"""
+    known = {}
+    for name in TABLES:
+        for row in load_table(os.path.join(data_dir, name)).rows:
+            key = registry.key_for(row.get("github", ""))
+            if key:
+                known.setdefault(key, row.get("name", ""))
+    return known
+
+
+def ingest(paths, registry: RepoRegistry = None, data_dir: str = DATA_DIR, workers: int = None,
+           include_known: bool = False):
+    """(staging Framework rows, stats) for the given Markdown files"""
+    registry = registry or RepoRegistry(REGISTRY_PATH)
+    known = known_keys(registry, data_dir)
+    staged = {}  # canonical key -> candidate dict; the only state that grows with the input
+    stats = {"files": len(paths), "bytes": 0, "candidates": 0, "known": 0, "repeats": 0, "new": 0}
+
+    def results():
+        if workers == 1 or len(paths) < 2:
+            yield from map(parse_file, paths)
+            return
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Ordered results keep the output deterministic; chunking amortizes the IPC per file
+            chunk = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 8))
+            yield from pool.map(parse_file, paths, chunksize=min(chunk, 64))
+
+    for _, size, candidates in results():
+        stats["bytes"] += size
+        for row in candidates:
+            stats["candidates"] += 1
+            key = registry.canonical(row["key"])
+            if key in staged:
+                staged[key]["mentions"] += 1
+                stats["repeats"] += 1
+                # Later mentions fill in columns the first one lacked
+                for field, value in row.items():
+                    if value and not staged[key].get(field):
+                        staged[key][field] = value
+                continue
+            status = "known" if key in known else "new"
+            stats[status] += 1
+            staged[key] = {**row, "key": key, "status": status, "mentions": 1}
+
+    rows = [Framework.from_csv({f: str(c.get(f, "")) for f in STAGING_FIELDS})
+            for c in staged.values() if include_known or c["status"] == "new"]
+    return rows, stats
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Parse Markdown tables and lists into a staging CSV of new frameworks")
+    ap.add_argument("inputs", nargs="*", default=DEFAULT_INPUTS, help="Markdown files, directories or globs")
+    ap.add_argument("--out", default=STAGING_PATH, help="Staging CSV to write")
+    ap.add_argument("--data-dir", default=DATA_DIR)
+    ap.add_argument("--workers", type=int, default=None, help="Parser processes (1 parses in-process)")
+    ap.add_argument("--include-known", action="store_true", help="Also stage repos already in the CSVs")
+    args = ap.parse_args()
+
+    start = time.perf_counter()
+    paths = expand_inputs(args.inputs)
+    rows, stats = ingest(paths, data_dir=args.data_dir, workers=args.workers, include_known=args.include_known)
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    write_table(Table(args.out, STAGING_FIELDS, rows))
+    elapsed = time.perf_counter() - start
+    print(f"Parsed {stats['files']} files ({stats['bytes'] / 1e6:.1f} MB) in {elapsed:.2f}s: "
+          f"{stats['candidates']} GitHub mentions, {stats['new'] + stats['known']} unique repos "
+          f"({stats['known']} already catalogued, {stats['new']} new)")
+    print(f"Wrote {len(rows)} rows to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
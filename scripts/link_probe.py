@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Cheap external-link probe shared by qa_audit.py and qa_maintenance.py.
+
+- Tries HEAD first (no body at all)
+- Many hosts reject or mishandle HEAD (405/403/404/501, resets); those links
+  are re-checked with a GET that asks for a single byte (Range: bytes=0-0)
+  and streams, and the response is closed as soon as the status line and
+  headers are in -- so PDFs and large pages are never downloaded
+- Every result is classified:
+    ok         2xx with no redirects (206 counts: the range was honoured)
+    redirect   2xx after redirects; final_url is where the link should point
+    soft-fail  might work for a person: 401/403/408/429, 5xx, timeouts,
+               connection errors
+    hard-fail  the page is gone or the URL is wrong: 404/410 and other 4xx
+               after both methods, invalid URLs
+
+`http` is anything with requests' request() signature (requests itself, a
+Session, or qa_runner's SharedCache).
+
+Usage:
+  python scripts/link_probe.py https://arxiv.org/pdf/2308.08155 https://example.com
+"""
+import argparse
+
+import requests
+
+OK, REDIRECT, SOFT_FAIL, HARD_FAIL = "ok", "redirect", "soft-fail", "hard-fail"
+OUTCOMES = (OK, REDIRECT, SOFT_FAIL, HARD_FAIL)
+
+# HEAD answers that may just mean "HEAD not supported here": confirm with a ranged GET
+HEAD_FALLBACK = {400, 403, 404, 405, 406, 409, 410, 429, 500, 501, 502, 503}
+SOFT_STATUSES = {401, 403, 408, 429}
+RANGE_HEADERS = {"Range": "bytes=0-0", "Accept-Encoding": "identity"}
+
+
+def classify(status, redirects=0):
+    if isinstance(status, int):
+        if 200 <= status < 300:
+            return REDIRECT if redirects else OK
+        if status in SOFT_STATUSES or status >= 500:
+            return SOFT_FAIL
+        return HARD_FAIL
+    return SOFT_FAIL
+
+
+def _result(url, method, response=None, error=None, outcome=None):
+    if response is None:
+        return {"url": url, "method": method, "status": error, "redirects": 0, "final_url": url,
+                "outcome": outcome or SOFT_FAIL}
+    redirects = len(response.history)
+    return {"url": url, "method": method, "status": response.status_code, "redirects": redirects,
+            "final_url": response.url, "outcome": classify(response.status_code, redirects)}
+
+
+def probe(url, http=requests, timeout=10):
+    """HEAD, then a one-byte streamed GET if HEAD was refused; returns a result dict with an `outcome`"""
+    try:
+        response = http.request("HEAD", url, timeout=timeout, allow_redirects=True)
+        if response.status_code not in HEAD_FALLBACK:
+            return _result(url, "HEAD", response)
+    except requests.exceptions.Timeout:
+        return _result(url, "HEAD", error="TIMEOUT")
+    except (requests.exceptions.InvalidURL, requests.exceptions.MissingSchema,
+            requests.exceptions.InvalidSchema) as e:
+        return _result(url, "HEAD", error=f"ERROR: {str(e)[:100]}", outcome=HARD_FAIL)
+    except requests.exceptions.RequestException:
+        pass  # resets and protocol errors on HEAD: the GET below decides
+
+    try:
+        response = http.request("GET", url, timeout=timeout, allow_redirects=True, stream=True,
+                                headers=RANGE_HEADERS)
+    except requests.exceptions.Timeout:
+        return _result(url, "GET", error="TIMEOUT")
+    except requests.exceptions.RequestException as e:
+        return _result(url, "GET", error=f"ERROR: {str(e)[:100]}")
+    # Headers are all we need; closing drops the connection before any body is read
+    response.close()
+    return _result(url, "GET", response)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Probe links with HEAD and a ranged-GET fallback")
+    ap.add_argument("urls", nargs="+")
+    ap.add_argument("--timeout", type=float, default=10)
+    args = ap.parse_args()
+    icons = {OK: "✅", REDIRECT: "↪️ ", SOFT_FAIL: "⚠️ ", HARD_FAIL: "❌"}
+    for url in args.urls:
+        r = probe(url, timeout=args.timeout)
+        extra = f" -> {r['final_url']}" if r["outcome"] == REDIRECT else ""
+        print(f"{icons[r['outcome']]} {r['outcome']:9} {r['method']:4} {r['status']}  {url}{extra}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,10 @@
 """
 Repository Quality Assurance (QA) Audit Script
 Comprehensive validation of all content before publication
+
+Run standalone for a sequential audit, or through scripts/qa_runner.py, which
+injects a shared caching HTTP client, a parallel item map and issue streaming.
 """
-import csv
 import json
 import os
 import re
@@ -12,8 +14,34 @@ from urllib.parse import urlparse
 from datetime import datetime
 import time
 
+from arxiv_papers import MetadataCache
+from arxiv_papers import arxiv_id as parse_arxiv_id
+from data_loader import load_table
+from link_probe import HARD_FAIL, SOFT_FAIL, probe
+
+GITHUB_API = os.environ.get("GITHUB_API_URL", "https://api.github.com")
+
+def sequential_map(delay):
+    """map() that sleeps `delay` seconds after each item (simple rate limiting)"""
+    def run(fn, items):
+        results = []
+        for item in items:
+            results.append(fn(item))
+            time.sleep(delay)
+        return results
+    return run
+
+def read_file(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
 class RepoQAValidator:
-    def __init__(self):
+    def __init__(self, http=None, map_items=None, read_text=None, on_issue=None):
+        # Hooks default to plain sequential behaviour; qa_runner.py swaps in shared/concurrent ones
+        self.http = http or requests
+        self.map_items = map_items or sequential_map(0.5)
+        self.read_text = read_text or read_file
+        self.on_issue = on_issue
         self.issues = []
         self.warnings = []
         self.stats = {
@@ -38,36 +66,34 @@ class RepoQAValidator:
             self.issues.append(issue)
         else:
             self.warnings.append(issue)
+        if self.on_issue:
+            self.on_issue(issue)
     
     def validate_http_link(self, url, timeout=10):
-        """Validate HTTP links return 200"""
-        try:
-            response = requests.head(url, timeout=timeout, allow_redirects=True)
-            return response.status_code == 200, response.status_code
-        except Exception as e:
-            return False, str(e)
+        """Probe a link: HEAD, then a one-byte GET if HEAD is refused (see link_probe.py)"""
+        return probe(url, self.http, timeout)
     
-    def check_arxiv_paper(self, arxiv_url):
-        """Specific validation for arXiv papers"""
+    def check_arxiv_paper(self, arxiv_url, papers=None):
+        """Specific validation for arXiv papers.
+
+        `papers` is a MetadataCache (scripts/arxiv_papers.py) that already
+        fetched the ID in a batch; without one the ID is queried on its own.
+        """
         if "arxiv.org" not in arxiv_url.lower():
             return True, "Not arXiv"
-            
-        # Extract arXiv ID
-        match = re.search(r'arxiv\.org/(?:abs|pdf)/(\d{4}\.\d{4,5})', arxiv_url)
-        if not match:
+
+        arxiv_id = parse_arxiv_id(arxiv_url)
+        if not arxiv_id:
             return False, "Invalid arXiv URL format"
-        
-        arxiv_id = match.group(1)
-        
-        # Check if paper exists via arXiv API
-        api_url = f"http://export.arxiv.org/api/query?id_list={arxiv_id}"
-        try:
-            response = requests.get(api_url, timeout=10)
-            if "No papers found" in response.text:
-                return False, f"arXiv paper {arxiv_id} not found"
+
+        if papers is None:
+            papers = MetadataCache(None)
+            papers.fetch([arxiv_id], http=self.http, delay=0, timeout=10)
+        if arxiv_id in papers.papers:
             return True, f"arXiv {arxiv_id} validated"
-        except Exception as e:
-            return False, f"arXiv API error: {e}"
+        if arxiv_id in papers.missing:
+            return False, f"arXiv paper {arxiv_id} not found"
+        return False, f"arXiv API error: {papers.errors.get(arxiv_id, 'no response')}"
     
     def check_github_repo(self, github_url):
         """Validate GitHub repos exist and get basic info"""
@@ -80,10 +106,10 @@ class RepoQAValidator:
             return False, "Invalid GitHub URL format"
         
         owner, repo = match.groups()
-        api_url = f"https://api.github.com/repos/{owner}/{repo}"
+        api_url = f"{GITHUB_API}/repos/{owner}/{repo}"
         
         try:
-            response = requests.get(api_url, timeout=10)
+            response = self.http.get(api_url, timeout=10)
             if response.status_code == 404:
                 return False, f"GitHub repo {owner}/{repo} not found"
             elif response.status_code != 200:
@@ -105,32 +131,36 @@ class RepoQAValidator:
             self.log_issue("ERROR", "CONTENT", f"Papers file not found: {papers_file}")
             return
         
-        with open(papers_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = self.read_text(papers_file)
         
         # Find all arXiv links
         arxiv_links = re.findall(r'https?://arxiv\.org/[^\s\)]+', content)
         print(f"Found {len(arxiv_links)} arXiv links to validate...")
         
+        # One batched, rate-limited API query per BATCH_SIZE IDs instead of a request per link
+        papers = MetadataCache(None)
+        papers.fetch(sorted({pid for pid in map(parse_arxiv_id, arxiv_links) if pid}), http=self.http, timeout=10)
+        print(f"Queried the arXiv API in {papers.requests_made} requests")
         for i, url in enumerate(arxiv_links):
-            print(f"  Checking {i+1}/{len(arxiv_links)}: {url[:60]}...")
-            valid, info = self.check_arxiv_paper(url)
+            valid, info = self.check_arxiv_paper(url, papers)
+            print(f"  Checked {i+1}/{len(arxiv_links)}: {url[:60]}...")
             if not valid:
                 self.log_issue("ERROR", "LINK", f"Invalid arXiv paper: {url} - {info}", papers_file)
             self.stats["papers_checked"] += 1
-            time.sleep(0.5)  # Rate limiting
         
         # Find all other HTTP links
         other_links = re.findall(r'https?://(?!arxiv\.org)[^\s\)]+', content)
         print(f"Found {len(other_links)} other links to validate...")
         
-        for i, url in enumerate(other_links[:20]):  # Limit to first 20 for speed
-            print(f"  Checking {i+1}: {url[:60]}...")
-            valid, status = self.validate_http_link(url)
-            if not valid:
-                self.log_issue("WARNING", "LINK", f"Link may be broken: {url} - {status}", papers_file)
+        other_links = other_links[:20]  # Limit to first 20 for speed
+        results = self.map_items(self.validate_http_link, other_links)
+        for i, (url, result) in enumerate(zip(other_links, results)):
+            print(f"  Checked {i+1}: {url[:60]}... {result['outcome']}")
+            if result["outcome"] == HARD_FAIL:
+                self.log_issue("WARNING", "LINK", f"Link is broken: {url} - {result['status']}", papers_file)
+            elif result["outcome"] == SOFT_FAIL:
+                self.log_issue("INFO", "LINK", f"Link may be broken: {url} - {result['status']}", papers_file)
             self.stats["links_validated"] += 1
-            time.sleep(0.5)
     
     def validate_frameworks_csv(self, csv_file="data/frameworks.csv"):
         """Validate frameworks CSV for duplicates and broken links"""
@@ -141,9 +171,7 @@ class RepoQAValidator:
         seen_names = set()
         seen_github = set()
         
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        rows = load_table(csv_file).rows
         
         print(f"Validating {len(rows)} frameworks...")
         
@@ -162,18 +190,18 @@ class RepoQAValidator:
             else:
                 seen_github.add(github)
             
-            # Validate GitHub repos (sample)
-            if github and i < 10:  # Check first 10 for speed
-                print(f"  Checking framework {i+1}: {name}")
-                valid, info = self.check_github_repo(github)
-                if not valid:
-                    self.log_issue("ERROR", "LINK", f"Invalid GitHub repo for {name}: {info}", csv_file, i+2)
-                elif isinstance(info, dict) and info.get("archived"):
-                    self.log_issue("WARNING", "CONTENT", f"Framework {name} repo is archived", csv_file, i+2)
-            
             self.stats["frameworks_checked"] += 1
-            if i < 10:
-                time.sleep(0.5)
+        
+        # Validate GitHub repos (sample): first 10 rows, after the local checks
+        sample = [(i, row) for i, row in enumerate(rows[:10]) if row.get("github", "").strip()]
+        results = self.map_items(self.check_github_repo, [row.get("github", "").strip() for _, row in sample])
+        for (i, row), (valid, info) in zip(sample, results):
+            name = row.get("name", "").strip()
+            print(f"  Checked framework {i+1}: {name}")
+            if not valid:
+                self.log_issue("ERROR", "LINK", f"Invalid GitHub repo for {name}: {info}", csv_file, i+2)
+            elif isinstance(info, dict) and info.get("archived"):
+                self.log_issue("WARNING", "CONTENT", f"Framework {name} repo is archived", csv_file, i+2)
     
     def check_date_staleness(self):
         """Check for outdated 'Last updated' notices"""
@@ -202,8 +230,7 @@ class RepoQAValidator:
         
         for file_path in files_to_check:
             if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = self.read_text(file_path)
                 
                 for pattern in stale_patterns:
                     matches = re.finditer(pattern, content, re.IGNORECASE)
@@ -9,33 +9,49 @@ This script performs comprehensive maintenance checks:
 - Generates maintenance report
 
 Usage: python scripts/qa_maintenance.py
+
+scripts/qa_runner.py runs these checks alongside qa_audit.py with shared
+caches; the hooks on QAMaintenance (http, map_items, read_text, on_issue)
+exist for that.
 """
 
 import requests
 import re
 import json
-import time
 from urllib.parse import urlparse
 from datetime import datetime
 import os
 from pathlib import Path
 
+from link_probe import OK, REDIRECT, SOFT_FAIL, probe
+from qa_audit import read_file, sequential_map
+
+GITHUB_API = os.environ.get("GITHUB_API_URL", "https://api.github.com")
+
 class QAMaintenance:
-    def __init__(self):
-        self.base_dir = Path(__file__).parent.parent
+    def __init__(self, http=None, map_items=None, read_text=None, on_issue=None, base_dir=None):
+        self.http = http or requests
+        self.map_items = map_items or sequential_map(0.5)
+        self.read_text = read_text or read_file
+        self.on_issue = on_issue
+        self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent.parent
         self.report = {
             "timestamp": datetime.now().isoformat(),
-            "links": {"working": [], "broken": [], "redirected": []},
+            "links": {"working": [], "broken": [], "redirected": [], "unverified": []},
             "stars": {},
             "issues": []
         }
         
+    def add_issue(self, message):
+        self.report["issues"].append(message)
+        if self.on_issue:
+            self.on_issue({"severity": "WARNING", "category": "MAINTENANCE", "message": message, "file": "", "line": 0})
+
     def extract_urls_from_file(self, file_path):
         """Extract all URLs from a markdown file"""
         urls = []
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self.read_text(str(file_path))
                 
             # Find URLs in markdown links
             markdown_links = re.findall(r'\[([^\]]+)\]\(([^\)]+)\)', content)
@@ -50,23 +66,13 @@ class QAMaintenance:
                     urls.append(("HTML link", url, str(file_path)))
                     
         except FileNotFoundError:
-            self.report["issues"].append(f"File not found: {file_path}")
+            self.add_issue(f"File not found: {file_path}")
             
         return urls
         
     def check_url_status(self, url, timeout=10):
-        """Check if a URL is accessible"""
-        try:
-            response = requests.head(url, timeout=timeout, allow_redirects=True)
-            return {
-                "status": response.status_code,
-                "redirects": len(response.history),
-                "final_url": response.url
-            }
-        except requests.exceptions.Timeout:
-            return {"status": "TIMEOUT", "redirects": 0, "final_url": url}
-        except requests.exceptions.RequestException as e:
-            return {"status": f"ERROR: {str(e)[:100]}", "redirects": 0, "final_url": url}
+        """Check if a URL is accessible: HEAD, then a one-byte GET if HEAD is refused (see link_probe.py)"""
+        return probe(url, self.http, timeout)
             
     def get_github_stars(self, github_url):
         """Get current star count for GitHub repositories"""
@@ -82,7 +88,7 @@ class QAMaintenance:
         # Remove any fragments or query parameters
         repo = repo.split('#')[0].split('?')[0]
         
-        api_url = f"https://api.github.com/repos/{owner}/{repo}"
+        api_url = f"{GITHUB_API}/repos/{owner}/{repo}"
         
         try:
             # Add GitHub token if available
@@ -90,7 +96,7 @@ class QAMaintenance:
             if os.getenv('GITHUB_TOKEN'):
                 headers['Authorization'] = f"token {os.getenv('GITHUB_TOKEN')}"
                 
-            response = requests.get(api_url, timeout=10, headers=headers)
+            response = self.http.get(api_url, timeout=10, headers=headers)
             if response.status_code == 200:
                 data = response.json()
                 return {
@@ -125,31 +131,29 @@ class QAMaintenance:
                 urls = self.extract_urls_from_file(full_path)
                 all_urls.extend(urls)
             else:
-                self.report["issues"].append(f"Missing file: {file_path}")
+                self.add_issue(f"Missing file: {file_path}")
         
         print(f"   Found {len(all_urls)} URLs to check")
         
-        for i, (text, url, source) in enumerate(all_urls[:20]):  # Limit for demo
+        all_urls = all_urls[:20]  # Limit for demo
+        results = self.map_items(self.check_url_status, [url for _, url, _ in all_urls])
+        for i, ((text, url, source), result) in enumerate(zip(all_urls, results)):
             print(f"   {i+1:2d}. {url[:50]:<50}", end=" | ")
             
-            result = self.check_url_status(url)
-            
-            if isinstance(result["status"], int):
-                if result["status"] == 200:
-                    self.report["links"]["working"].append({"url": url, "source": source})
-                    if result["redirects"] > 0:
-                        self.report["links"]["redirected"].append({"url": url, "final": result["final_url"]})
-                        print(f"✅ OK ({result['redirects']} redirects)")
-                    else:
-                        print("✅ OK")
+            if result["outcome"] in (OK, REDIRECT):
+                self.report["links"]["working"].append({"url": url, "source": source})
+                if result["outcome"] == REDIRECT:
+                    self.report["links"]["redirected"].append({"url": url, "final": result["final_url"]})
+                    print(f"✅ OK ({result['redirects']} redirects)")
                 else:
-                    self.report["links"]["broken"].append({"url": url, "status": result["status"], "source": source})
-                    print(f"❌ {result['status']}")
+                    print("✅ OK")
+            elif result["outcome"] == SOFT_FAIL:
+                # Blocked, rate-limited or temporarily down: worth a look, not proof the link is dead
+                self.report["links"]["unverified"].append({"url": url, "status": result["status"], "source": source})
+                print(f"⚠️ {result['status']}")
             else:
                 self.report["links"]["broken"].append({"url": url, "status": result["status"], "source": source})
                 print(f"❌ {result['status']}")
-                
-            time.sleep(0.5)  # Rate limiting
             
     def update_star_counts(self):
         """Update GitHub star counts in documentation"""
@@ -172,9 +176,8 @@ class QAMaintenance:
             "https://github.com/stanfordnlp/dspy"
         ]
         
-        for repo_url in key_repos:
+        for repo_url, stars_data in zip(key_repos, self.map_items(self.get_github_stars, key_repos)):
             repo_name = repo_url.split('/')[-1]
-            stars_data = self.get_github_stars(repo_url)
             
             if stars_data and "error" not in stars_data:
                 self.report["stars"][repo_name] = stars_data
@@ -182,14 +185,12 @@ class QAMaintenance:
                 
                 # Check if archived
                 if stars_data.get("archived"):
-                    self.report["issues"].append(f"Repository archived: {repo_name}")
+                    self.add_issue(f"Repository archived: {repo_name}")
                     
             else:
                 error = stars_data.get("error", "Unknown error") if stars_data else "No data"
                 print(f"   {repo_name:20} | ERROR: {error}")
-                self.report["issues"].append(f"Cannot fetch stars for {repo_name}: {error}")
-                
-            time.sleep(0.5)  # Rate limiting
+                self.add_issue(f"Cannot fetch stars for {repo_name}: {error}")
     
     def generate_report(self):
         """Generate comprehensive maintenance report"""
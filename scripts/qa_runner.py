@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Concurrent QA orchestrator for qa_audit.py and qa_maintenance.py.
+
+- Runs every QA check (stale dates, frameworks CSV, research papers,
+  maintenance link check, star lookups) as a node in a small task graph;
+  file-parsing nodes run first and checks start as soon as their inputs are
+  ready, so local checks never wait behind network ones
+- Checks share one cache: each file is read once, and each (method, URL) is
+  requested once per run -- concurrent callers of the same URL wait on the
+  same in-flight request (the GitHub repo lookups of both scripts overlap)
+- Per-item network work inside a check (one request per link or repo) is
+  spread over a shared I/O pool with a per-host concurrency cap, so total
+  time is bounded by the slowest check rather than the sum of all requests
+- The arXiv API host gets one request at a time, DELAY seconds apart (its
+  usage guideline); arXiv IDs are validated in batched queries through
+  scripts/arxiv_papers.py rather than one request per link
+- Issues are streamed to stdout as they are found; one run writes both
+  QA_AUDIT_REPORT.md and qa_report.json
+
+Usage:
+  python scripts/qa_runner.py
+  python scripts/qa_runner.py --io-workers 16 --per-host 4 --verbose
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from urllib.parse import urlparse
+
+from arxiv_papers import DELAY as ARXIV_DELAY
+from qa_audit import RepoQAValidator, read_file
+from qa_maintenance import QAMaintenance
+
+AUDIT_REPORT = "QA_AUDIT_REPORT.md"
+JSON_REPORT = "qa_report.json"
+
+DATE_FILES = ["README.md", "research/papers.md", "catalog/coding-agents-deep-dive.md",
+              "patterns/multi-agent-patterns.md", "guides/enterprise-deployment.md", "catalog/evaluation.md"]
+LINK_FILES = ["README.md", "catalog/use-cases.md", "catalog/use-cases-crewai.md", "catalog/use-cases-autogen.md",
+              "catalog/use-cases-agno.md", "catalog/use-cases-langgraph.md"]
+FRAMEWORKS_CSV = "data/frameworks.csv"
+PAPERS_FILE = "research/papers.md"
+# Hosts with their own (concurrent requests, seconds between request starts)
+HOST_LIMITS = {"export.arxiv.org": (1, ARXIV_DELAY)}
+
+
+class SharedCache:
+    """Thread-safe file and HTTP cache shared by every check in a run.
+
+    Exposes get()/head() like the requests module, so it can be handed to the
+    validators as their `http` hook.
+    """
+
+    def __init__(self, per_host=4, host_limits=HOST_LIMITS):
+        self._lock = threading.Lock()
+        self._files = {}
+        self._responses = {}  # (method, url, params, range) -> Future
+        self._per_host = per_host
+        self._host_limits = host_limits
+        self._host_slots = {}
+        self._next_at = {}  # host -> earliest monotonic time of its next request
+        self._local = threading.local()
+        self.stats = {"requests": 0, "cache_hits": 0, "files_read": 0}
+
+    def read_text(self, path):
+        with self._lock:
+            fut = self._files.get(path)
+            owner = fut is None
+            if owner:
+                fut = self._files[path] = Future()
+                self.stats["files_read"] += 1
+        if owner:
+            try:
+                fut.set_result(read_file(path))
+            except Exception as e:
+                fut.set_exception(e)
+        return fut.result()
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            import requests
+            session = self._local.session = requests.Session()
+        return session
+
+    def _slot(self, host):
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                limit = self._host_limits.get(host, (self._per_host, 0))[0]
+                slot = self._host_slots[host] = threading.Semaphore(limit)
+        return slot
+
+    def _send(self, method, url, **kwargs):
+        host = urlparse(url).netloc
+        with self._slot(host):
+            spacing = self._host_limits.get(host, (0, 0))[1]
+            if spacing:
+                # Spaced hosts have a single slot, so _next_at is only touched by its holder
+                time.sleep(max(self._next_at.get(host, 0) - time.monotonic(), 0))
+                self._next_at[host] = time.monotonic() + spacing
+            return self._session().request(method, url, **kwargs)
+
+    def request(self, method, url, **kwargs):
+        # Query parameters are part of the key; a ranged probe GET must not stand in for a full GET
+        params = tuple(sorted((kwargs.get("params") or {}).items()))
+        key = (method.upper(), url, params, (kwargs.get("headers") or {}).get("Range"))
+        with self._lock:
+            fut = self._responses.get(key)
+            owner = fut is None
+            if owner:
+                fut = self._responses[key] = Future()
+                self.stats["requests"] += 1
+            else:
+                self.stats["cache_hits"] += 1
+        if owner:
+            try:
+                fut.set_result(self._send(method, url, **kwargs))
+            except Exception as e:
+                fut.set_exception(e)
+        return fut.result()
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+
+class TaskGraph:
+    def __init__(self):
+        self.tasks = {}  # name -> (fn, deps)
+
+    def add(self, name, fn, deps=()):
+        self.tasks[name] = (fn, tuple(deps))
+
+    def run(self, workers=None, on_error=None):
+        """Run tasks as their dependencies finish; returns {name: seconds}.
+
+        A failing task is reported through on_error(name, exc) and still
+        counts as finished, so its dependents run and handle missing inputs.
+        """
+        pending = dict(self.tasks)
+        done, running, timings = set(), {}, {}
+
+        def timed(name, fn):
+            start = time.perf_counter()
+            try:
+                fn()
+            finally:
+                timings[name] = time.perf_counter() - start
+
+        with ThreadPoolExecutor(max_workers=workers or len(self.tasks) or 1) as pool:
+            while pending or running:
+                for name in [n for n, (_, deps) in pending.items() if all(d in done for d in deps)]:
+                    fn, _ = pending.pop(name)
+                    running[pool.submit(timed, name, fn)] = name
+                if not running:
+                    raise RuntimeError(f"unsatisfiable dependencies: {sorted(pending)}")
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    name = running.pop(fut)
+                    done.add(name)
+                    if fut.exception() and on_error:
+                        on_error(name, fut.exception())
+        return timings
+
+
+def build_graph(audit, maintenance, cache):
+    graph = TaskGraph()
+
+    def reader(path):
+        def read():
+            if os.path.exists(path):
+                cache.read_text(path)
+        return read
+
+    for path in sorted(set(DATE_FILES + LINK_FILES + [PAPERS_FILE])):
+        graph.add(f"read:{path}", reader(path))
+
+    graph.add("audit:dates", audit.check_date_staleness, [f"read:{p}" for p in DATE_FILES])
+    # The CSV goes through data_loader (typed rows, parsed-table cache), not the text cache
+    graph.add("audit:frameworks", lambda: audit.validate_frameworks_csv(FRAMEWORKS_CSV))
+    graph.add("audit:papers", lambda: audit.validate_research_papers(PAPERS_FILE), [f"read:{PAPERS_FILE}"])
+    graph.add("maintenance:links", maintenance.check_all_links, [f"read:{p}" for p in LINK_FILES])
+    graph.add("maintenance:stars", maintenance.update_star_counts)
+    return graph
+
+
+def maintenance_section(report):
+    links = report["links"]
+    lines = ["", "## Maintenance",
+             f"- Links checked: {len(links['working']) + len(links['broken']) + len(links['unverified'])} "
+             f"({len(links['broken'])} broken, {len(links['unverified'])} unverified, "
+             f"{len(links['redirected'])} redirected)",
+             f"- Repositories with star data: {len(report['stars'])}"]
+    for link in links["broken"][:10]:
+        lines.append(f"- ❌ {link['url']} ({link['status']}) in `{link['source']}`")
+    for issue in report["issues"]:
+        lines.append(f"- ⚠️ {issue}")
+    return "\n".join(lines) + "\n"
+
+
+def timings_section(timings, wall):
+    lines = ["", f"## Check Timings (wall {wall:.2f}s)"]
+    for name, seconds in sorted(timings.items(), key=lambda x: -x[1]):
+        if not name.startswith("read:"):
+            lines.append(f"- {name}: {seconds:.2f}s")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Run all QA checks concurrently and write both reports")
+    ap.add_argument("--io-workers", type=int, default=16, help="Concurrent network requests overall")
+    ap.add_argument("--per-host", type=int, default=4, help="Concurrent requests per host")
+    ap.add_argument("--verbose", action="store_true", help="Show per-item progress from the checks")
+    args = ap.parse_args()
+
+    out = sys.stdout
+    out_lock = threading.Lock()
+
+    def emit(issue):
+        icon = "❌" if issue["severity"] == "ERROR" else "⚠️ "
+        where = f" ({issue['file']}:{issue['line']})" if issue.get("file") else ""
+        with out_lock:
+            print(f"{icon} [{issue['category']}] {issue['message']}{where}", file=out, flush=True)
+
+    cache = SharedCache(per_host=args.per_host)
+    io_pool = ThreadPoolExecutor(max_workers=args.io_workers)
+    map_items = lambda fn, items: list(io_pool.map(fn, items))  # noqa: E731
+    audit = RepoQAValidator(http=cache, map_items=map_items, read_text=cache.read_text, on_issue=emit)
+    maintenance = QAMaintenance(http=cache, map_items=map_items, read_text=cache.read_text, on_issue=emit,
+                                base_dir=".")
+
+    def on_error(name, exc):
+        audit.log_issue("ERROR", "RUNNER", f"QA task {name} failed: {exc}")
+
+    print("🔍 Running QA checks concurrently...", flush=True)
+    start = time.perf_counter()
+    quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    try:
+        with quiet:
+            timings = build_graph(audit, maintenance, cache).run(on_error=on_error)
+    finally:
+        io_pool.shutdown()
+    wall = time.perf_counter() - start
+
+    report = audit.generate_report() + maintenance_section(maintenance.report) + timings_section(timings, wall)
+    with open(AUDIT_REPORT, "w", encoding="utf-8") as f:
+        f.write(report)
+    with open(JSON_REPORT, "w", encoding="utf-8") as f:
+        json.dump({**maintenance.report,
+                   "audit": {"errors": audit.issues, "warnings": audit.warnings, "stats": audit.stats},
+                   "timings": {name: round(s, 3) for name, s in timings.items()},
+                   "http": cache.stats,
+                   "wall_s": round(wall, 3),
+                   "finished": datetime.now().isoformat()}, f, indent=2)
+
+    print(f"\n✅ QA run complete in {wall:.2f}s ({cache.stats['requests']} requests, "
+          f"{cache.stats['cache_hits']} served from cache)")
+    print(f"📊 Found {len(audit.issues)} errors, {len(audit.warnings)} warnings, "
+          f"{len(maintenance.report['issues'])} maintenance issues")
+    print(f"📄 Reports saved to: {AUDIT_REPORT}, {JSON_REPORT}")
+    if audit.issues:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
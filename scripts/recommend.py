@@ -3,230 +3,254 @@
 Framework Recommendation Engine
 
 Scores frameworks based on user requirements and suggests best matches.
-Reads from compare/catalog.json or generates it if missing.
+Reads from compare/catalog.json, or builds the frameworks section in-process
+if the catalog is missing or older than data/*.csv.
+
+Startup is kept cheap for shell loops: heavy imports are deferred, the loaded
+catalog -- with the parsed scoring rules and the per-framework features
+compiled from them -- is cached in a marshal snapshot next to catalog.json
+(keyed by a hash of the catalog and the data/ files), so a warm start reads
+no JSON and never imports data_loader, and --batch scores many NDJSON
+profiles from stdin in one process.
+
+Scoring rules (weights, thresholds, lookup tables, penalties, keyword maps)
+live in data/scoring_rules.json and are compiled by scoring_rules.py into
+per-catalog lookup columns when the engine loads. --skyline lists the Pareto
+front over chosen component scores instead of a weighted top-k.
+--batch --workers N scores blocks of profiles across N processes over a
+shared-memory copy of the catalog (shared_scoring.py), with identical output.
 """
-import json
+from __future__ import annotations
+
+import marshal
 import os
-from typing import Dict, List, Any, Tuple
-from dataclasses import dataclass
-import argparse
+import time
+import zlib
+
+USE_CASES = ("research", "coding", "multi_agent", "enterprise", "prototype")
+EXPERIENCE_LEVELS = ("beginner", "intermediate", "advanced")
+DEPLOYMENTS = ("local", "cloud", "hybrid")
+BUDGETS = ("low", "medium", "high")
+TIMELINES = ("hours", "days", "weeks")
+
+# Default Pareto criteria when the rule set has no "skyline" section
+SKYLINE_CRITERIA = ("maturity", "community", "maintenance", "requirements")
 
-@dataclass
 class UserRequirements:
-    use_case: str  # "research", "coding", "multi_agent", "enterprise", "prototype"
-    experience: str  # "beginner", "intermediate", "advanced"
-    deployment: str  # "local", "cloud", "hybrid"
-    budget: str  # "low", "medium", "high"
-    timeline: str  # "hours", "days", "weeks"
-    team_size: int
-    programming_language: str  # "python", "typescript", "any"
-    requires_mcp: bool
-    requires_computer_use: bool
-    enterprise_features: bool
+    # Plain slotted class rather than a dataclass to keep CLI startup cheap
+    __slots__ = ("use_case", "experience", "deployment", "budget", "timeline", "team_size",
+                 "programming_language", "requires_mcp", "requires_computer_use", "enterprise_features")
+
+    def __init__(self, use_case: str, experience: str, deployment: str, budget: str, timeline: str,
+                 team_size: int, programming_language: str, requires_mcp: bool,
+                 requires_computer_use: bool, enterprise_features: bool):
+        self.use_case = use_case  # "research", "coding", "multi_agent", "enterprise", "prototype"
+        self.experience = experience  # "beginner", "intermediate", "advanced"
+        self.deployment = deployment  # "local", "cloud", "hybrid"
+        self.budget = budget  # "low", "medium", "high"
+        self.timeline = timeline  # "hours", "days", "weeks"
+        self.team_size = team_size
+        self.programming_language = programming_language  # "python", "typescript", "any"
+        self.requires_mcp = requires_mcp
+        self.requires_computer_use = requires_computer_use
+        self.enterprise_features = enterprise_features
+
+    def _astuple(self) -> tuple:
+        return tuple(getattr(self, f) for f in self.__slots__)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{f}={getattr(self, f)!r}" for f in self.__slots__)
+        return f"UserRequirements({fields})"
+
+def _snapshot_key(catalog_path: str, data_dir: str) -> str:
+    """Hash of the catalog bytes plus the size/mtime of every file in data_dir"""
+    crc = 0
+    try:
+        with open(catalog_path, "rb") as f:
+            crc = zlib.crc32(f.read())
+    except OSError:
+        pass
+    try:
+        entries = sorted((e.name, e.stat().st_mtime_ns, e.stat().st_size)
+                         for e in os.scandir(data_dir) if e.is_file())
+    except OSError:
+        entries = []
+    return f"{crc:08x}-{zlib.crc32(repr(entries).encode()):08x}"
+
+def _read_snapshot(snapshot_path: str, key: str):
+    """{"catalog", and "rules"/"features" when cached} from a snapshot matching key, else None"""
+    try:
+        with open(snapshot_path, "rb") as f:
+            # One read, then loads(): marshal.load() on a file issues a small read per object
+            snapshot = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("key") != key or "catalog" not in snapshot:
+        return None
+    return snapshot
+
+def _write_snapshot(snapshot_path: str, key: str, catalog, rules: dict = None, features: list = None) -> None:
+    tmp = f"{snapshot_path}.{os.getpid()}.tmp"
+    snapshot = {"key": key, "catalog": catalog}
+    if rules is not None:
+        snapshot.update(rules=rules, features=features)
+    try:
+        with open(tmp, "wb") as f:
+            marshal.dump(snapshot, f)
+        os.replace(tmp, snapshot_path)
+    except (OSError, ValueError):
+        # Read-only checkout or unmarshallable data: just skip the cache
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
 
 class FrameworkRecommendationEngine:
-    def __init__(self, catalog_path: str = "compare/catalog.json"):
-        self.catalog = self.load_catalog(catalog_path)
+    def __init__(self, catalog_path: str = "compare/catalog.json", data_dir: str = "data", catalog: dict = None,
+                 reference_date: str = None, rules=None):
+        from scoring_rules import RULES_FILE, compile_rules, load_rules
+
+        self.data_dir = data_dir
+        self._snapshot = None
+        # An already-built catalog dict can be passed in to skip loading from disk
+        self.catalog = catalog if catalog is not None else self.load_catalog(catalog_path)
         self.frameworks = self.catalog.get("frameworks", [])
-        
-        # Scoring weights
-        self.weights = {
-            "use_case_match": 0.25,
-            "experience_fit": 0.20,
-            "deployment_match": 0.15,
-            "maturity": 0.15,
-            "community": 0.10,
-            "requirements": 0.10,
-            "maintenance": 0.05
-        }
-        
-    def load_catalog(self, path: str) -> Dict:
-        if not os.path.exists(path):
-            # Generate catalog if missing
-            os.system("python scripts/generate_catalog_json.py")
-        
-        with open(path, 'r') as f:
-            return json.load(f)
+        self.reference_day = self._resolve_reference_day(reference_date)
+        self._ensure_epoch_days()
+        
+        # Scoring rules (data/scoring_rules.json unless a path or dict is given), compiled once per engine;
+        # with the default rules a warm snapshot supplies the parsed rules and compiled features
+        snapshot, default_rules = self._snapshot, rules is None
+        cached = default_rules and snapshot is not None and "rules" in snapshot
+        if cached:
+            rules = snapshot["rules"]
+        elif not isinstance(rules, dict):
+            rules = load_rules(rules or os.path.join(data_dir, RULES_FILE))
+        self.rules = rules
+        self.kernel = compile_rules(rules, self.frameworks, self.reference_day,
+                                    snapshot["features"] if cached else None)
+        self.weights = self.kernel.weights
+        if snapshot is not None and not cached and (default_rules or snapshot["fresh"]):
+            _write_snapshot(snapshot["path"], snapshot["key"], self.catalog,
+                            *((rules, self.kernel.feature_rows()) if default_rules else ()))
+
+    def load_catalog(self, path: str) -> dict:
+        snapshot_path = path + ".snapshot"
+        key = _snapshot_key(path, self.data_dir)
+        snapshot = _read_snapshot(snapshot_path, key)
+        fresh = snapshot is None
+        if fresh:
+            # Rebuild lazily (frameworks only) if the catalog is missing or stale
+            from generate_catalog_json import load_or_build
+            snapshot = {"catalog": load_or_build(path, sections=("frameworks",), data_dir=self.data_dir)}
+        # __init__ writes the snapshot once the rules are compiled (or uses the cached ones)
+        self._snapshot = {**snapshot, "path": snapshot_path, "key": key, "fresh": fresh}
+        return snapshot["catalog"]
     
-    def score_framework(self, framework: Dict, requirements: UserRequirements) -> Tuple[float, Dict[str, float]]:
+    def _resolve_reference_day(self, reference_date: str = None) -> int:
+        """Epoch day that recency is measured against.
+
+        Explicit argument, then $RECOMMEND_REFERENCE_DATE, then the catalog build
+        date, then today -- so scores are reproducible for a given catalog.
+        """
+        reference_date = reference_date or os.environ.get("RECOMMEND_REFERENCE_DATE")
+        if reference_date:
+            from data_loader import epoch_days
+            day = epoch_days(reference_date)
+            if day is None:
+                raise ValueError(f"invalid reference date: {reference_date!r} (expected YYYY-MM-DD)")
+            return day
+        day = self.catalog.get("stats", {}).get("reference_day")
+        return day if day is not None else int(time.time() // 86400)
+
+    def _ensure_epoch_days(self) -> None:
+        # Catalogs from older generators lack last_commit_days; parse once here, not per query
+        missing = [fw for fw in self.frameworks if "last_commit_days" not in fw]
+        if missing:
+            from data_loader import epoch_days
+            for fw in missing:
+                fw["last_commit_days"] = epoch_days(fw.get("last_commit") or fw.get("last_update", ""))
+
+    def score_framework(self, framework: dict, requirements: UserRequirements,
+                        weights: dict = None) -> tuple[float, dict[str, float]]:
         """Score a framework against user requirements"""
-        scores = {}
-        
-        # Use case matching
-        scores["use_case_match"] = self._score_use_case(
-            framework, requirements.use_case
-        )
-        
-        # Experience level fit
-        scores["experience_fit"] = self._score_experience(
-            framework, requirements.experience
-        )
-        
-        # Deployment compatibility
-        scores["deployment_match"] = self._score_deployment(
-            framework, requirements.deployment
-        )
-        
-        # Maturity assessment
-        scores["maturity"] = self._score_maturity(
-            framework, requirements.timeline
-        )
-        
-        # Community & popularity
-        scores["community"] = self._score_community(framework)
-        
-        # Specific requirements
-        scores["requirements"] = self._score_requirements(
-            framework, requirements
-        )
-        
-        # Maintenance status
-        scores["maintenance"] = self._score_maintenance(framework)
-        
-        # Calculate weighted total
-        total_score = sum(
-            scores[key] * self.weights[key] 
-            for key in scores
-        )
-        
-        return total_score, scores
-    
-    def _score_use_case(self, framework: Dict, use_case: str) -> float:
-        category = framework.get("category", "").lower()
-        tags = framework.get("tags", "").lower()
-        
-        use_case_mapping = {
-            "research": ["research", "survey", "analysis"],
-            "coding": ["coding", "software", "programming"],
-            "multi_agent": ["multi-agent", "collaboration", "team"],
-            "enterprise": ["enterprise", "production", "business"],
-            "prototype": ["experimental", "prototype", "lightweight"]
-        }
-        
-        keywords = use_case_mapping.get(use_case, [])
-        matches = sum(1 for kw in keywords if kw in category or kw in tags)
-        return min(matches / len(keywords), 1.0) if keywords else 0.5
-    
-    def _score_experience(self, framework: Dict, experience: str) -> float:
-        maturity = framework.get("maturity", "").lower()
-        stars = self._parse_stars(framework.get("stars", "0"))
-        
-        if experience == "beginner":
-            # Prefer mature, well-documented frameworks
-            if maturity == "production" and stars > 20000:
-                return 0.9
-            elif maturity in ["production", "beta"] and stars > 10000:
-                return 0.7
-            else:
-                return 0.3
-        elif experience == "intermediate":
-            # Balance of features and ease of use
-            if maturity in ["production", "beta"] and stars > 5000:
-                return 0.8
-            else:
-                return 0.5
-        else:  # advanced
-            # All frameworks suitable for advanced users
-            return 0.8 if maturity != "broken" else 0.2
+        return self.kernel.score(framework, requirements, self.kernel.resolve_weights(weights))
     
-    def _score_deployment(self, framework: Dict, deployment: str) -> float:
-        fw_deployment = framework.get("deployment", "").lower()
-        
-        if deployment == "local":
-            return 1.0 if "local" in fw_deployment else 0.3
-        elif deployment == "cloud":
-            return 1.0 if "cloud" in fw_deployment else 0.4
-        else:  # hybrid
-            return 1.0 if "hybrid" in fw_deployment or "/" in fw_deployment else 0.6
-    
-    def _score_maturity(self, framework: Dict, timeline: str) -> float:
-        maturity = framework.get("maturity", "").lower()
-        
-        maturity_scores = {
-            "production": {"hours": 0.9, "days": 1.0, "weeks": 1.0},
-            "beta": {"hours": 0.6, "days": 0.8, "weeks": 0.9},
-            "experimental": {"hours": 0.2, "days": 0.5, "weeks": 0.7}
+    def recommend(self, requirements: UserRequirements, top_k: int = 5, weights: dict = None) -> list[dict]:
+        """Get top recommendations based on requirements.
+
+        `weights` overrides some or all of the rule-set component weights for
+        this call only; the cached component scores are reused.
+        """
+        import heapq
+
+        weights = self.kernel.resolve_weights(weights)
+        totals = self.kernel.totals(requirements, None if weights is self.weights else weights)
+        # nlargest is stable like a full descending sort: ties keep catalog order
+        top = heapq.nlargest(top_k, range(len(totals)), key=totals.__getitem__)
+        return [self.recommendation(i, totals[i], requirements) for i in top]
+
+    def recommendation(self, position: int, total: float, requirements: UserRequirements) -> dict:
+        """Result entry for the framework at `position` with its weighted total"""
+        framework = self.frameworks[position]
+        detailed_scores = self.kernel.breakdown(position, requirements)
+        return {
+            "framework": framework,
+            "total_score": total,
+            "detailed_scores": detailed_scores,
+            "recommendation_reason": self._generate_reason(framework, requirements, detailed_scores)
         }
-        
-        return maturity_scores.get(maturity, {}).get(timeline, 0.5)
-    
-    def _score_community(self, framework: Dict) -> float:
-        stars = self._parse_stars(framework.get("stars", "0"))
-        
-        if stars >= 50000:
-            return 1.0
-        elif stars >= 20000:
-            return 0.8
-        elif stars >= 5000:
-            return 0.6
-        elif stars >= 1000:
-            return 0.4
-        else:
-            return 0.2
-    
-    def _score_requirements(self, framework: Dict, requirements: UserRequirements) -> float:
-        score = 1.0
-        tags = framework.get("tags", "").lower()
-        
-        # MCP requirement
-        if requirements.requires_mcp:
-            if "mcp" not in tags:
-                score -= 0.4
-        
-        # Computer use requirement
-        if requirements.requires_computer_use:
-            if "computer" not in tags and "gui" not in tags:
-                score -= 0.4
-        
-        # Enterprise features
-        if requirements.enterprise_features:
-            if "enterprise" not in tags and "production" not in framework.get("maturity", "").lower():
-                score -= 0.3
-        
-        # Programming language preference
-        if requirements.programming_language != "any":
-            lang = framework.get("language", "").lower()
-            if requirements.programming_language.lower() not in lang:
-                score -= 0.2
-        
-        return max(score, 0.0)
-    
-    def _score_maintenance(self, framework: Dict) -> float:
-        # Simple heuristic based on recent activity
-        # In real implementation, would parse last_commit date
-        return 0.8  # Placeholder
-    
-    def _parse_stars(self, stars_str: str) -> int:
-        """Parse stars string to integer"""
-        try:
-            stars_str = str(stars_str).lower().replace(",", "")
-            if "k" in stars_str:
-                return int(float(stars_str.replace("k", "")) * 1000)
-            else:
-                return int(stars_str)
-        except:
-            return 0
-    
-    def recommend(self, requirements: UserRequirements, top_k: int = 5) -> List[Dict]:
-        """Get top recommendations based on requirements"""
-        scored_frameworks = []
-        
-        for framework in self.frameworks:
-            total_score, detailed_scores = self.score_framework(framework, requirements)
-            
-            scored_frameworks.append({
-                "framework": framework,
-                "total_score": total_score,
+
+    def skyline(self, requirements: UserRequirements, criteria: list = None, weights: dict = None) -> list[dict]:
+        """Pareto front: frameworks no other framework matches or beats on every criterion.
+
+        Criteria are component score names (default: the rule set's "skyline"
+        criteria); the front is listed by weighted total score.
+        """
+        from scoring_rules import COMPONENTS
+
+        criteria = list(criteria or self.rules.get("skyline", {}).get("criteria", SKYLINE_CRITERIA))
+        unknown = [c for c in criteria if c not in COMPONENTS]
+        if unknown:
+            raise ValueError(f"unknown skyline criteria: {', '.join(unknown)} (choose from {', '.join(COMPONENTS)})")
+        weights = self.kernel.resolve_weights(weights)
+        matrix = dict(zip(COMPONENTS, self.kernel.matrix(requirements)))
+        totals = self.kernel.totals(requirements, None if weights is self.weights else weights)
+        front = sorted(skyline_indices([matrix[c] for c in criteria]), key=totals.__getitem__, reverse=True)
+        results = []
+        for i in front:
+            detailed_scores = self.kernel.breakdown(i, requirements)
+            results.append({
+                "framework": self.frameworks[i],
+                "total_score": totals[i],
                 "detailed_scores": detailed_scores,
-                "recommendation_reason": self._generate_reason(framework, requirements, detailed_scores)
+                "skyline": {c: detailed_scores[c] for c in criteria},
             })
-        
-        # Sort by total score
-        scored_frameworks.sort(key=lambda x: x["total_score"], reverse=True)
-        
-        return scored_frameworks[:top_k]
+        return results
+
+    def similar(self, name: str = None, text: str = None, k: int = 5) -> list[dict]:
+        """Frameworks most like a named framework or a free-text description.
+
+        Named lookups use the neighbour lists precomputed into catalog.json when
+        they are long enough; anything else builds the similarity index once.
+        """
+        if name is not None:
+            lname = name.strip().lower()
+            for fw in self.frameworks:
+                if fw.get("name", "").lower() == lname and len(fw.get("similar", [])) >= k:
+                    return fw["similar"][:k]
+        if getattr(self, "_similarity", None) is None:
+            from similarity import SimilarityIndex
+            self._similarity = SimilarityIndex(self.frameworks)
+        hits = self._similarity.query(text=text, name=name, k=k)
+        return [{"name": self._similarity.names[i], "score": round(score, 4)} for i, score in hits]
     
-    def _generate_reason(self, framework: Dict, requirements: UserRequirements, scores: Dict[str, float]) -> str:
+    def _generate_reason(self, framework: dict, requirements: UserRequirements, scores: dict[str, float]) -> str:
         """Generate human-readable recommendation reason"""
         name = framework.get("name", "Unknown")
         top_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:2]
@@ -248,20 +272,174 @@ class FrameworkRecommendationEngine:
         
         return f"{name} is recommended because it offers " + " and ".join(reasons) + "."
 
+def skyline_indices(columns: list) -> list[int]:
+    """Row positions of the non-dominated rows of a column-major score table (higher is better).
+
+    Sort-filter skyline: rows with identical score vectors are grouped first
+    (component scores take few distinct values, so a large catalog collapses to
+    a handful of points), the distinct vectors are presorted by descending sum
+    -- a point can then only be dominated by one sorted before it -- and each
+    is kept unless some point already on the front is >= it everywhere.
+    """
+    groups = {}
+    for i, vec in enumerate(zip(*columns)):
+        groups.setdefault(vec, []).append(i)
+    front = []
+    for vec in sorted(groups, key=lambda v: (sum(v), v), reverse=True):
+        # Vectors are distinct, so >= everywhere means strictly better somewhere
+        if not any(all(f >= x for f, x in zip(point, vec)) for point in front):
+            front.append(vec)
+    return sorted(i for vec in front for i in groups[vec])
+
+def requirements_from_profile(profile: dict, defaults: dict) -> UserRequirements:
+    """Build UserRequirements from a CLI-style profile dict (missing keys fall back to defaults)"""
+    p = dict(defaults)
+    p.update(profile)
+    for key, choices in (("use_case", USE_CASES), ("experience", EXPERIENCE_LEVELS),
+                         ("deployment", DEPLOYMENTS), ("budget", BUDGETS), ("timeline", TIMELINES)):
+        if p[key] not in choices:
+            raise ValueError(f"invalid {key}: {p[key]!r} (choose from {', '.join(choices)})")
+    return UserRequirements(
+        use_case=p["use_case"],
+        experience=p["experience"],
+        deployment=p["deployment"],
+        budget=p["budget"],
+        timeline=p["timeline"],
+        team_size=int(p.get("team_size", 1)),
+        programming_language=p["language"],
+        requires_mcp=bool(p["mcp"]),
+        requires_computer_use=bool(p["computer_use"]),
+        enterprise_features=bool(p["enterprise"])
+    )
+
+def _batch_line(profile: dict, recommendations: list) -> str:
+    import json
+    return json.dumps({
+        "profile": profile,
+        "recommendations": [{
+            "name": rec["framework"].get("name", "Unknown"),
+            "github": rec["framework"].get("github", ""),
+            "score": round(rec["total_score"], 4),
+            "detailed_scores": rec["detailed_scores"],
+            "reason": rec["recommendation_reason"]
+        } for rec in recommendations]
+    }) + "\n"
+
+def run_batch(engine: FrameworkRecommendationEngine, defaults: dict, stream, out, pool=None,
+              block: int = 1024) -> int:
+    """Score one NDJSON requirement profile per input line, writing one JSON result line each.
+
+    With a SharedScoringPool (shared_scoring.py) the profiles are read and
+    scored `block` lines at a time across its processes; output order is
+    input order either way.
+    """
+    import json
+
+    count, pending = 0, []
+
+    def flush():
+        nonlocal count
+        scored = pool.recommend_batch([q for _, q in pending if q]) if pool else []
+        results = iter(scored)
+        for head, query in pending:
+            out.write(_batch_line(head, next(results)) if query else head)
+            count += bool(query)
+        out.flush()
+        pending.clear()
+
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            profile = json.loads(line)
+            requirements = requirements_from_profile(profile, defaults)
+            top_k = int(profile.get("top_k", defaults["top_k"]))
+            weights = engine.kernel.resolve_weights(profile.get("weights") or defaults.get("weights"))
+        except (ValueError, TypeError, AttributeError) as e:
+            if pool:
+                pending.append((json.dumps({"input": line, "error": str(e)}) + "\n", None))
+            else:
+                out.write(json.dumps({"input": line, "error": str(e)}) + "\n")
+            continue
+        if not pool:
+            out.write(_batch_line(profile, engine.recommend(requirements, top_k, weights)))
+            out.flush()
+            count += 1
+            continue
+        pending.append((profile, (requirements, top_k, weights)))
+        if len(pending) >= block:
+            flush()
+    if pending:
+        flush()
+    return count
+
+def parse_weights(text: str) -> dict:
+    """"community=0.3,maintenance=0.1" -> {"community": 0.3, "maintenance": 0.1}"""
+    weights = {}
+    for item in text.split(","):
+        name, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"expected component=weight, got {item!r}")
+        weights[name.strip()] = float(value)
+    return weights
+
+def parse_reference_date(text: str) -> str:
+    """Validate a YYYY-MM-DD --reference_date"""
+    from data_loader import epoch_days
+
+    if epoch_days(text) is None:
+        raise ValueError(f"invalid reference date: {text!r} (expected YYYY-MM-DD)")
+    return text
+
 def main():
+    import argparse
+    import sys
+
     parser = argparse.ArgumentParser(description="Get AI agent framework recommendations")
-    parser.add_argument("--use_case", choices=["research", "coding", "multi_agent", "enterprise", "prototype"], default="prototype")
-    parser.add_argument("--experience", choices=["beginner", "intermediate", "advanced"], default="intermediate")
-    parser.add_argument("--deployment", choices=["local", "cloud", "hybrid"], default="local")
-    parser.add_argument("--budget", choices=["low", "medium", "high"], default="medium")
-    parser.add_argument("--timeline", choices=["hours", "days", "weeks"], default="days")
+    parser.add_argument("--use_case", choices=USE_CASES, default="prototype")
+    parser.add_argument("--experience", choices=EXPERIENCE_LEVELS, default="intermediate")
+    parser.add_argument("--deployment", choices=DEPLOYMENTS, default="local")
+    parser.add_argument("--budget", choices=BUDGETS, default="medium")
+    parser.add_argument("--timeline", choices=TIMELINES, default="days")
     parser.add_argument("--language", default="python")
     parser.add_argument("--mcp", action="store_true", help="Requires MCP support")
     parser.add_argument("--computer_use", action="store_true", help="Requires computer use capabilities")
     parser.add_argument("--enterprise", action="store_true", help="Requires enterprise features")
     parser.add_argument("--top_k", type=int, default=5, help="Number of recommendations")
+    parser.add_argument("--catalog", default="compare/catalog.json", help="Path to catalog.json")
+    parser.add_argument("--reference_date", type=parse_reference_date, help="YYYY-MM-DD used as 'today' for maintenance scoring "
+                                                 "(default: catalog build date)")
+    parser.add_argument("--weights", type=parse_weights, default=None,
+                        help="Override component weights for this run, e.g. community=0.3,maintenance=0.1")
+    parser.add_argument("--skyline", nargs="?", const="", metavar="CRITERIA",
+                        help="List the Pareto front instead of a weighted top-k, over comma-separated component "
+                             "scores (default: maturity,community,maintenance,requirements)")
+    parser.add_argument("--batch", action="store_true",
+                        help="Read NDJSON requirement profiles from stdin and stream one JSON result per line "
+                             "(keys as the options above, plus an optional \"weights\" object; "
+                             "omitted keys use the command-line values)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="With --batch: score blocks of profiles across this many processes over a "
+                             "shared-memory catalog (see shared_scoring.py)")
     
     args = parser.parse_args()
+
+    def load_engine():
+        try:
+            return FrameworkRecommendationEngine(args.catalog, reference_date=args.reference_date)
+        except ValueError as e:  # e.g. a malformed $RECOMMEND_REFERENCE_DATE
+            parser.error(str(e))
+    
+    if args.batch:
+        engine = load_engine()
+        if args.workers:
+            from shared_scoring import SharedScoringPool
+            with SharedScoringPool(engine, args.workers) as pool:
+                run_batch(engine, vars(args), sys.stdin, sys.stdout, pool)
+        else:
+            run_batch(engine, vars(args), sys.stdin, sys.stdout)
+        return
     
     requirements = UserRequirements(
         use_case=args.use_case,
@@ -276,8 +454,25 @@ def main():
         enterprise_features=args.enterprise
     )
     
-    engine = FrameworkRecommendationEngine()
-    recommendations = engine.recommend(requirements, args.top_k)
+    engine = load_engine()
+    if args.skyline is not None:
+        criteria = [c.strip() for c in args.skyline.split(",") if c.strip()]
+        try:
+            front = engine.skyline(requirements, criteria, args.weights)
+        except ValueError as e:
+            parser.error(str(e))
+        names = ", ".join(front[0]["skyline"]) if front else ""
+        print(f"\n📐 Pareto front for {args.use_case} ({len(front)} frameworks, criteria: {names}):\n")
+        for rec in front:
+            fw = rec["framework"]
+            cells = "  ".join(f"{c.replace('_', ' ')} {v:.2f}" for c, v in rec["skyline"].items())
+            print(f"- **{fw.get('name', 'Unknown')}** (Score: {rec['total_score']:.2f})  {cells}")
+        return
+
+    try:
+        recommendations = engine.recommend(requirements, args.top_k, args.weights)
+    except ValueError as e:  # e.g. --weights naming an unknown component
+        parser.error(str(e))
     
     print(f"\n🎯 Top {len(recommendations)} Recommendations for {args.use_case} use case:\n")
     
@@ -1,88 +1,85 @@
 #!/usr/bin/env python3
 """
-Extend refresh_stars.py to optionally refresh additional CSVs, e.g., data/computer_use.csv.
+Refresh stars and last commit/update dates across several CSVs in one pass.
+
+- Collects GitHub URLs from every CSV (frameworks, agents_list, computer_use)
+- Fetches each unique repository once via the shared repo registry, even when
+  rows spell the URL differently or point at a renamed repo
+- Fans the result back out to every row and updates whichever of
+  'stars' / 'last_commit' / 'last_update' the file has
+- Persists canonical repo names to data/repo_registry.json
+- Appends today's stars/forks per repo to data/star_history.json
 
 Usage:
-  python scripts/refresh_csv.py --token $GITHUB_TOKEN --paths data/frameworks.csv data/computer_use.csv
+  python scripts/refresh_csv.py --token $GITHUB_TOKEN --paths data/frameworks.csv data/agents_list.csv data/computer_use.csv
 """
 import argparse
-import csv
 import os
-import re
 import sys
 from datetime import datetime
-import requests
 
-GITHUB_API = "https://api.github.com"
-REPO_RE = re.compile(r"https?://github.com/([^/]+)/([^/]+)")
+from data_loader import load_table, parse_date, parse_stars, today_days, write_table
+from repo_registry import REGISTRY_PATH, RepoRegistry
+from star_history import HISTORY_PATH, StarHistory
 
+DEFAULT_PATHS = ["data/frameworks.csv", "data/agents_list.csv", "data/computer_use.csv"]
 
-def parse_repo(url: str):
-    m = REPO_RE.match(url.strip())
-    if not m:
-        return None, None
-    return m.group(1), m.group(2)
 
+def apply_info(row, info):
+    """Copy refreshed values into a typed row, respecting the file's schema"""
+    stars, last_commit = parse_stars(info["stars"]), parse_date(info["last_commit"] or "")
+    if "stars" in row and stars is not None:
+        row.set("stars", stars)
+    # Update last_update or last_commit depending on schema
+    if "last_commit" in row and last_commit:
+        row.set("last_commit", last_commit)
+    elif "last_update" in row and last_commit:
+        row.set("last_update", last_commit)
 
-def get_repo_info(owner: str, repo: str, token: str):
-    headers = {"Accept": "application/vnd.github+json"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    r = requests.get(f"{GITHUB_API}/repos/{owner}/{repo}", headers=headers, timeout=20)
-    if r.status_code != 200:
-        return None
-    data = r.json()
-    stars = data.get("stargazers_count", "")
-    pushed_at = data.get("pushed_at", "")
-    last_commit = pushed_at.split("T")[0] if pushed_at else ""
-    return stars, last_commit
 
+def refresh_files(paths, token: str, registry: RepoRegistry = None, history: StarHistory = None):
+    """Refresh all paths with one fetch per unique repo; returns (rows updated, repos fetched)"""
+    registry = registry or RepoRegistry(REGISTRY_PATH)
+    history = history or StarHistory(HISTORY_PATH)
+    tables = []
+    for path in paths:
+        if not os.path.exists(path):
+            print(f"WARN: {path} not found", file=sys.stderr)
+            continue
+        tables.append(load_table(path))
+
+    urls = [row.get("github", "") for table in tables for row in table.rows]
+    results = registry.fetch_all(urls, token)
 
-def refresh_file(path: str, token: str):
-    if not os.path.exists(path):
-        print(f"WARN: {path} not found", file=sys.stderr)
-        return 0
-    with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames or []
-        rows = list(reader)
     updated = 0
-    for row in rows:
-        url = row.get("github", "").strip()
-        if not url:
-            continue
-        owner, repo = parse_repo(url)
-        if not owner:
-            continue
-        info = get_repo_info(owner, repo, token)
-        if not info:
-            continue
-        stars, last_commit = info
-        if "stars" in row and stars:
-            row["stars"] = str(stars)
-        # Update last_update or last_commit depending on schema
-        if "last_commit" in row and last_commit:
-            row["last_commit"] = last_commit
-        elif "last_update" in row and last_commit:
-            row["last_update"] = last_commit
-        updated += 1
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-    return updated
+    for table in tables:
+        for row in table.rows:
+            key = registry.key_for(row.get("github", ""))
+            info = results.get(key) if key else None
+            if not info:
+                continue
+            apply_info(row, info)
+            updated += 1
+        write_table(table)
+
+    registry.save()
+    history.record(results, today_days())
+    history.save()
+    return updated, len(results)
+
+
+def refresh_file(path: str, token: str):
+    return refresh_files([path], token)[0]
 
 
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("--token", default=os.environ.get("GITHUB_TOKEN", ""))
-    ap.add_argument("--paths", nargs="+", default=["data/frameworks.csv", "data/computer_use.csv"]) 
+    ap.add_argument("--paths", nargs="+", default=DEFAULT_PATHS)
     args = ap.parse_args()
 
-    total = 0
-    for p in args.paths:
-        total += refresh_file(p, args.token)
-    print(f"Refreshed {total} entries across {len(args.paths)} files at {datetime.utcnow().isoformat()}Z")
+    total, repos = refresh_files(args.paths, args.token)
+    print(f"Refreshed {total} entries ({repos} unique repos) across {len(args.paths)} files at {datetime.utcnow().isoformat()}Z")
 
 
 if __name__ == "__main__":
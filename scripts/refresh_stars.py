@@ -3,8 +3,10 @@
 Refresh stars and last commit dates for frameworks in data/frameworks.csv.
 
 - Reads data/frameworks.csv
-- Queries GitHub API for repo stars and latest commit date
+- Queries GitHub API for repo stars and latest commit date (once per unique
+  repo, resolved through data/repo_registry.json)
 - Updates CSV in place with refreshed 'stars' and 'last_commit'
+- Appends today's stars/forks per repo to data/star_history.json
 
 Usage:
   python scripts/refresh_stars.py --token $GITHUB_TOKEN
@@ -12,40 +14,15 @@ Usage:
 Optionally run in CI weekly.
 """
 import argparse
-import csv
 import os
-import re
 import sys
 from datetime import datetime
-from urllib.parse import urlparse
 
-import requests
+from data_loader import load_table, parse_date, parse_stars, today_days, write_table
+from repo_registry import REGISTRY_PATH, RepoRegistry
+from star_history import HISTORY_PATH, StarHistory
 
 CSV_PATH = os.path.join("data", "frameworks.csv")
-GITHUB_API = "https://api.github.com"
-
-REPO_RE = re.compile(r"https?://github.com/([^/]+)/([^/]+)")
-
-
-def parse_repo(url: str):
-    m = REPO_RE.match(url.strip())
-    if not m:
-        return None, None
-    return m.group(1), m.group(2)
-
-
-def get_repo_info(owner: str, repo: str, token: str):
-    headers = {"Accept": "application/vnd.github+json"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    r = requests.get(f"{GITHUB_API}/repos/{owner}/{repo}", headers=headers, timeout=20)
-    if r.status_code != 200:
-        return None
-    data = r.json()
-    stars = data.get("stargazers_count", "")
-    pushed_at = data.get("pushed_at", "")
-    last_commit = pushed_at.split("T")[0] if pushed_at else ""
-    return stars, last_commit
 
 
 def refresh_csv(token: str):
@@ -53,36 +30,30 @@ def refresh_csv(token: str):
         print(f"ERROR: {CSV_PATH} not found", file=sys.stderr)
         sys.exit(1)
 
-    rows = []
-    with open(CSV_PATH, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames or []
-        for row in reader:
-            rows.append(row)
+    table = load_table(CSV_PATH)
+
+    # One fetch per unique repo; renamed repos resolve via the shared registry
+    registry = RepoRegistry(REGISTRY_PATH)
+    results = registry.fetch_all([row.github for row in table.rows], token)
 
     updated = 0
-    for row in rows:
-        url = row.get("github", "").strip()
-        if not url:
-            continue
-        owner, repo = parse_repo(url)
-        if not owner:
-            continue
-        info = get_repo_info(owner, repo, token)
+    for row in table.rows:
+        key = registry.key_for(row.github)
+        info = results.get(key) if key else None
         if not info:
             continue
-        stars, last_commit = info
+        stars, last_commit = parse_stars(info["stars"]), parse_date(info["last_commit"] or "")
         if stars:
-            row["stars"] = str(stars)
+            row.stars = stars
         if last_commit:
-            row["last_commit"] = last_commit
+            row.last_commit = last_commit
         updated += 1
 
-    with open(CSV_PATH, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+    write_table(table)
+    registry.save()
+    history = StarHistory(HISTORY_PATH)
+    history.record(results, today_days())
+    history.save()
 
     print(f"Refreshed {updated} rows at {datetime.utcnow().isoformat()}Z")
 
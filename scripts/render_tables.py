@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Render the data-backed Markdown tables in README.md and catalog/*.md.
+
+- A generated table sits between marker comments:
+    <!-- BEGIN GENERATED TABLE: readme-tier-1 -->
+    | Framework | Stars | Use Case |
+    ...
+    <!-- END GENERATED TABLE -->
+- data/doc_tables.json defines each table: its columns, and either an
+  explicit row list (curated prose such as "Specialty" lives there) or a star
+  filter over data/frameworks.csv (tiers re-sort themselves after a refresh)
+- Star counts, maturity and links come from data/frameworks.csv,
+  data/computer_use.csv and data/agents_list.csv, matched by GitHub repo
+- Each table is keyed by a content hash of its spec plus the CSV values it
+  reads; .cache/render_tables.json remembers the last hash and output, so
+  only tables whose rows changed are re-rendered, and a page is rewritten
+  only when its text actually differs
+- Pages are processed in parallel
+
+Usage:
+  python scripts/render_tables.py              # update pages in place
+  python scripts/render_tables.py --check      # exit 1 if any table is out of date
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from data_loader import ROOT_DIR, load_table, parse_stars
+from repo_registry import normalize_repo, parse_repo
+
+SPEC_PATH = os.path.join("data", "doc_tables.json")
+CACHE_PATH = os.path.join(ROOT_DIR, ".cache", "render_tables.json")
+DEFAULT_PAGES = ["README.md", "catalog/*.md"]
+# Earlier files win when a repo appears in several
+SOURCES = ("frameworks.csv", "computer_use.csv", "agents_list.csv")
+
+MARKER_RE = re.compile(r"(<!-- BEGIN GENERATED TABLE: ([\w.-]+) -->\n)(.*?)(<!-- END GENERATED TABLE -->)", re.S)
+
+
+def short_stars(val):
+    """177000 -> "177K", 7100 -> "7.1K"; non-numeric values pass through"""
+    n = parse_stars(val)
+    if n is None:
+        return str(val or "")
+    if n >= 10000:
+        return f"{round(n / 1000)}K"
+    if n >= 1000:
+        return f"{n / 1000:.1f}".rstrip("0").rstrip(".") + "K"
+    return str(n)
+
+
+def load_sources(data_dir="data"):
+    """({repo key: row}, [frameworks.csv rows]) from the CSV sources"""
+    by_repo, frameworks = {}, []
+    for name in SOURCES:
+        rows = [row.to_dict() for row in load_table(os.path.join(data_dir, name)).rows]
+        if name == "frameworks.csv":
+            frameworks = rows
+        for row in rows:
+            key = normalize_repo(row.get("github", ""))
+            if key and key not in by_repo:
+                by_repo[key] = row
+    return by_repo, frameworks
+
+
+def resolve_rows(table, display, by_repo, frameworks):
+    """Merged row dicts for a table: CSV row < display defaults < per-row spec"""
+    if "rows" in table:
+        rows = []
+        for entry in table["rows"]:
+            key = entry.get("repo") or normalize_repo(entry.get("github", ""))
+            rows.append({**by_repo.get(key, {}), **display.get(key, {}), **entry})
+        return rows
+
+    def stars(row):
+        return row.get("stars_int") or 0
+
+    lo, hi = table.get("min_stars", 0), table.get("max_stars")
+    picked = [r for r in frameworks if stars(r) >= lo and (hi is None or stars(r) < hi)]
+    picked.sort(key=stars, reverse=True)
+    picked = picked[:table.get("limit", len(picked))]
+    return [{**r, **display.get(normalize_repo(r.get("github", "")), {})} for r in picked]
+
+
+def render_cell(kind, row):
+    name, url = row.get("name", ""), row.get("github", "")
+    if kind == "link":
+        return f'<a href="{url}" target="_blank" rel="noopener noreferrer">{name} ↗</a>' if url else name
+    if kind == "bold":
+        return f"**{name}**"
+    if kind == "repo":
+        owner, repo = parse_repo(url)
+        return f"[{owner}/{repo}]({url})" if owner else ""
+    if kind == "stars":
+        return short_stars(row.get("stars", ""))
+    return str(row.get(kind, "") or "")
+
+
+def render_table(table, rows):
+    titles = [title for title, _ in table["columns"]]
+    lines = ["| " + " | ".join(titles) + " |", "|" + "|".join("-" * (len(t) + 2) for t in titles) + "|"]
+    for row in rows:
+        lines.append("| " + " | ".join(render_cell(kind, row) for _, kind in table["columns"]) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def table_key(table, rows):
+    """Content hash of a table's spec and the cell inputs it reads"""
+    fields = {"name", "github"} | {kind for _, kind in table["columns"]}
+    payload = [table, [{f: row.get(f, "") for f in sorted(fields)} for row in rows]]
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _digest(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+_spec = _by_repo = _frameworks = None
+
+
+def _init_worker(spec, by_repo, frameworks):
+    global _spec, _by_repo, _frameworks
+    _spec, _by_repo, _frameworks = spec, by_repo, frameworks
+
+
+def render_page(job):
+    """Re-render stale tables in one page; returns (path, new text or None, {table: (key, digest)}, stats)"""
+    path, cached, use_cache = job
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    entries, stats = {}, {"rendered": 0, "cached": 0, "unknown": []}
+
+    def replace(m):
+        begin, name, body, end = m.groups()
+        table = _spec["tables"].get(name)
+        if table is None:
+            stats["unknown"].append(name)
+            return m.group(0)
+        rows = resolve_rows(table, _spec.get("display", {}), _by_repo, _frameworks)
+        key = table_key(table, rows)
+        if use_cache and cached.get(name) == [key, _digest(body)]:
+            stats["cached"] += 1
+            entries[name] = (key, _digest(body))
+            return m.group(0)
+        out = render_table(table, rows)
+        stats["rendered"] += 1
+        entries[name] = (key, _digest(out))
+        return begin + out + end
+
+    new_text = MARKER_RE.sub(replace, text)
+    return path, (new_text if new_text != text else None), entries, stats
+
+
+def load_cache(path=CACHE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_cache(cache, path=CACHE_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def render_pages(paths, spec, data_dir="data", workers=None, use_cache=True, write=True):
+    """Render every page; returns (changed paths, stats totals)"""
+    by_repo, frameworks = load_sources(data_dir)
+    cache = load_cache() if use_cache else {}
+    jobs = [(path, cache.get(path, {}), use_cache) for path in paths]
+    changed, totals = [], {"rendered": 0, "cached": 0, "unknown": []}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(spec, by_repo, frameworks)) as pool:
+        for path, new_text, entries, stats in pool.map(render_page, jobs):
+            for k in totals:
+                totals[k] += stats[k]
+            if new_text is not None:
+                changed.append(path)
+                if write:
+                    with open(path, "w", encoding="utf-8") as f:
+                        f.write(new_text)
+            if entries:
+                cache[path] = {name: list(v) for name, v in entries.items()}
+            else:
+                cache.pop(path, None)
+    if write:
+        save_cache(cache)
+    return changed, totals
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Render data-backed Markdown tables between marker comments")
+    ap.add_argument("--paths", nargs="+", default=DEFAULT_PAGES, help="Pages or globs to process")
+    ap.add_argument("--spec", default=SPEC_PATH)
+    ap.add_argument("--data-dir", default="data")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--no-cache", action="store_true", help="Re-render every table")
+    ap.add_argument("--check", action="store_true", help="Do not write; exit 1 if any page would change")
+    args = ap.parse_args()
+
+    with open(args.spec, encoding="utf-8") as f:
+        spec = json.load(f)
+    paths = sorted({p for pattern in args.paths for p in glob.glob(pattern)})
+    changed, totals = render_pages(paths, spec, args.data_dir, args.workers,
+                                   use_cache=not args.no_cache and not args.check, write=not args.check)
+    for name in totals["unknown"]:
+        print(f"WARN: no table named {name!r} in {args.spec}", file=sys.stderr)
+    verb = "Out of date" if args.check else "Updated"
+    for path in changed:
+        print(f"{verb}: {path}")
+    print(f"{len(paths)} pages, {totals['rendered']} tables rendered, {totals['cached']} unchanged (cached), "
+          f"{len(changed)} pages {'stale' if args.check else 'rewritten'}")
+    if args.check and changed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
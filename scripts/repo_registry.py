@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Canonical GitHub repository registry shared by the refresh scripts.
+
+- normalize_repo() turns any github.com URL spelling into an "owner/repo" key
+- RepoRegistry collapses every key seen in the CSVs onto one canonical repo,
+  so each unique repository is fetched once per run and the result is fanned
+  back out to all rows that reference it
+- Canonical names reported by the GitHub API (after renames/redirects) are
+  persisted to data/repo_registry.json; later runs resolve known aliases up
+  front and request the canonical endpoint directly, skipping the redirect hop
+
+Usage:
+  python scripts/repo_registry.py            # list registered aliases
+"""
+import json
+import os
+import re
+
+GITHUB_API = os.environ.get("GITHUB_API_URL", "https://api.github.com")
+REGISTRY_PATH = os.path.join("data", "repo_registry.json")
+
+REPO_RE = re.compile(r"https?://(?:www\.)?github\.com/([^/\s]+)/([^/\s#?]+)", re.IGNORECASE)
+
+
+def parse_repo(url: str):
+    """Return (owner, repo) for a github.com URL, or (None, None)"""
+    m = REPO_RE.match((url or "").strip())
+    if not m:
+        return None, None
+    repo = m.group(2)
+    if repo.endswith(".git"):
+        repo = repo[:-4]
+    return m.group(1), repo
+
+
+def normalize_repo(url: str):
+    """Case-insensitive "owner/repo" key for a github.com URL, or None"""
+    owner, repo = parse_repo(url)
+    if not owner:
+        return None
+    return f"{owner}/{repo}".lower()
+
+
+class RepoRegistry:
+    def __init__(self, path: str = REGISTRY_PATH):
+        self.path = path
+        self.aliases = {}  # normalized key -> canonical normalized key
+        self.repos = {}    # canonical normalized key -> {"full_name", "url"}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.aliases = data.get("aliases", {})
+            self.repos = data.get("repos", {})
+        self.requests_made = 0
+
+    def canonical(self, key: str) -> str:
+        """Follow recorded aliases to the canonical key"""
+        seen = set()
+        while key in self.aliases and key not in seen:
+            seen.add(key)
+            key = self.aliases[key]
+        return key
+
+    def key_for(self, url: str):
+        """Canonical key for a URL, or None if it is not a GitHub repo URL"""
+        key = normalize_repo(url)
+        return self.canonical(key) if key else None
+
+    def full_name(self, key: str) -> str:
+        """Best known "Owner/Repo" spelling for a canonical key"""
+        return self.repos.get(key, {}).get("full_name", key)
+
+    def record(self, key: str, full_name: str):
+        """Record the API-reported full name for key, aliasing key if the repo moved"""
+        canonical = full_name.lower()
+        if canonical != key:
+            self.aliases[key] = canonical
+        self.repos[canonical] = {"full_name": full_name, "url": f"https://github.com/{full_name}"}
+        return canonical
+
+    def fetch(self, key: str, token: str = "", session=None):
+        """Fetch repo metadata for a canonical key; returns dict or None"""
+        headers = {"Accept": "application/vnd.github+json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        if session is None:
+            import requests
+            session = requests
+        self.requests_made += 1
+        r = session.get(f"{GITHUB_API}/repos/{self.full_name(key)}", headers=headers, timeout=20)
+        if r.status_code != 200:
+            return None
+        data = r.json()
+        full_name = data.get("full_name") or self.full_name(key)
+        pushed_at = data.get("pushed_at", "") or ""
+        return {
+            "full_name": full_name,
+            "stars": data.get("stargazers_count", ""),
+            "forks": data.get("forks_count", ""),
+            "last_commit": pushed_at.split("T")[0] if pushed_at else "",
+            "archived": data.get("archived", False),
+            "redirected": bool(r.history),
+        }
+
+    def fetch_all(self, urls, token: str = ""):
+        """Fetch each distinct repo referenced by urls once.
+
+        Returns {canonical key: info}; callers look rows up with key_for(url),
+        which also resolves any aliases learned during this run.
+        """
+        keys = []
+        for url in urls:
+            key = self.key_for(url)
+            if key and key not in keys:
+                keys.append(key)
+        import requests
+
+        results = {}
+        with requests.Session() as session:
+            for key in keys:
+                # An earlier fetch in this run may have revealed key as an alias
+                key = self.canonical(key)
+                if key in results:
+                    continue
+                info = self.fetch(key, token, session)
+                if not info:
+                    continue
+                canonical = self.record(key, info["full_name"])
+                results[canonical] = info
+        return results
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"aliases": dict(sorted(self.aliases.items())),
+                       "repos": dict(sorted(self.repos.items()))}, f, indent=2)
+            f.write("\n")
+
+
+def main():
+    registry = RepoRegistry()
+    print(f"{len(registry.repos)} canonical repos, {len(registry.aliases)} aliases in {registry.path}")
+    for alias, canonical in sorted(registry.aliases.items()):
+        print(f"  {alias} -> {registry.full_name(canonical)}")
+
+
+if __name__ == "__main__":
+    main()
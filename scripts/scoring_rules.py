@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Declarative scoring rules for the recommendation engine.
+
+- data/scoring_rules.json holds every number and keyword the engine scores
+  with: component weights, use-case keyword maps, experience and deployment
+  rule ladders (first matching rule wins), the maturity x timeline table,
+  star and trend buckets, requirement penalties and maintenance age buckets
+- compile_rules() turns a rule set into a ScoringKernel once per engine load:
+  conditions become closures, each framework's fields are lowercased and its
+  stars parsed once, and every component is evaluated per requirement value
+  (use case, experience level, deployment, timeline, penalty combination)
+  into a column over the whole catalog the first time that value is asked for
+- Scoring a profile is then one zip-sum over cached weighted columns; only the
+  top-k frameworks get a detailed score breakdown
+- Component scores do not depend on the weights, so each profile's
+  (component x framework) matrix is cached too: per-request weights re-rank
+  with one dot product per framework (see weight_sweep.py for bulk sweeps)
+
+Rule conditions (all keys of an "if"/"unless" object must hold):
+  maturity_in: [...]            lowercased maturity is one of these
+  stars_over: N                 parsed stars > N
+  contains: {field: [...]}      any listed substring occurs in any listed field
+
+Usage:
+  python scripts/scoring_rules.py                         # validate data/scoring_rules.json
+  python scripts/scoring_rules.py --rules my_rules.json
+"""
+from __future__ import annotations
+
+import os
+
+RULES_FILE = "scoring_rules.json"
+
+# Order matters: the weighted total is summed in this order
+COMPONENTS = ("use_case_match", "experience_fit", "deployment_match", "maturity",
+              "community", "requirements", "maintenance")
+
+
+def load_rules(path: str) -> dict:
+    import json
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _compile_condition(cond: dict, fields: set):
+    checks = []
+    for key, arg in cond.items():
+        if key == "maturity_in":
+            values = frozenset(v.lower() for v in arg)
+            fields.add("maturity")
+            checks.append(lambda f, values=values: f["maturity"] in values)
+        elif key == "stars_over":
+            checks.append(lambda f, n=arg: f["stars"] > n)
+        elif key == "contains":
+            pairs = tuple((field, tuple(subs)) for field, subs in arg.items())
+            fields.update(arg)
+            checks.append(lambda f, pairs=pairs: any(s in f[field] for field, subs in pairs for s in subs))
+        else:
+            raise ValueError(f"unknown rule condition: {key!r}")
+    if len(checks) == 1:
+        return checks[0]
+    return lambda f: all(check(f) for check in checks)
+
+
+def _compile_ladder(rules: list, fields: set, where: str):
+    """First-match rule list -> function(features) -> score"""
+    if not rules or "if" in rules[-1]:
+        raise ValueError(f"{where}: the last rule must be an unconditional fallback")
+    steps = tuple((_compile_condition(r["if"], fields) if "if" in r else None, float(r["score"])) for r in rules)
+
+    def evaluate(f):
+        for test, score in steps:
+            if test is None or test(f):
+                return score
+    return evaluate
+
+
+# Features every framework gets besides the lowercased rule fields
+NUMERIC_FEATURES = ("stars", "growth", "day", "penalty_mask")
+
+
+class ScoringKernel:
+    def __init__(self, rules: dict, frameworks: list, reference_day: int, features: list = None):
+        missing = [c for c in COMPONENTS if c not in rules.get("weights", {})]
+        if missing:
+            raise ValueError(f"scoring rules lack weights for: {', '.join(missing)}")
+        self.weights = {c: float(rules["weights"][c]) for c in COMPONENTS}
+        self.reference_day = reference_day
+        self._fields = {"maturity"}
+
+        use_case = rules["use_case"]
+        self._uc_fields = tuple(use_case["fields"])
+        self._fields.update(self._uc_fields)
+        self._uc_keywords = {k: tuple(v) for k, v in use_case["keywords"].items()}
+        self._uc_unknown = float(use_case.get("unknown", 0.5))
+
+        exp = rules["experience"]
+        self._experience = {level: _compile_ladder(ladder, self._fields, f"experience.{level}")
+                            for level, ladder in exp["levels"].items()}
+        self._experience_otherwise = exp["otherwise"]
+
+        dep = rules["deployment"]
+        self._deployment = {target: _compile_ladder(ladder, self._fields, f"deployment.{target}")
+                            for target, ladder in dep["targets"].items()}
+        self._deployment_otherwise = dep["otherwise"]
+
+        self._maturity_table = {m.lower(): {t: float(s) for t, s in row.items()}
+                                for m, row in rules["maturity"]["table"].items()}
+        self._maturity_default = float(rules["maturity"].get("default", 0.5))
+
+        comm = rules["community"]
+        self._star_buckets = tuple((n, float(s)) for n, s in comm["min_stars"])
+        self._star_otherwise = float(comm["otherwise"])
+        self._trend_buckets = tuple((g, float(b)) for g, b in comm.get("trend_min_growth", ()))
+        self._trend_decline = float(comm.get("trend_decline", 0.0))
+
+        req = rules["requirements"]
+        self._req_base, self._req_floor = float(req.get("base", 1.0)), float(req.get("floor", 0.0))
+        self._flag_penalties, self._match_penalties = [], []
+        for bit, p in enumerate(req["penalties"]):
+            if "match_field" in p:
+                self._fields.add(p["match_field"])
+                self._match_penalties.append((1 << bit, p["requirement"], frozenset(p.get("ignore", ())),
+                                              p["match_field"]))
+            else:
+                test = _compile_condition(p.get("unless", {}), self._fields) if p.get("unless") else None
+                self._flag_penalties.append((1 << bit, p["requirement"], test))
+        # Requirement score for every combination of applied penalties, subtracted in rule order
+        penalties = [float(p["penalty"]) for p in req["penalties"]]
+        self._req_table = []
+        for pattern in range(1 << len(penalties)):
+            score = self._req_base
+            for bit, penalty in enumerate(penalties):
+                if pattern >> bit & 1:
+                    score -= penalty
+            self._req_table.append(max(score, self._req_floor))
+
+        maint = rules["maintenance"]
+        self._age_buckets = tuple((n, float(s)) for n, s in maint["max_age_days"])
+        self._maint_stale, self._maint_unknown = float(maint["stale"]), float(maint["unknown"])
+
+        self.frameworks = frameworks
+        # Precomputed features (from feature_columns() of a kernel with the same rules) skip the per-framework pass
+        self._features = features if features is not None else [self.features(fw) for fw in frameworks]
+        self._columns = {}
+        self._weighted = {}
+        self._profiles = {}
+
+    def features(self, framework: dict) -> dict:
+        """Lowercased rule fields plus parsed stars, trend growth and commit day"""
+        # Deferred: recommend.py's warm start takes features from its snapshot and never needs data_loader
+        from data_loader import parse_stars
+
+        f = {field: str(framework.get(field, "") or "").lower() for field in self._fields}
+        f["stars"] = parse_stars(framework.get("stars", "0")) or 0
+        f["growth"] = (framework.get("trend") or {}).get("growth_30d")
+        f["day"] = framework.get("last_commit_days")
+        # Penalties whose "unless" exemption does not hold for this framework
+        f["penalty_mask"] = sum(bit for bit, _, test in self._flag_penalties if test is None or not test(f))
+        return f
+
+    def feature_rows(self) -> list:
+        """Every framework's feature dict, reusable as `features` for a kernel with the same rules"""
+        return self._features
+
+    def feature_columns(self) -> dict:
+        """Every framework's features as columns: {name: [value per framework]}, rule fields first"""
+        names = tuple(sorted(self._fields)) + NUMERIC_FEATURES
+        return {name: [f[name] for f in self._features] for name in names}
+
+    # Per-framework evaluators; value is the requirement the component depends on
+
+    def _use_case(self, f, use_case):
+        keywords = self._uc_keywords.get(use_case)
+        if not keywords:
+            return self._uc_unknown
+        matches = sum(1 for kw in keywords if any(kw in f[field] for field in self._uc_fields))
+        return min(matches / len(keywords), 1.0)
+
+    def _experience_fit(self, f, experience):
+        ladder = self._experience.get(experience) or self._experience[self._experience_otherwise]
+        return ladder(f)
+
+    def _deployment_match(self, f, deployment):
+        ladder = self._deployment.get(deployment) or self._deployment[self._deployment_otherwise]
+        return ladder(f)
+
+    def _maturity(self, f, timeline):
+        return self._maturity_table.get(f["maturity"], {}).get(timeline, self._maturity_default)
+
+    def _community(self, f, _=None):
+        score = self._star_otherwise
+        for min_stars, bucket in self._star_buckets:
+            if f["stars"] >= min_stars:
+                score = bucket
+                break
+        adjust, growth = 0.0, f["growth"]
+        if growth is not None:
+            if growth < 0:
+                adjust = self._trend_decline
+            else:
+                for min_growth, bonus in self._trend_buckets:
+                    if growth >= min_growth:
+                        adjust = bonus
+                        break
+        return min(max(score + adjust, 0.0), 1.0)
+
+    def _requirements(self, f, key):
+        active, matches = key
+        pattern = f["penalty_mask"] & active
+        for (bit, _, _, field), value in zip(self._match_penalties, matches):
+            if value is not None and value not in f[field]:
+                pattern |= bit
+        return self._req_table[pattern]
+
+    def _maintenance(self, f, _=None):
+        if f["day"] is None:
+            return self._maint_unknown
+        age = self.reference_day - f["day"]
+        for max_age, score in self._age_buckets:
+            if age <= max_age:
+                return score
+        return self._maint_stale
+
+    def keys(self, requirements) -> tuple:
+        """The requirement value each component depends on, in COMPONENTS order"""
+        active = sum(bit for bit, attr, _ in self._flag_penalties if getattr(requirements, attr))
+        matches = []
+        for _, attr, ignore, _ in self._match_penalties:
+            value = getattr(requirements, attr)
+            matches.append(None if value in ignore else str(value).lower())
+        return (requirements.use_case, requirements.experience, requirements.deployment,
+                requirements.timeline, None, (active, tuple(matches)), None)
+
+    def _evaluators(self):
+        return (self._use_case, self._experience_fit, self._deployment_match, self._maturity,
+                self._community, self._requirements, self._maintenance)
+
+    def column(self, index: int, key) -> list:
+        """Unweighted scores of component COMPONENTS[index] for every framework"""
+        col = self._columns.get((index, key))
+        if col is None:
+            evaluate = self._evaluators()[index]
+            col = self._columns[(index, key)] = [evaluate(f, key) for f in self._features]
+        return col
+
+    def weighted_column(self, index: int, key) -> list:
+        weight = self.weights[COMPONENTS[index]]
+        col = self._weighted.get((index, key, weight))
+        if col is None:
+            col = self._weighted[(index, key, weight)] = [s * weight for s in self.column(index, key)]
+        return col
+
+    def resolve_weights(self, weights: dict = None) -> dict:
+        """Rule-set weights with per-request overrides applied"""
+        if not weights:
+            return self.weights
+        unknown = set(weights) - set(COMPONENTS)
+        if unknown:
+            raise ValueError(f"unknown score components: {', '.join(sorted(unknown))} "
+                             f"(choose from {', '.join(COMPONENTS)})")
+        return {c: float(weights.get(c, self.weights[c])) for c in COMPONENTS}
+
+    def matrix(self, requirements) -> tuple:
+        """The profile's (component x framework) scores: one unweighted column per component, cached per profile"""
+        keys = self.keys(requirements)
+        cols = self._profiles.get(keys)
+        if cols is None:
+            cols = self._profiles[keys] = tuple(self.column(i, key) for i, key in enumerate(keys))
+        return cols
+
+    def totals(self, requirements, weights: dict = None) -> list:
+        """Weighted total for every framework, summed in COMPONENTS order.
+
+        Rule-set weights use cached weighted columns; per-request weights are a
+        dot product against the profile's cached component matrix.
+        """
+        if not weights:
+            cols = [self.weighted_column(i, key) for i, key in enumerate(self.keys(requirements))]
+            return [a + b + c + d + e + f + g for a, b, c, d, e, f, g in zip(*cols)]
+        w0, w1, w2, w3, w4, w5, w6 = (weights[c] for c in COMPONENTS)
+        return [a * w0 + b * w1 + c * w2 + d * w3 + e * w4 + f * w5 + g * w6
+                for a, b, c, d, e, f, g in zip(*self.matrix(requirements))]
+
+    def breakdown(self, position: int, requirements) -> dict:
+        """Component scores of the framework at `position`, from cached columns where totals() left them"""
+        out = {}
+        for i, (name, evaluate, key) in enumerate(zip(COMPONENTS, self._evaluators(), self.keys(requirements))):
+            col = self._columns.get((i, key))
+            out[name] = col[position] if col is not None else evaluate(self._features[position], key)
+        return out
+
+    def score(self, framework: dict, requirements, weights: dict = None) -> tuple:
+        """(total, component scores) for any framework dict, in or out of the catalog"""
+        weights = weights or self.weights
+        f = self.features(framework)
+        scores = {name: evaluate(f, key)
+                  for name, evaluate, key in zip(COMPONENTS, self._evaluators(), self.keys(requirements))}
+        return sum(scores[name] * weights[name] for name in COMPONENTS), scores
+
+
+def compile_rules(rules: dict, frameworks: list, reference_day: int, features: list = None) -> ScoringKernel:
+    return ScoringKernel(rules, frameworks, reference_day, features)
+
+
+def main():
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Validate a scoring rule set and show its per-component weights")
+    ap.add_argument("--rules", default=os.path.join("data", RULES_FILE))
+    args = ap.parse_args()
+
+    kernel = compile_rules(load_rules(args.rules), [], 0)
+    print(f"{args.rules}: OK")
+    for name in COMPONENTS:
+        print(f"   {name:18} {kernel.weights[name]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
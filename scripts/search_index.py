@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Full-text search over catalog entries and the Markdown guides.
+
+- Documents: every framework / computer-use entry in catalog.json plus every
+  Markdown section (split on headings) in catalog/, patterns/, guides/ and
+  research/papers.md, and the arXiv papers of compare/papers.json
+  (scripts/arxiv_papers.py) when given
+- Sections that mention a framework by name are linked to it, and their text
+  is folded into that framework's document at a low field weight
+- Postings carry precomputed BM25 weights, so answering a query is a sum of
+  posting weights plus a top-k heap
+- Prefix search: "lang*" (and the last query term by default) expands over
+  the sorted term list with bisect
+- Papers keep the frameworks they are linked to; their titles are folded
+  into those frameworks' documents like section text
+- Written by generate_catalog_json.py as compare/search_index.json
+
+Usage:
+  python scripts/search_index.py "multi agent orchestration"
+  python scripts/search_index.py --limit 5 --type section "rag eval*"
+  python scripts/search_index.py --type paper "tool use benchmark"
+"""
+import argparse
+import glob
+import heapq
+import json
+import math
+import os
+import re
+from bisect import bisect_left
+from itertools import accumulate
+
+INDEX_OUT = os.path.join("compare", "search_index.json")
+MARKDOWN_SOURCES = ["catalog/*.md", "patterns/*.md", "guides/*.md", "research/papers.md"]
+
+# Field weights for BM25F-style term frequencies
+FIELD_WEIGHTS = {"name": 3.0, "tags": 2.0, "category": 2.0, "description": 1.0, "models": 0.5,
+                 "notes": 0.5, "title": 2.0, "body": 1.0, "mentions": 0.3}
+BM25_K1 = 1.2
+BM25_B = 0.75
+MAX_PREFIX_EXPANSION = 64
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+LINK_URL_RE = re.compile(r"\]\([^)]*\)|<[^>]+>|https?://\S+")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall((text or "").lower())
+
+
+def markdown_sections(path):
+    """Yield (heading, anchor, body) for each heading-delimited section of a Markdown file"""
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    heading, body, in_code = os.path.basename(path), [], False
+    for line in lines:
+        if line.lstrip().startswith("```"):
+            in_code = not in_code
+        elif not in_code and line.startswith("#"):
+            if body:
+                yield heading, _anchor(heading), "\n".join(body)
+            heading, body = line.lstrip("#").strip(), []
+            continue
+        body.append(line)
+    if body:
+        yield heading, _anchor(heading), "\n".join(body)
+
+
+def _anchor(heading):
+    # GitHub-style anchor: lowercase, drop punctuation, spaces -> dashes; no trimming, so an
+    # emoji-led heading keeps its leading dash ("🧠 Workflow" -> "-workflow")
+    return re.sub(r"[^\w\- ]", "", heading.lower()).replace(" ", "-")
+
+
+def _name_matcher(frameworks):
+    """Map first token -> [(name tokens, framework index)] for linear-time mention scans"""
+    by_first = {}
+    for i, fw in enumerate(frameworks):
+        for part in {fw.get("name", "")} | set(fw.get("name", "").split("/")):
+            toks = tuple(tokenize(part))
+            if toks:
+                by_first.setdefault(toks[0], set()).add((toks, i))
+    return by_first
+
+
+def _mentions(tokens, by_first):
+    found = set()
+    for pos, tok in enumerate(tokens):
+        for toks, i in by_first.get(tok, ()):
+            if tuple(tokens[pos:pos + len(toks)]) == toks:
+                found.add(i)
+    return found
+
+
+def build_index(catalog, markdown_paths=None, papers=None):
+    """Build the search index dict from a catalog, Markdown files and papers.json papers"""
+    frameworks = catalog.get("frameworks", [])
+    computer_use = catalog.get("computer_use", [])
+    if markdown_paths is None:
+        markdown_paths = sorted({p for pattern in MARKDOWN_SOURCES for p in glob.glob(pattern)})
+
+    docs, fields = [], []
+    for fw in frameworks:
+        docs.append({"type": "framework", "title": fw.get("name", ""), "ref": fw.get("name", "")})
+        fields.append({k: fw.get(k, "") for k in ("name", "tags", "category", "description", "models")})
+    for cu in computer_use:
+        docs.append({"type": "computer_use", "title": cu.get("name", ""), "ref": cu.get("name", "")})
+        fields.append({"name": cu.get("name", ""), "description": cu.get("notes", ""),
+                       "category": " ".join(cu.get(k, "") for k in ("modality", "scope", "sandboxing"))})
+
+    by_first = _name_matcher(frameworks)
+    for path in markdown_paths:
+        rel = path.replace(os.sep, "/")
+        for heading, anchor, body in markdown_sections(path):
+            text = LINK_URL_RE.sub(" ", body)
+            tokens = tokenize(text)
+            if not tokens:
+                continue
+            linked = _mentions(tokenize(heading) + tokens, by_first)
+            docs.append({"type": "section", "title": heading, "ref": f"{rel}#{anchor}",
+                         "frameworks": sorted(frameworks[i].get("name", "") for i in linked)})
+            fields.append({"title": heading, "body": text})
+            for i in linked:
+                fields[i].setdefault("mentions", []).extend((heading, text))
+
+    by_name = {fw.get("name", ""): i for i, fw in enumerate(frameworks)}
+    for paper in papers or []:
+        docs.append({"type": "paper", "title": paper.get("title", ""), "ref": paper.get("url", ""),
+                     "frameworks": paper.get("frameworks", [])})
+        # Labels it is cited under and the frameworks it is linked to make it findable by name too
+        fields.append({"title": paper.get("title", ""), "body": paper.get("abstract", ""),
+                       "category": " ".join(paper.get("categories", [])),
+                       "notes": " ".join(paper.get("authors", []) + paper.get("agents", [])),
+                       "mentions": [s.get("label", "") for s in paper.get("sources", [])] + paper.get("frameworks", [])})
+        for name in paper.get("frameworks", []):
+            if name in by_name:
+                fields[by_name[name]].setdefault("mentions", []).append(paper.get("title", ""))
+
+    # Weighted term frequencies and lengths per document
+    doc_tfs, lengths = [], []
+    for f in fields:
+        tf = {}
+        for field, text in f.items():
+            if isinstance(text, list):
+                text = " ".join(text)
+            weight = FIELD_WEIGHTS.get(field, 1.0)
+            for tok in tokenize(text):
+                tf[tok] = tf.get(tok, 0.0) + weight
+        doc_tfs.append(tf)
+        lengths.append(sum(tf.values()))
+    n = len(doc_tfs)
+    avgdl = (sum(lengths) / n) if n else 1.0
+
+    postings = {}
+    for doc_id, tf in enumerate(doc_tfs):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / avgdl)
+        for term, freq in tf.items():
+            postings.setdefault(term, []).append((doc_id, freq * (BM25_K1 + 1) / (freq + norm)))
+
+    terms = sorted(postings)
+    encoded = []
+    for term in terms:
+        plist = postings[term]
+        idf = math.log(1 + (n - len(plist) + 0.5) / (len(plist) + 0.5))
+        # Doc ids delta-encoded, weights as integers x1000, interleaved
+        flat, prev = [], 0
+        for doc_id, w in plist:
+            flat.append(doc_id - prev)
+            flat.append(max(round(idf * w * 1000), 1))
+            prev = doc_id
+        encoded.append(flat)
+    return {"version": 1, "docs": docs, "terms": terms, "postings": encoded}
+
+
+def write_index(index, path=INDEX_OUT):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+
+
+class SearchIndex:
+    def __init__(self, index):
+        self.docs = index["docs"]
+        self.terms = index["terms"]
+        self._encoded = index["postings"]
+        self._term_ids = {t: i for i, t in enumerate(self.terms)}
+        self._decoded = {}
+
+    @classmethod
+    def load(cls, path=INDEX_OUT):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _postings(self, term_id):
+        """{doc id: weight} for a term, decoded once and cached"""
+        plist = self._decoded.get(term_id)
+        if plist is None:
+            flat = self._encoded[term_id]
+            plist = dict(zip(accumulate(flat[0::2]), flat[1::2]))
+            self._decoded[term_id] = plist
+        return plist
+
+    def expand(self, prefix):
+        """Term ids starting with prefix (capped at MAX_PREFIX_EXPANSION)"""
+        ids = []
+        i = bisect_left(self.terms, prefix)
+        while i < len(self.terms) and self.terms[i].startswith(prefix) and len(ids) < MAX_PREFIX_EXPANSION:
+            ids.append(i)
+            i += 1
+        return ids
+
+    def search(self, query, limit=10, prefix_last=True, doc_type=None):
+        """Return [(score, doc)] best-first; "term*" or the last term (prefix_last) match as prefixes"""
+        raw = query.split()
+        groups = []
+        for pos, word in enumerate(raw):
+            is_prefix = word.endswith("*") or (prefix_last and pos == len(raw) - 1)
+            for tok in tokenize(word):
+                if is_prefix:
+                    term_ids = self.expand(tok)
+                else:
+                    term_ids = [self._term_ids[tok]] if tok in self._term_ids else []
+                if not term_ids:
+                    continue
+                # A prefix contributes its best-matching expansion per doc, not the sum
+                plists = sorted((self._postings(t) for t in term_ids), key=len, reverse=True)
+                best = plists[0]
+                if len(plists) > 1:
+                    best = dict(best)
+                    for plist in plists[1:]:
+                        for doc, w in plist.items():
+                            if w > best.get(doc, 0):
+                                best[doc] = w
+                groups.append(best)
+
+        # Start from a C-level copy of the longest posting list, fold the shorter ones in
+        groups.sort(key=len, reverse=True)
+        scores = dict(groups[0]) if groups else {}
+        for plist in groups[1:]:
+            for doc, w in plist.items():
+                scores[doc] = scores.get(doc, 0) + w
+        if doc_type:
+            scores = {d: s for d, s in scores.items() if self.docs[d]["type"] == doc_type}
+        top = heapq.nlargest(limit, scores, key=scores.get)
+        return [(scores[d] / 1000.0, self.docs[d]) for d in top]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Search frameworks and Markdown guides")
+    ap.add_argument("query", nargs="+")
+    ap.add_argument("--index", default=INDEX_OUT)
+    ap.add_argument("--limit", type=int, default=10)
+    ap.add_argument("--type", choices=["framework", "computer_use", "section", "paper"], help="Only return this document type")
+    ap.add_argument("--exact", action="store_true", help="Do not prefix-match the last term")
+    args = ap.parse_args()
+
+    if not os.path.exists(args.index):
+        from generate_catalog_json import load_or_build
+        index = SearchIndex(build_index(load_or_build()))
+    else:
+        index = SearchIndex.load(args.index)
+
+    for score, doc in index.search(" ".join(args.query), args.limit, not args.exact, args.type):
+        extra = f"  [{', '.join(doc['frameworks'][:5])}]" if doc.get("frameworks") else ""
+        print(f"{score:7.2f}  {doc['type']:<12} {doc['title']}  ({doc['ref']}){extra}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Multi-process recommendation scoring over a shared-memory copy of the catalog.
+
+- The engine's compiled per-framework features (the lowercased fields the
+  rules read, parsed stars, trend growth, commit day and penalty mask, see
+  ScoringKernel.feature_columns) are packed once into a single
+  multiprocessing.shared_memory block: numeric features as fixed-width
+  columns, text features as UTF-8 bytes plus an offsets column. Workers get
+  the block's name and layout (a few hundred bytes) and never a pickled catalog
+- partition="frameworks" (default): the catalog is cut into one contiguous
+  range per worker; each worker decodes only its range, scores every profile
+  of a batch against it and returns its top-k (total, position) pairs, which
+  the parent merges with heapq.nlargest. Ranges are merged in catalog order
+  and ties keep catalog order within a range, so the merged top-k is exactly
+  FrameworkRecommendationEngine.recommend's (same frameworks, same float
+  totals, same order)
+- partition="queries": every worker decodes the whole catalog once and the
+  profiles are split across workers -- for large batches over a catalog that
+  fits in each worker
+- Workers keep their decoded rows and per-requirement score columns between
+  batches, like the engine does
+- Only the merged top-k get a detailed breakdown and reason, in the parent
+
+Usage:
+  python scripts/recommend.py --batch --workers 4 < profiles.ndjson
+  python scripts/benchmark.py parallel --sizes 100000 --workers 1 2 4
+"""
+import heapq
+import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from scoring_rules import compile_rules
+
+PARTITIONS = ("frameworks", "queries")
+# Typecodes of the numeric features; None is stored as NO_INT / NaN
+FEATURE_TYPES = {"stars": "q", "growth": "d", "day": "q", "penalty_mask": "q"}
+NO_INT = -2 ** 63
+# Profiles per task in "queries" mode (per worker there are several, for load balance)
+QUERY_CHUNK = 64
+
+
+def _encode(name, values):
+    """(typecode, bytes) of one feature column"""
+    kind = FEATURE_TYPES.get(name)
+    if kind == "q":
+        return kind, array("q", (NO_INT if v is None else v for v in values)).tobytes()
+    if kind == "d":
+        return kind, array("d", (math.nan if v is None else v for v in values)).tobytes()
+    return "text", b"".join(v.encode("utf-8") for v in values)
+
+
+def pack_features(columns: dict):
+    """Shared-memory block holding the feature columns; returns (SharedMemory, layout)"""
+    parts, layout, size = [], [], 0
+
+    def add(data):
+        nonlocal size
+        offset = size
+        parts.append((offset, data))
+        size += len(data) + (-len(data)) % 8  # keep every column 8-byte aligned
+        return offset
+
+    rows = len(next(iter(columns.values()), []))
+    for name, values in columns.items():
+        kind, data = _encode(name, values)
+        if kind == "text":
+            ends = array("q", [0])
+            for v in values:
+                ends.append(ends[-1] + len(v.encode("utf-8")))
+            layout.append((name, kind, add(data), len(data), add(ends.tobytes())))
+        else:
+            layout.append((name, kind, add(data), len(data), None))
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for offset, data in parts:
+        shm.buf[offset:offset + len(data)] = data
+    return shm, {"rows": rows, "columns": layout}
+
+
+def unpack_features(buf, layout: dict, start: int, stop: int) -> list:
+    """Feature dicts of rows [start, stop) read straight from the shared block"""
+    columns = []
+    for name, kind, offset, length, ends_at in layout["columns"]:
+        if kind == "text":
+            with buf[ends_at:ends_at + 8 * (layout["rows"] + 1)].cast("q") as ends:
+                bounds = ends[start:stop + 1].tolist()
+            with buf[offset:offset + length] as blob:
+                values = [str(blob[a:b], "utf-8") for a, b in zip(bounds, bounds[1:])]
+        else:
+            with buf[offset:offset + length].cast(kind) as view:
+                values = view[start:stop].tolist()
+            if kind == "q":
+                values = [None if v == NO_INT else v for v in values]
+            else:
+                values = [None if v != v else v for v in values]
+        columns.append((name, values))
+    names = [name for name, _ in columns]
+    return [dict(zip(names, row)) for row in zip(*(values for _, values in columns))]
+
+
+# Worker state: the shared block's name and layout, the rules, and one kernel per decoded range
+_worker = {}
+
+
+def _init_worker(shm_name, layout, rules, reference_day):
+    _worker.update(shm_name=shm_name, layout=layout, rules=rules, reference_day=reference_day, kernels={})
+
+
+def _kernel(start, stop):
+    kernel = _worker["kernels"].get((start, stop))
+    if kernel is None:
+        shm = shared_memory.SharedMemory(name=_worker["shm_name"])
+        try:
+            features = unpack_features(shm.buf, _worker["layout"], start, stop)
+        finally:
+            shm.close()
+        kernel = _worker["kernels"][(start, stop)] = compile_rules(_worker["rules"], [], _worker["reference_day"],
+                                                                   features)
+    return kernel
+
+
+def _score(job):
+    """Top-k (total, catalog position) pairs per query for the rows [start, stop)"""
+    start, stop, queries = job
+    kernel = _kernel(start, stop)
+    out = []
+    for requirements, top_k, weights in queries:
+        totals = kernel.totals(requirements, weights)
+        top = heapq.nlargest(top_k, range(len(totals)), key=totals.__getitem__)
+        out.append([(totals[i], start + i) for i in top])
+    return out
+
+
+class SharedScoringPool:
+    """Process pool scoring requirement profiles against an engine's catalog held in shared memory"""
+
+    def __init__(self, engine, workers: int = None, partition: str = "frameworks"):
+        if partition not in PARTITIONS:
+            raise ValueError(f"unknown partition: {partition!r} (choose from {', '.join(PARTITIONS)})")
+        self.engine = engine
+        self.workers = workers or os.cpu_count() or 1
+        self.partition = partition
+        n = len(engine.frameworks)
+        self.shm, layout = pack_features(engine.kernel.feature_columns())
+        if partition == "frameworks":
+            bounds = [n * i // self.workers for i in range(self.workers + 1)]
+            self.ranges = [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a] or [(0, 0)]
+        else:
+            self.ranges = [(0, n)]
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                        initargs=(self.shm.name, layout, engine.rules, engine.reference_day))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.pool.shutdown()
+        self.shm.close()
+        self.shm.unlink()
+
+    def top_positions(self, queries: list) -> list:
+        """Merged top-k [(total, catalog position)] per (requirements, top_k, weights) query"""
+        kernel = self.engine.kernel
+        resolved = []
+        for requirements, top_k, weights in queries:
+            weights = kernel.resolve_weights(weights)
+            # Rule-set weights go down the engine's cached weighted-column path
+            resolved.append((requirements, top_k, None if weights is kernel.weights else weights))
+        if self.partition == "queries":
+            jobs = [(0, self.ranges[0][1], resolved[i:i + QUERY_CHUNK]) for i in range(0, len(resolved), QUERY_CHUNK)]
+            return [hits for block in self.pool.map(_score, jobs) for hits in block]
+        parts = list(self.pool.map(_score, [(a, b, resolved) for a, b in self.ranges]))
+        # Ranges in catalog order + a stable nlargest: ties resolve to the lower position, as in the serial engine
+        return [heapq.nlargest(top_k, [hit for part in parts for hit in part[q]], key=lambda hit: hit[0])
+                for q, (_, top_k, _) in enumerate(resolved)]
+
+    def recommend_batch(self, queries: list) -> list:
+        """engine.recommend() results for every (requirements, top_k, weights) query"""
+        return [[self.engine.recommendation(i, total, requirements) for total, i in hits]
+                for hits, (requirements, _, _) in zip(self.top_positions(queries), queries)]
+
+    def recommend(self, requirements, top_k: int = 5, weights: dict = None) -> list:
+        return self.recommend_batch([(requirements, top_k, weights)])[0]
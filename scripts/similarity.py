@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+"Similar frameworks" nearest-neighbour index.
+
+- Each framework becomes an L2-normalized TF-IDF vector over description,
+  tags, category and models (field-weighted, sublinear tf), held as a sparse
+  CSR matrix of NumPy arrays
+- Neighbours are found through the transposed (term -> frameworks) postings
+  rather than by comparing every pair: each framework queries with its
+  QUERY_TERMS heaviest terms, each posting list keeps only its MAX_POSTINGS
+  heaviest entries, and a whole block of frameworks is scored at once with
+  vectorized gather / sort / segment sums -- so cost grows with the number of
+  frameworks, not its square
+- generate_catalog_json.py stores the top-k per framework as `similar` in
+  catalog.json; FrameworkRecommendationEngine.similar() answers ad-hoc
+  queries by name or free text
+
+NumPy is imported lazily; the catalog build skips `similar` without it.
+
+Usage:
+  python scripts/similarity.py LangChain
+  python scripts/similarity.py --text "browser automation agent" -k 10
+"""
+import argparse
+import math
+
+from search_index import tokenize
+
+FIELD_WEIGHTS = {"description": 1.0, "tags": 2.0, "category": 2.0, "models": 0.5}
+QUERY_TERMS = 64     # heaviest terms of a framework used to find candidates
+MAX_POSTINGS = 128   # heaviest frameworks kept per term for candidate generation
+BLOCK_SIZE = 512     # frameworks scored per vectorized batch
+DEFAULT_K = 5
+
+
+def _term_weights(row):
+    tf = {}
+    for field, weight in FIELD_WEIGHTS.items():
+        for tok in tokenize(row.get(field, "")):
+            tf[tok] = tf.get(tok, 0.0) + weight
+    return tf
+
+
+class SimilarityIndex:
+    def __init__(self, frameworks):
+        import numpy as np
+
+        self.names = [fw.get("name", "") for fw in frameworks]
+        self._positions = {name.lower(): i for i, name in reversed(list(enumerate(self.names)))}
+        tfs = [_term_weights(fw) for fw in frameworks]
+        self.vocab = {}
+        df = []
+        for tf in tfs:
+            for term in tf:
+                if term not in self.vocab:
+                    self.vocab[term] = len(df)
+                    df.append(0)
+                df[self.vocab[term]] += 1
+        n = len(tfs)
+        self.idf = np.log((n + 1) / (np.asarray(df, dtype=np.float64) + 1)) + 1.0
+
+        # CSR rows: sublinear tf x idf, L2-normalized
+        indptr, indices, data = [0], [], []
+        for tf in tfs:
+            indices.extend(self.vocab[t] for t in tf)
+            data.extend(1.0 + math.log(v) for v in tf.values())
+            indptr.append(len(indices))
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=np.float64) * self.idf[self.indices]
+        rows = np.repeat(np.arange(n), np.diff(self.indptr))
+        norms = np.sqrt(np.bincount(rows, self.data ** 2, minlength=n))
+        self.data /= np.maximum(norms, 1e-12)[rows]
+        self._rows = rows
+
+        # Query terms: each row's QUERY_TERMS heaviest entries, grouped by row
+        order = np.lexsort((-self.data, rows))
+        rank = np.arange(len(order)) - self.indptr[rows[order]]
+        keep = order[rank < QUERY_TERMS]
+        self.q_row, self.q_term, self.q_weight = rows[keep], self.indices[keep], self.data[keep]
+        self.q_ptr = np.searchsorted(self.q_row, np.arange(n + 1))
+
+        # Postings: term -> rows by descending weight, truncated to MAX_POSTINGS
+        order = np.lexsort((-self.data, self.indices))
+        terms = self.indices[order]
+        term_start = np.searchsorted(terms, np.arange(len(df) + 1))
+        rank = np.arange(len(order)) - term_start[terms]
+        keep = order[rank < MAX_POSTINGS]
+        self.p_row, self.p_weight = rows[keep], self.data[keep]
+        self.p_ptr = np.searchsorted(self.indices[keep], np.arange(len(df) + 1))
+
+    def position(self, name):
+        return self._positions.get(name.strip().lower())
+
+    def _score(self, q_row, q_term, q_weight, n_queries, k, exclude=None):
+        """Top-k (query, row, score) triples for a batch of query term entries"""
+        import numpy as np
+
+        starts, lens = self.p_ptr[q_term], self.p_ptr[q_term + 1] - self.p_ptr[q_term]
+        total = int(lens.sum())
+        if not total:
+            return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0)
+        # Expand every (query, term) entry over that term's postings in one gather
+        entry = np.repeat(np.arange(len(q_term)), lens)
+        offset = np.arange(total) - np.repeat(np.cumsum(lens) - lens, lens)
+        idx = starts[entry] + offset
+        queries, cands = q_row[entry], self.p_row[idx]
+        products = q_weight[entry] * self.p_weight[idx]
+        if exclude is not None:
+            mask = cands != exclude[queries]
+            queries, cands, products = queries[mask], cands[mask], products[mask]
+            if not len(products):  # only self-matches (e.g. a one-framework catalog); reduceat needs input
+                return np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0)
+
+        # Sum products per (query, candidate) pair: one sort, then segment sums
+        keys = queries * len(self.names) + cands
+        if n_queries * len(self.names) < 2 ** 31:
+            keys = keys.astype(np.int32)  # narrower keys sort noticeably faster
+        order = np.argsort(keys)
+        keys = keys[order]
+        heads = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        scores = np.add.reduceat(products[order], heads)
+        keys = keys[heads].astype(np.int64)
+        queries, cands = keys // len(self.names), keys % len(self.names)
+        # Best first per query (cosines are <= 1, so query + (1 - score) / 4 sorts by query, then score);
+        # the stable sort keeps equal scores in catalog (stars) order
+        order = np.argsort(queries + (1.0 - np.round(scores, 9)) / 4, kind="stable")
+        queries, cands, scores = queries[order], cands[order], scores[order]
+        first = np.searchsorted(queries, np.arange(n_queries))
+        keep = (np.arange(len(queries)) - first[queries]) < k
+        return queries[keep], cands[keep], scores[keep]
+
+    def neighbours(self, k=DEFAULT_K, block_size=BLOCK_SIZE):
+        """[[(row, score), ...] for every framework], top-k each, self excluded"""
+        import numpy as np
+
+        n = len(self.names)
+        out = [[] for _ in range(n)]
+        for a in range(0, n, block_size):
+            b = min(a + block_size, n)
+            lo, hi = self.q_ptr[a], self.q_ptr[b]
+            exclude = np.arange(a, b)
+            queries, cands, scores = self._score(self.q_row[lo:hi] - a, self.q_term[lo:hi], self.q_weight[lo:hi],
+                                                 b - a, k, exclude)
+            for q, c, s in zip(queries.tolist(), cands.tolist(), scores.tolist()):
+                out[a + q].append((c, s))
+        return out
+
+    def query(self, text=None, name=None, k=DEFAULT_K):
+        """[(row, score)] most similar to a framework name or to free text"""
+        import numpy as np
+
+        if name is not None:
+            pos = self.position(name)
+            if pos is None:
+                raise KeyError(name)
+            lo, hi = self.q_ptr[pos], self.q_ptr[pos + 1]
+            terms, weights, exclude = self.q_term[lo:hi], self.q_weight[lo:hi], np.array([pos])
+        else:
+            tf = {self.vocab[t]: v for t, v in _term_weights({"description": text}).items() if t in self.vocab}
+            terms = np.fromiter(tf, dtype=np.int64, count=len(tf))
+            weights = np.array([1.0 + math.log(v) for v in tf.values()]) * self.idf[terms]
+            weights /= max(float(np.sqrt((weights ** 2).sum())), 1e-12)
+            top = np.argsort(-weights, kind="stable")[:QUERY_TERMS]
+            terms, weights, exclude = terms[top], weights[top], None
+        _, cands, scores = self._score(np.zeros(len(terms), np.int64), terms, weights, 1, k, exclude)
+        return list(zip(cands.tolist(), scores.tolist()))
+
+
+def build_similar(frameworks, k=DEFAULT_K):
+    """Per-framework [{"name", "score"}] neighbour lists, in the order of frameworks"""
+    index = SimilarityIndex(frameworks)
+    return [[{"name": index.names[c], "score": round(s, 4)} for c, s in hits] for hits in index.neighbours(k)]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Find frameworks similar to a given one or to free text")
+    ap.add_argument("name", nargs="?", help="Framework name as listed in the catalog")
+    ap.add_argument("--text", help="Free-text description to match instead of a name")
+    ap.add_argument("-k", type=int, default=DEFAULT_K)
+    args = ap.parse_args()
+    if not args.name and not args.text:
+        ap.error("give a framework name or --text")
+
+    from recommend import FrameworkRecommendationEngine
+    engine = FrameworkRecommendationEngine()
+    try:
+        hits = engine.similar(args.name, k=args.k) if args.name else engine.similar(text=args.text, k=args.k)
+    except KeyError:
+        ap.error(f"unknown framework: {args.name}")
+    for hit in hits:
+        print(f"{hit['score']:.3f}  {hit['name']}")
+
+
+if __name__ == "__main__":
+    main()
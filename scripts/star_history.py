@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Append-only star history and vectorized trend computation.
+
+- Every refresh (refresh_csv.py / refresh_stars.py) appends one
+  (day, stars, forks) sample per canonical repo to data/star_history.json;
+  a second refresh on the same day replaces that day's sample, older samples
+  are never rewritten
+- Storage is columnar per repo: epoch days, stars and forks are separate
+  delta-encoded integer arrays, one repo per line so weekly commits diff
+  cleanly
+- compute_trends() flattens all series into single NumPy arrays and derives,
+  for every repo at once: stars/day over the last 30 days, 30-day relative
+  growth, momentum (last 30 days vs the 90 before), acceleration (change in
+  daily rate between consecutive 30-day windows) and spike/drop anomaly flags,
+  each repo's windows ending at its own latest sample
+- generate_catalog_json.py attaches the result to each framework as `trend`,
+  and recommend.py folds growth into the community score
+
+NumPy is only imported when trends are computed; recording history does not
+need it.
+
+Usage:
+  python scripts/star_history.py                 # fastest growing repos
+  python scripts/star_history.py --repo langchain-ai/langchain
+"""
+import argparse
+import json
+import os
+
+HISTORY_PATH = os.path.join("data", "star_history.json")
+
+TREND_WINDOW = 30     # days for the recent growth rate
+MOMENTUM_BASE = 90    # days before the recent window that momentum compares against
+ANOMALY_Z = 3.5       # robust z-score of the latest interval's rate that counts as a spike
+ANOMALY_MIN_INTERVALS = 4
+DROP_RATIO = 0.9      # latest sample below this fraction of the previous one is a drop
+
+
+def _deltas(values):
+    out, prev = [], 0
+    for v in values:
+        out.append(v - prev)
+        prev = v
+    return out
+
+
+def _undelta(values):
+    out, total = [], 0
+    for v in values:
+        total += v
+        out.append(total)
+    return out
+
+
+def _as_int(val):
+    try:
+        return int(str(val).replace(",", "").strip())
+    except ValueError:
+        return None
+
+
+class StarHistory:
+    def __init__(self, path: str = HISTORY_PATH):
+        self.path = path
+        self.series = {}  # canonical key -> ([days], [stars], [forks]), days strictly increasing
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            for key, cols in data.get("series", {}).items():
+                self.series[key] = (_undelta(cols["day"]), _undelta(cols["stars"]), _undelta(cols["forks"]))
+
+    def append(self, key: str, day: int, stars, forks=None) -> bool:
+        """Append a sample; same-day samples replace the last one, earlier days are ignored"""
+        stars = _as_int(stars)
+        if stars is None:
+            return False
+        days, star_col, fork_col = self.series.setdefault(key, ([], [], []))
+        forks = _as_int(forks)
+        if forks is None:
+            forks = fork_col[-1] if fork_col else 0
+        if days and day < days[-1]:
+            return False
+        if days and day == days[-1]:
+            star_col[-1], fork_col[-1] = stars, forks
+            return True
+        days.append(day)
+        star_col.append(stars)
+        fork_col.append(forks)
+        return True
+
+    def record(self, results, day: int) -> int:
+        """Append RepoRegistry.fetch_all() results ({canonical key: info}) for day"""
+        return sum(self.append(key, day, info.get("stars"), info.get("forks")) for key, info in results.items())
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        lines = []
+        for key in sorted(self.series):
+            days, stars, forks = self.series[key]
+            cols = {"day": _deltas(days), "stars": _deltas(stars), "forks": _deltas(forks)}
+            lines.append(f"{json.dumps(key)}:{json.dumps(cols, separators=(',', ':'))}")
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write('{"version":1,"series":{\n' + ",\n".join(lines) + "\n}}\n")
+
+
+def _flatten(history):
+    import numpy as np
+
+    keys = [k for k, (days, _, _) in history.series.items() if days]
+    counts = np.array([len(history.series[k][0]) for k in keys], dtype=np.int64)
+    days = np.fromiter((d for k in keys for d in history.series[k][0]), dtype=np.int64, count=int(counts.sum()))
+    stars = np.fromiter((s for k in keys for s in history.series[k][1]), dtype=np.float64, count=int(counts.sum()))
+    return keys, counts, days, stars
+
+
+def compute_trends(history: StarHistory, reference_day: int = None) -> dict:
+    """{canonical key: trend dict} for every repo with history; None marks windows history does not cover.
+
+    Each repo's windows end at its own last sample (or reference_day, if earlier): a repo the last
+    refresh missed is measured over its latest 30 days of data, not against a "now" it has no sample for.
+    """
+    import numpy as np
+
+    keys, counts, days, stars = _flatten(history)
+    if not keys:
+        return {}
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    first_day, last_day = days[starts], days[ends - 1]
+    if reference_day is None:
+        reference_day = int(days.max())
+    as_of = np.minimum(reference_day, last_day)
+
+    # One global searchsorted: offset each repo's days so the series sort as one array
+    span = int(days.max() - days.min()) + 1
+    repo = np.repeat(np.arange(len(keys)), counts)
+    composite = repo * span + (days - days.min())
+
+    def stars_at(day):
+        """Linearly interpolated stars per repo at `day`, a scalar or one day per repo (NaN before the first sample)"""
+        q = np.clip(np.broadcast_to(day, len(keys)), first_day, last_day)
+        i = np.searchsorted(composite, np.arange(len(keys)) * span + (q - days.min()), side="right") - 1
+        j = np.minimum(i + 1, ends - 1)
+        gap = days[j] - days[i]
+        frac = np.divide(q - days[i], gap, out=np.zeros(len(keys)), where=gap > 0)
+        out = stars[i] + (stars[j] - stars[i]) * frac
+        return np.where(day >= first_day, out, np.nan)
+
+    now = stars_at(as_of)
+    w1 = stars_at(as_of - TREND_WINDOW)
+    w2 = stars_at(as_of - 2 * TREND_WINDOW)
+    base = stars_at(as_of - TREND_WINDOW - MOMENTUM_BASE)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = (now - w1) / TREND_WINDOW
+        prev_rate = (w1 - w2) / TREND_WINDOW
+        base_rate = (w1 - base) / MOMENTUM_BASE
+        growth = np.where(w1 > 0, (now - w1) / w1, np.nan)
+        momentum = np.where(base_rate > 0, rate / base_rate, np.nan)
+        acceleration = rate - prev_rate
+
+        # Per-interval daily rates, padded into a (repos x intervals) matrix for row-wise robust stats
+        same_repo = repo[1:] == repo[:-1]
+        interval_rate = np.diff(stars) / np.maximum(np.diff(days), 1)
+        width = int(counts.max()) - 1
+        matrix = np.full((len(keys), max(width, 1)), np.nan)
+        pos = np.arange(len(days) - 1) - starts[repo[:-1]]
+        matrix[repo[:-1][same_repo], pos[same_repo]] = interval_rate[same_repo]
+        n_intervals = counts - 1
+        last_rate = matrix[np.arange(len(keys)), np.maximum(n_intervals - 1, 0)]
+        history_rows = n_intervals >= ANOMALY_MIN_INTERVALS
+        med = np.full(len(keys), np.nan)
+        mad = np.full(len(keys), np.nan)
+        if history_rows.any():
+            sub = matrix[history_rows]
+            med[history_rows] = np.nanmedian(sub, axis=1)
+            mad[history_rows] = np.nanmedian(np.abs(sub - med[history_rows, None]), axis=1)
+        z = (last_rate - med) / np.maximum(1.4826 * mad, 1.0)
+        spike = history_rows & (z > ANOMALY_Z)
+        prev_stars = stars[np.maximum(ends - 2, starts)]
+        drop = (counts >= 2) & (stars[ends - 1] < prev_stars * DROP_RATIO)
+
+    def num(arr, i, digits=4):
+        v = arr[i]
+        return None if np.isnan(v) or np.isinf(v) else round(float(v), digits)
+
+    trends = {}
+    for i, key in enumerate(keys):
+        trends[key] = {
+            "stars": int(stars[ends[i] - 1]),
+            "stars_per_day": num(rate, i, 2),
+            "growth_30d": num(growth, i),
+            "momentum": num(momentum, i, 2),
+            "acceleration": num(acceleration, i, 2),
+            "anomaly": "drop" if drop[i] else "spike" if spike[i] else None,
+            "tracked_days": int(last_day[i] - first_day[i]),
+            "tracked_growth": int(stars[ends[i] - 1] - stars[starts[i]]),
+        }
+    return trends
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Show star growth trends from data/star_history.json")
+    ap.add_argument("--history", default=HISTORY_PATH)
+    ap.add_argument("--top", type=int, default=15)
+    ap.add_argument("--repo", help="Show one repo (owner/repo)")
+    args = ap.parse_args()
+
+    history = StarHistory(args.history)
+    trends = compute_trends(history)
+    if not trends:
+        print(f"No history in {args.history}; it is appended by scripts/refresh_csv.py")
+        return
+    if args.repo:
+        key = args.repo.lower()
+        print(json.dumps({"samples": len(history.series.get(key, ([],))[0]), "trend": trends.get(key)}, indent=2))
+        return
+    ranked = sorted(trends.items(), key=lambda kv: kv[1]["stars_per_day"] or 0, reverse=True)
+    for key, t in ranked[:args.top]:
+        growth = f"{t['growth_30d'] * 100:+.1f}%" if t["growth_30d"] is not None else "   n/a"
+        flag = f"  [{t['anomaly']}]" if t["anomaly"] else ""
+        print(f"{t['stars']:>8}  {t['stars_per_day'] or 0:>8.1f}/day  {growth:>7}  {key}{flag}")
+
+
+if __name__ == "__main__":
+    main()
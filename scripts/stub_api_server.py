@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the GitHub REST API and the arXiv query API.
+
+Lets the network-bound maintenance scripts run offline (e.g. for benchmarking):
+- GET /repos/{owner}/{repo}, /repos/{owner}/{repo}/releases, /repos/{owner}/{repo}/commits
+- GET /api/query?id_list=... returns an arXiv Atom feed
+- Any other path returns a small HTML page (generic link targets) and honours
+  single-range Range requests; /missing/... is a 404, /nohead/... rejects
+  HEAD with 405 (like many real hosts), .../pdf/... is a 256 KiB PDF
+- GET /__stats returns request counters, POST /__reset clears them
+
+Latency, error rate and GitHub rate-limit headers are configurable. Point the
+scripts at it with GITHUB_API_URL / ARXIV_API_URL.
+
+Usage:
+  python scripts/stub_api_server.py --port 8765 --latency 0.05 --error-rate 0.02 --rate-limit 5000
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+ATOM_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">\n'
+    "  <title>ArXiv Query</title>\n"
+)
+
+
+PDF_SIZE = 256 * 1024  # body of /pdf/... links
+
+
+def _seed(text: str) -> int:
+    return int(hashlib.md5(text.encode("utf-8")).hexdigest()[:8], 16)
+
+
+class StubConfig:
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, rate_limit=5000,
+                 rate_window=3600, redirects=None, missing=None, seed=0):
+        self.latency = latency          # seconds added to every response
+        self.jitter = jitter            # extra uniform random latency in seconds
+        self.error_rate = error_rate    # fraction of requests answered with 502
+        self.rate_limit = rate_limit    # GitHub requests per window before 403s
+        self.rate_window = rate_window  # seconds until X-RateLimit-Reset
+        self.redirects = {k.lower(): v for k, v in (redirects or {}).items()}  # "owner/old" -> "owner/new"
+        self.missing = {k.lower() for k in (missing or [])}  # "owner/repo" answered with 404
+        self.seed = seed
+
+
+class StubStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.total = 0
+        self.by_route = {}
+        self.by_method = {}
+        self.errors = 0
+        self.rate_limited = 0
+        self.redirects = 0
+        self.retries = 0
+        self.bytes_sent = 0
+        self.seen = set()
+        self.window_start = time.time()
+        self.window_count = 0
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "total": self.total,
+                "by_route": dict(self.by_route),
+                "by_method": dict(self.by_method),
+                "errors": self.errors,
+                "rate_limited": self.rate_limited,
+                "redirects": self.redirects,
+                "retries": self.retries,
+                "bytes_sent": self.bytes_sent,
+            }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server_version = "StubAPI/1.0"
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; avoid Nagle/delayed-ACK stalls on keep-alive
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def handle(self):
+        try:
+            super().handle()
+        except ConnectionResetError:
+            pass  # clients may hang up right after the headers (link_probe.py's streamed GETs)
+
+    # -- dispatch ---------------------------------------------------------
+
+    def do_HEAD(self):
+        self._dispatch(head=True)
+
+    def do_GET(self):
+        self._dispatch(head=False)
+
+    def do_POST(self):
+        if urlparse(self.path).path == "/__reset":
+            self.server.stats.reset()
+            self._send(200, b"{}", "application/json", count=False)
+        else:
+            self._send(405, b"", "text/plain", count=False)
+
+    def _dispatch(self, head):
+        parsed = urlparse(self.path)
+        path = parsed.path.rstrip("/")
+        if path == "/__stats":
+            body = json.dumps(self.server.stats.snapshot()).encode("utf-8")
+            self._send(200, body, "application/json", count=False)
+            return
+
+        route = self._route(path)
+        self._record(route, head)
+        cfg = self.server.config
+        delay = cfg.latency + (self.server.rng.uniform(0, cfg.jitter) if cfg.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+
+        extra = {}
+        if route in ("repo", "releases", "commits"):
+            extra, limited = self._rate_limit_headers()
+            if limited:
+                with self.server.stats.lock:
+                    self.server.stats.rate_limited += 1
+                body = b'{"message": "API rate limit exceeded"}'
+                self._send(403, body, "application/json", extra, head)
+                return
+
+        if cfg.error_rate and self.server.rng.random() < cfg.error_rate:
+            with self.server.stats.lock:
+                self.server.stats.errors += 1
+            self._send(502, b'{"message": "Server Error"}', "application/json", extra, head)
+            return
+
+        if route == "arxiv":
+            self._send(200, self._arxiv_feed(parse_qs(parsed.query)), "application/atom+xml", extra, head)
+        elif route == "other":
+            self._page(path, extra, head)
+        else:
+            self._github(route, path, extra, head)
+
+    def _page(self, path, extra, head):
+        """Generic link target; a few path prefixes mimic awkward real-world hosts"""
+        if path.startswith("/missing/"):
+            self._send(404, b"<!doctype html><title>Not Found</title>", "text/html; charset=utf-8", extra, head)
+            return
+        if head and path.startswith("/nohead/"):
+            self._send(405, b"", "text/plain", dict(extra, Allow="GET"), head)
+            return
+        if "/pdf/" in path:
+            body, content_type = b"%PDF-1.4\n" + b"0" * (PDF_SIZE - 9), "application/pdf"
+        else:
+            body, content_type = b"<!doctype html><title>stub</title><p>ok</p>", "text/html; charset=utf-8"
+        m = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if m and int(m.group(1)) < len(body):
+            start = int(m.group(1))
+            end = min(int(m.group(2)) if m.group(2) else len(body) - 1, len(body) - 1)
+            headers = dict(extra, **{"Content-Range": f"bytes {start}-{end}/{len(body)}"})
+            self._send(206, body[start:end + 1], content_type, headers, head)
+            return
+        self._send(200, body, content_type, extra, head)
+
+    def _route(self, path):
+        parts = path.split("/")
+        if path == "/api/query":
+            return "arxiv"
+        if len(parts) >= 4 and parts[1] == "repos":
+            if len(parts) == 4:
+                return "repo"
+            if parts[4] in ("releases", "commits"):
+                return parts[4]
+        return "other"
+
+    def _record(self, route, head):
+        stats = self.server.stats
+        key = (self.command, self.path)
+        with stats.lock:
+            stats.total += 1
+            stats.by_route[route] = stats.by_route.get(route, 0) + 1
+            stats.by_method[self.command] = stats.by_method.get(self.command, 0) + 1
+            if key in stats.seen:
+                stats.retries += 1
+            else:
+                stats.seen.add(key)
+
+    def _rate_limit_headers(self):
+        cfg = self.server.config
+        stats = self.server.stats
+        with stats.lock:
+            now = time.time()
+            if now - stats.window_start >= cfg.rate_window:
+                stats.window_start = now
+                stats.window_count = 0
+            stats.window_count += 1
+            remaining = max(cfg.rate_limit - stats.window_count, 0)
+            reset = int(stats.window_start + cfg.rate_window)
+            used = min(stats.window_count, cfg.rate_limit)
+            limited = stats.window_count > cfg.rate_limit
+        headers = {
+            "X-RateLimit-Limit": str(cfg.rate_limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(reset),
+            "X-RateLimit-Used": str(used),
+        }
+        return headers, limited
+
+    # -- payloads ---------------------------------------------------------
+
+    def _github(self, route, path, extra, head):
+        parts = path.split("/")
+        owner, repo = parts[2], parts[3]
+        key = f"{owner}/{repo}".lower()
+        cfg = self.server.config
+        if key in cfg.redirects:
+            target = cfg.redirects[key]
+            tail = "/" + "/".join(parts[4:]) if len(parts) > 4 else ""
+            with self.server.stats.lock:
+                self.server.stats.redirects += 1
+            headers = dict(extra, Location=f"/repos/{target}{tail}")
+            self._send(301, b'{"message": "Moved Permanently"}', "application/json", headers, head)
+            return
+        if key in cfg.missing:
+            self._send(404, b'{"message": "Not Found"}', "application/json", extra, head)
+            return
+
+        seed = _seed(key) ^ cfg.seed
+        today = datetime.utcnow().replace(microsecond=0)
+        if route == "repo":
+            pushed = today - timedelta(days=seed % 400)
+            data = {
+                "full_name": f"{owner}/{repo}",
+                "name": repo,
+                "html_url": f"https://github.com/{owner}/{repo}",
+                "description": f"Stub repository {owner}/{repo}",
+                "stargazers_count": seed % 200000,
+                "forks_count": seed % 20000,
+                "archived": seed % 37 == 0,
+                "pushed_at": pushed.isoformat() + "Z",
+                "updated_at": pushed.isoformat() + "Z",
+            }
+        elif route == "releases":
+            data = []
+            for i in range(seed % 4):
+                published = today - timedelta(days=(seed >> i) % 30)
+                data.append({
+                    "tag_name": f"v{1 + i}.{seed % 10}.0",
+                    "name": f"Release {1 + i}",
+                    "published_at": published.isoformat() + "Z",
+                    "html_url": f"https://github.com/{owner}/{repo}/releases/tag/v{1 + i}",
+                })
+        else:
+            data = []
+            for i in range(10):
+                committed = today - timedelta(days=(seed >> i) % 20)
+                sha = hashlib.sha1(f"{key}-{i}".encode("utf-8")).hexdigest()
+                message = "Release v2.0 (major)" if i == 0 and seed % 3 == 0 else f"Fix issue #{seed % 1000 + i}"
+                data.append({
+                    "sha": sha,
+                    "html_url": f"https://github.com/{owner}/{repo}/commit/{sha}",
+                    "commit": {"message": message, "author": {"date": committed.isoformat() + "Z"}},
+                })
+        self._send(200, json.dumps(data).encode("utf-8"), "application/json", extra, head)
+
+    def _arxiv_feed(self, query):
+        ids = [i for i in ",".join(query.get("id_list", [""])).split(",") if i]
+        entries = []
+        for arxiv_id in ids:
+            seed = _seed(arxiv_id)
+            if seed % 50 == 0:
+                continue  # unknown paper
+            published = datetime(2023, 1, 1) + timedelta(days=seed % 900)
+            entries.append(
+                "  <entry>\n"
+                f"    <id>http://arxiv.org/abs/{arxiv_id}v1</id>\n"
+                f"    <published>{published.isoformat()}Z</published>\n"
+                f"    <updated>{published.isoformat()}Z</updated>\n"
+                f"    <title>Stub Paper {arxiv_id} on Language Agents</title>\n"
+                f"    <summary>Synthetic abstract for {arxiv_id}.</summary>\n"
+                f"    <author><name>Author {seed % 97}</name></author>\n"
+                f"    <author><name>Author {seed % 89}</name></author>\n"
+                '    <arxiv:primary_category term="cs.AI"/>\n'
+                '    <category term="cs.AI"/>\n'
+                '    <category term="cs.CL"/>\n'
+                "  </entry>\n"
+            )
+        if not entries:
+            return (ATOM_HEADER + "  <entry><title>Error</title><summary>No papers found</summary></entry>\n</feed>\n").encode("utf-8")
+        total = f"  <opensearch:totalResults xmlns:opensearch=\"http://a9.com/-/spec/opensearch/1.1/\">{len(entries)}</opensearch:totalResults>\n"
+        return (ATOM_HEADER + total + "".join(entries) + "</feed>\n").encode("utf-8")
+
+    def _send(self, status, body, content_type, headers=None, head=False, count=True):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+            if count:
+                with self.server.stats.lock:
+                    self.server.stats.bytes_sent += len(body)
+
+
+class StubAPIServer:
+    """Run the stub in a background thread; usable from other scripts."""
+
+    def __init__(self, host="127.0.0.1", port=0, config=None):
+        self.httpd = ThreadingHTTPServer((host, port), StubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.config = config or StubConfig()
+        self.httpd.stats = StubStats()
+        self.httpd.rng = random.Random(self.httpd.config.seed)
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def config(self):
+        return self.httpd.config
+
+    @property
+    def stats(self):
+        return self.httpd.stats
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Offline GitHub/arXiv API stub")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency", type=float, default=0.0, help="Fixed latency per request (seconds)")
+    ap.add_argument("--jitter", type=float, default=0.0, help="Extra random latency per request (seconds)")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 502")
+    ap.add_argument("--rate-limit", type=int, default=5000, help="GitHub requests allowed per window")
+    ap.add_argument("--rate-window", type=int, default=3600, help="Rate-limit window in seconds")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    config = StubConfig(args.latency, args.jitter, args.error_rate, args.rate_limit, args.rate_window, seed=args.seed)
+    server = StubAPIServer(args.host, args.port, config)
+    print(f"Stub API listening on {server.url}")
+    print(f"  export GITHUB_API_URL={server.url} ARXIV_API_URL={server.url}/api/query")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Rank-stability sweep over recommendation weight vectors.
+
+- Every requirement profile precomputed into compare/recommendations.json
+  (use case x experience x deployment x timeline x language x flags) is
+  scored once into its (component x framework) matrix by the engine's
+  compiled rules; the weights never touch that step
+- Thousands of weight vectors (random log-normal perturbations of the rule-set
+  weights, or an explicit JSON list) are then applied to all profiles at once
+  as a batched matrix product with NumPy, in profile chunks
+- For each weight vector and profile the top-k is compared with the top-k
+  under the rule-set weights: the report gives how often the #1 pick survives,
+  the mean top-k overlap, which profiles are most fragile, how each component's
+  weight correlates with stability, and how often each framework makes the top-k;
+  components with a zero weight (in the rule set or any candidate vector) have no
+  log-ratio and are reported as n/a rather than as an uncorrelated +0.000
+
+NumPy is required (imported lazily like star_history.py and similarity.py).
+
+Usage:
+  python scripts/weight_sweep.py --samples 2000
+  python scripts/weight_sweep.py --spread 0.5 --top-k 3 --json sweep.json
+  python scripts/weight_sweep.py --weights-file candidates.json   # [{"community": 0.2, ...}, ...]
+"""
+import argparse
+import itertools
+import json
+import math
+import time
+
+from recommend import FrameworkRecommendationEngine, requirements_from_profile
+from scoring_rules import COMPONENTS
+
+CHUNK_ELEMENTS = 20_000_000  # profile chunk size is chosen so a score block stays below this many floats
+
+
+def sweep_profiles():
+    """(profile dict, UserRequirements) for every profile in the precomputed recommendation matrix"""
+    from generate_catalog_json import recommendation_dims
+    dims = recommendation_dims()
+    defaults = {"budget": "medium", "team_size": 1}
+    out = []
+    for values in itertools.product(*(v for _, v in dims)):
+        profile = dict(zip((name for name, _ in dims), values))
+        out.append((profile, requirements_from_profile(profile, defaults)))
+    return out
+
+
+def sample_weights(base, samples, spread, seed):
+    """(samples, components) array: base weights x exp(N(0, spread)), renormalized to the base total"""
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    w = np.asarray(base) * np.exp(rng.normal(0.0, spread, size=(samples, len(base))))
+    return w * (sum(base) / w.sum(axis=1, keepdims=True))
+
+
+def _top_k(scores, k):
+    """Indices of the k best frameworks along axis 1 of a (profiles, frameworks, weights) block"""
+    import numpy as np
+    if k >= scores.shape[1]:
+        return np.argsort(-scores, axis=1, kind="stable")
+    return np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+
+def run_sweep(engine, profiles, weights, k=5):
+    """Stability statistics for `weights` (samples x components) against the engine's own weights"""
+    import numpy as np
+
+    base = np.array([engine.weights[c] for c in COMPONENTS])
+    n_fw, n_w = len(engine.frameworks), len(weights)
+    chunk = max(1, CHUNK_ELEMENTS // max(n_fw * n_w, 1))
+    top1_same = np.zeros((len(profiles), n_w), dtype=bool)
+    overlap = np.zeros((len(profiles), n_w), dtype=np.float32)
+    included = np.zeros(n_fw, dtype=np.int64)
+    base_included = np.zeros(n_fw, dtype=np.int64)
+    for lo in range(0, len(profiles), chunk):
+        block = profiles[lo:lo + chunk]
+        # (profiles, frameworks, components): cached component columns, stacked once per profile
+        m = np.stack([np.array(engine.kernel.matrix(req)).T for _, req in block])
+        base_scores = m @ base                                  # (profiles, frameworks)
+        scores = m @ weights.T                                  # (profiles, frameworks, weights)
+        base_best = base_scores.argmax(axis=1)
+        top1_same[lo:lo + len(block)] = scores.argmax(axis=1) == base_best[:, None]
+        base_top = _top_k(base_scores[:, :, None], k)[:, :, 0]  # (profiles, k)
+        member = np.zeros((len(block), n_fw), dtype=bool)
+        member[np.arange(len(block))[:, None], base_top] = True
+        top = _top_k(scores, k)                                 # (profiles, k, weights)
+        hits = np.take_along_axis(member[:, :, None], top, axis=1)
+        overlap[lo:lo + len(block)] = hits.sum(axis=1) / min(k, n_fw)
+        included += np.bincount(top.ravel(), minlength=n_fw)
+        base_included += np.bincount(base_top.ravel(), minlength=n_fw)
+
+    per_sample = overlap.mean(axis=0)
+    # log(w / base) is undefined where either side is zero: those components get no correlation (None)
+    positive = (base > 0) & (weights > 0).all(axis=0)
+    sensitivity = {}
+    for j, name in enumerate(COMPONENTS):
+        if not positive[j]:
+            sensitivity[name] = None
+            continue
+        x = np.log(weights[:, j] / base[j])
+        sensitivity[name] = float(np.corrcoef(x, per_sample)[0, 1]) if x.std() > 0 and per_sample.std() > 0 else 0.0
+    per_profile = overlap.mean(axis=1)
+    fragile = np.argsort(per_profile, kind="stable")[:10]
+    return {
+        "profiles": len(profiles),
+        "samples": n_w,
+        "top_k": k,
+        "top1_stability": float(top1_same.mean()),
+        "topk_overlap": float(overlap.mean()),
+        "sample_overlap_min": float(per_sample.min()),
+        "sensitivity": sensitivity,
+        "fragile_profiles": [{"profile": profiles[i][0], "topk_overlap": round(float(per_profile[i]), 4),
+                              "top1_stability": round(float(top1_same[i].mean()), 4)} for i in fragile],
+        "frameworks": sorted(({"name": fw.get("name", ""),
+                               "topk_rate": round(included[i] / (len(profiles) * n_w), 4),
+                               "baseline_topk_rate": round(base_included[i] / len(profiles), 4)}
+                              for i, fw in enumerate(engine.frameworks) if included[i] or base_included[i]),
+                             key=lambda x: -x["topk_rate"]),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Measure how stable recommendations are under weight changes")
+    ap.add_argument("--catalog", default="compare/catalog.json")
+    ap.add_argument("--samples", type=int, default=1000, help="Random weight vectors to evaluate")
+    ap.add_argument("--spread", type=float, default=0.3, help="Log-normal sigma of the weight perturbations")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--weights-file", help="JSON list of weight dicts to evaluate instead of random samples")
+    ap.add_argument("--top-k", type=int, default=5)
+    ap.add_argument("--json", help="Write the full report to this JSON file")
+    args = ap.parse_args()
+
+    import numpy as np
+
+    engine = FrameworkRecommendationEngine(args.catalog)
+    if args.weights_file:
+        with open(args.weights_file, encoding="utf-8") as f:
+            candidates = [engine.kernel.resolve_weights(w) for w in json.load(f)]
+        weights = np.array([[w[c] for c in COMPONENTS] for w in candidates])
+    else:
+        weights = sample_weights([engine.weights[c] for c in COMPONENTS], args.samples, args.spread, args.seed)
+
+    start = time.perf_counter()
+    profiles = sweep_profiles()
+    report = run_sweep(engine, profiles, weights, args.top_k)
+    elapsed = time.perf_counter() - start
+
+    print(f"{report['samples']} weight vectors x {report['profiles']} profiles x {len(engine.frameworks)} "
+          f"frameworks in {elapsed:.2f}s")
+    print(f"#1 pick unchanged:   {report['top1_stability']:.1%}")
+    print(f"top-{args.top_k} overlap:      {report['topk_overlap']:.1%} (worst weight vector {report['sample_overlap_min']:.1%})")
+    print("\nStability vs. raising each weight (correlation; negative = raising it reshuffles rankings):")
+    for name, corr in sorted(report["sensitivity"].items(), key=lambda x: (x[1] is None, x[1] or 0.0)):
+        if corr is None:
+            print(f"   {name:18}    n/a (zero weight)")
+        else:
+            print(f"   {name:18} {corr:+.3f}" if not math.isnan(corr) else f"   {name:18}    n/a")
+    print("\nMost weight-sensitive profiles:")
+    for item in report["fragile_profiles"][:5]:
+        p = item["profile"]
+        flags = ",".join(f for f in ("mcp", "computer_use", "enterprise") if p[f]) or "-"
+        print(f"   {item['topk_overlap']:.1%} overlap  {p['use_case']}/{p['experience']}/{p['deployment']}/"
+              f"{p['timeline']}/{p['language']} flags={flags}")
+    print("\nTop-k membership (sweep vs. rule-set weights):")
+    for fw in report["frameworks"][:10]:
+        print(f"   {fw['topk_rate']:6.1%}  {fw['baseline_topk_rate']:6.1%}  {fw['name']}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"weights": [dict(zip(COMPONENTS, w)) for w in weights.tolist()], **report}, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()